@@ -0,0 +1,70 @@
+#!/usr/bin/python
+#
+#   Benchmark of the cold-start cost of the IronBox DX clients, each module is imported
+#   in fresh interpreters and the median import time is reported along with the largest
+#   imported packages and whether the Azure storage SDK was loaded
+#
+#   Usage: python IronBoxDX_ImportTimeBenchmark.py [number of runs]
+#
+#   Revision History:
+#       10/16/2026      Initial release
+#
+import os
+import statistics
+import subprocess
+import sys
+
+# Modules to benchmark, the async client is skipped if aiohttp isn't installed
+benchmarkModules = ["ironboxdx.IronBoxDXRESTClient", "ironboxdx.AsyncIronBoxDXRESTClient"]
+numberOfRuns = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+numberOfTopImports = 8
+
+# Root of the repository, so the package is imported from this working copy
+repositoryPath = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+# Imports a module in a fresh interpreter, returns the import time in seconds, whether the
+# Azure storage SDK was loaded and the -X importtime report
+def importInFreshInterpreter(moduleName):
+    script = (
+        "import sys, time\n"
+        "start = time.perf_counter()\n"
+        "import {}\n"
+        "print(time.perf_counter() - start)\n"
+        "print(any(name.startswith('azure') for name in sys.modules))\n"
+    ).format(moduleName)
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", script], cwd=repositoryPath, capture_output=True, text=True, check=True)
+    importSeconds, azureLoaded = result.stdout.split()
+    return float(importSeconds), azureLoaded == "True", result.stderr
+
+# Returns the imports made directly by a module with the largest cumulative import time, from an
+# -X importtime report. The report lists the imports of a module before the module itself, each
+# nesting level indented by two more spaces
+def topImports(moduleName, importTimeReport):
+    directImports = []
+    for line in importTimeReport.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        selfTime, cumulativeTime, name = line[len("import time:"):].split("|")
+        if name.startswith("   ") and not name.startswith("    "):
+            directImports.append((name.strip(), int(cumulativeTime)))
+        elif not name.startswith("  "):
+            if name.strip() == moduleName:
+                return sorted(directImports, key=lambda item: item[1], reverse=True)[:numberOfTopImports]
+            directImports = []
+    return []
+
+def main():
+    for moduleName in benchmarkModules:
+        try:
+            timings = [importInFreshInterpreter(moduleName) for run in range(numberOfRuns)]
+        except subprocess.CalledProcessError as e:
+            print("%s: unable to import (%s)" % (moduleName, e.stderr.strip().splitlines()[-1]))
+            continue
+        importSeconds = [timing[0] for timing in timings]
+        print("%s: median %.1f ms, min %.1f ms, max %.1f ms over %i runs, Azure storage SDK loaded: %s" % (
+            moduleName, statistics.median(importSeconds) * 1000, min(importSeconds) * 1000, max(importSeconds) * 1000, numberOfRuns, timings[-1][1]))
+        for name, microseconds in topImports(moduleName, timings[-1][2]):
+            print("    %-40s %8.1f ms" % (name, microseconds / 1000))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,1065 @@
+#   IronBox DX asyncio REST Client
+#
+#   Dependencies
+#   ------------
+#       pip install -r requirements.txt
+#
+#   Revision History:
+#   -----------------
+#       10/16/2026  - v2.0: Initial release, asyncio variant of IronBoxDXRESTClient. Control-plane calls
+#                           run on a non-blocking aiohttp session with its own connection pool, data-plane
+#                           transfers run on the default executor of the running event loop,
+#                           file uploads and downloads are split into parallel blocks and ranges by BlockTransferEngine,
+#                           failed requests are retried following the RetryPolicy of the client,
+#                           resumable file uploads with a local block journal, streaming uploads, uploads from
+#                           in-memory buffers sliced into blocks without copying, streaming downloads, seekable
+#                           SSE blob reader, optional blob content cache under downloads to paths, optional cache of
+#                           read-only control-plane responses, identical concurrent read-only requests are coalesced,
+#                           data-plane HTTP sessions are kept warm per storage account, built-in pure-HTTP
+#                           data-plane backend selected with dataPlaneBackend="http", instrumentation hooks
+#                           around control-plane calls and data-plane block operations, optional metrics registry,
+#                           optional tracing of transfers as nested spans, spans follow executor calls,
+#                           throttled progress events with throughput and ETA sent to a user callback from a
+#                           background thread, messages go to the "ironboxdx" logger with lazy formatting and
+#                           truncated debug payloads, written to standard output with logToConsole=True,
+#                           bulk directory upload and container download run as coroutines, upload journal
+#                           and file system calls run on the executor. Requests and transfer planning are
+#                           shared with IronBoxDXRESTClient (IronBoxDXRequests.py, TransferPlanning.py)
+#
+#   Additional Information:
+#   -----------------------
+#       https://docs.aiohttp.org/en/stable/client.html
+#
+import asyncio
+import contextlib
+import contextvars
+import json
+import os
+
+import aiohttp
+
+from .BlockBlobBackends import (
+    BLOCK_BLOB_BACKENDS,
+    createBlockBlobBackend,
+    StorageSessionPool,
+)
+from .SSEBlobReader import (
+    SSEBlobReader,
+    DEFAULT_READER_BLOCK_SIZE_BYTES,
+    DEFAULT_READER_CACHE_BLOCKS,
+    DEFAULT_READER_READ_AHEAD_BLOCKS,
+)
+from .UploadJournal import (
+    UploadJournal,
+    UPLOAD_JOURNAL_SUFFIX,
+)
+from .Instrumentation import (
+    CONTROL_PLANE,
+    Instrumentation,
+    InstrumentedBlockBlobBackend,
+)
+
+from .Tracing import (
+    Tracer
+)
+from .ClientLogging import (
+    logger,
+    configureConsoleLogging,
+    DebugPayload,
+)
+from .ProgressReporter import (
+    ProgressReporter,
+    DISABLED_PROGRESS_REPORTER,
+    UPLOAD_DIRECTION,
+    DOWNLOAD_DIRECTION,
+    DEFAULT_PROGRESS_INTERVAL_SECONDS,
+)
+
+from .IronBoxDXRequests import (
+    ControlPlaneRouter,
+    parseResponseContent,
+    initializeSSEBlobRequest,
+    finalizeSSEBlobRequest,
+    listSSEContainerBlobsRequest,
+    deleteSSEContainerBlobRequest,
+    downloadSSEBlobRequest,
+    listStorageEndpointsRequest,
+    createSSEContainerRequest,
+    deleteSSEContainerRequest,
+    listSSEContainersRequest,
+    getContainerNotificationSettingsRequest,
+    setContainerNotificationSettingsRequest,
+    addUserToSSEContainerACLsRequest,
+    addCustomSecurityGroupToSSEContainerACLsRequest,
+    deleteSSEContainerACLRequest,
+    listSSEContainerACLsRequest,
+    readContainerMetaDataRequest,
+    setEntityOrganizationMembershipStatusRequest,
+    createOrganizationEntityRequest,
+    listOrganizationMemberEntitiesRequest,
+    readOrganizationMemberEntityMetadataRequest,
+    setContainerDataTtlRequest,
+    setContainerMetadataRequest,
+    createCustomSecurityGroupRequest,
+    deleteCustomSecurityGroupRequest,
+    updateCustomSecurityGroupRequest,
+    addMemberToCustomSecurityGroupRequest,
+    removeMemberFromCustomSecurityGroupRequest,
+    listCustomSecurityGroupsRequest,
+    readCustomSecurityGroupRequest,
+    readContainerLinkBasedAccessSettingsRequest,
+    setContainerLinkBasedAccessSettingsRequest,
+    addMemberToBuiltInSecurityGroupRequest,
+    removeMemberFromBuiltInSecurityGroupRequest,
+    readBuiltInSecurityGroupRequest,
+)
+from .TransferPlanning import (
+    ContainerDownloadPlan,
+    scanDirectory,
+    createUploadResult,
+    canResumeUpload,
+    transferAttributes,
+)
+from .AsyncSingleFlight import (
+    AsyncSingleFlight
+)
+from .RetryPolicy import (
+    IronBoxDXRequestError,
+    RetryPolicy,
+)
+from .BlockTransferEngine import (
+    BlockTransferEngine,
+    sliceBlocks,
+    DEFAULT_BLOCK_SIZE_BYTES,
+    DEFAULT_RANGE_SIZE_BYTES,
+    DEFAULT_MAX_WORKERS,
+)
+
+
+class AsyncIronBoxDXRESTClient():
+
+    def __init__(self, apiKeyPublicID, apiKeySecret, baseAPIUrl = "https://dx-api.ironbox.app/api/v2/", verifySSLCert = True, showDebugInfo = False, verbose = True, poolSize = 100, poolMaxPerHost = 100, keepAliveTimeout = 60, blockSizeBytes = DEFAULT_BLOCK_SIZE_BYTES, rangeSizeBytes = DEFAULT_RANGE_SIZE_BYTES, maxTransferWorkers = DEFAULT_MAX_WORKERS, retryPolicy = None, blobContentCache = None, responseCache = None, coalesceReads = True, dataPlaneBackend = "sdk", instrumentationHooks = None, metricsRegistry = None, tracer = None, progressCallback = None, progressIntervalSeconds = DEFAULT_PROGRESS_INTERVAL_SECONDS, logToConsole = False):
+        if dataPlaneBackend not in BLOCK_BLOB_BACKENDS:
+            raise ValueError("dataPlaneBackend must be one of {}".format(", ".join(BLOCK_BLOB_BACKENDS)))
+        self.__apiKeyPublicID = apiKeyPublicID          # Developer key public ID
+        self.__apiKeySecret = apiKeySecret              # Developer key secret
+        self.__baseAPIUrl = baseAPIUrl                  # The base IronBox API url
+        self.__verifySSLCert = verifySSLCert            # Indicates if SSL certificates should be validated, used primarily for dev environment
+        self.__showDebugInfo = showDebugInfo            # Shows debug information like REST body dummps
+        self.__verbose = verbose                        # Shows human friendly information
+        self.__poolSize = poolSize                      # Maximum number of simultaneous connections held by the session
+        self.__poolMaxPerHost = poolMaxPerHost          # Maximum number of simultaneous connections to a single host
+        self.__keepAliveTimeout = keepAliveTimeout      # Seconds an idle pooled connection is kept before it's discarded
+        self.__session = None                           # aiohttp session, created on first use inside the running event loop
+        self.__blockSizeBytes = blockSizeBytes          # Default size of the blocks staged by data-plane transfers
+        self.__rangeSizeBytes = rangeSizeBytes          # Default size of the byte ranges fetched by data-plane downloads
+        self.__maxTransferWorkers = maxTransferWorkers  # Default number of blocks or ranges transferred concurrently by a single transfer
+        self.__blobContentCache = blobContentCache      # Optional BlobContentCache serving repeated downloads to paths
+        self.__readSingleFlight = AsyncSingleFlight() if coalesceReads else None   # Coalesces identical concurrent read-only requests
+        self.__retryPolicy = retryPolicy if retryPolicy is not None else RetryPolicy()  # Retry policy and budget shared by control-plane and data-plane calls
+        self.__router = ControlPlaneRouter(self.__retryPolicy, responseCache)  # Response cache, coalescing and retry rules of control-plane calls
+        self.__storageSessions = StorageSessionPool(poolMaxPerAccount=max(poolMaxPerHost, maxTransferWorkers * 2))  # Warm data-plane sessions per storage account
+        self.__dataPlaneBackend = dataPlaneBackend      # Data-plane backend of transfers, "sdk" (azure-storage SDK) or "http" (built-in REST calls)
+        self.__tracer = tracer if tracer is not None else Tracer()     # Traces transfers as spans, off without exporters
+        hooks = list(instrumentationHooks or [])
+        if metricsRegistry is not None:
+            hooks.append(metricsRegistry)
+        if self.__tracer.enabled:
+            hooks.append(self.__tracer)
+        self.__instrumentation = Instrumentation(hooks) # Calls the hooks given, the metrics registry and the tracer around each request
+        self.__progressCallback = progressCallback      # Called with the ProgressEvent of transfers from a background thread, progress isn't tracked without it
+        self.__progressIntervalSeconds = progressIntervalSeconds   # Minimum time between two progress events
+        if logToConsole:
+            configureConsoleLogging(showDebugInfo)
+        return
+
+    #--------------------------------------------------------------------------
+    #   Lifecycle
+    #--------------------------------------------------------------------------
+    # Closes the pooled connections held by this client
+    async def close(self):
+        if self.__session is not None:
+            await self.__session.close()
+            self.__session = None
+        self.__storageSessions.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    #--------------------------------------------------------------------------
+    #   REST helpers
+    #--------------------------------------------------------------------------
+    # Returns the aiohttp session used for all control-plane calls, it must be
+    # created from within the event loop that will use it
+    def __getSession(self):
+        if self.__session is None:
+            connector = aiohttp.TCPConnector(
+                limit=self.__poolSize,
+                limit_per_host=self.__poolMaxPerHost,
+                keepalive_timeout=self.__keepAliveTimeout,
+                ssl=None if self.__verifySSLCert else False)
+            self.__session = aiohttp.ClientSession(
+                connector=connector,
+                headers={ "ironbox_apikey_publicid": self.__apiKeyPublicID, "ironbox_apikey_secret" : self.__apiKeySecret })
+        return self.__session
+
+    # Sends a control-plane request through the response cache, see
+    # IronBoxDXRESTClient.__sendPost
+    async def __sendPost(self, request):
+        hit, response, generation = self.__router.getCachedResponse(request)
+        if hit:
+            return response
+        if not self.__router.isReadOnly(request.route):
+            try:
+                response = await self.__postWithRetries(request)
+            finally:
+                self.__router.recordWrite(request)
+        elif self.__readSingleFlight is not None:
+            response = await self.__readSingleFlight.do(self.__router.getCoalescingKey(request), lambda: self.__postWithRetries(request))
+        else:
+            response = await self.__postWithRetries(request)
+        self.__router.putCachedResponse(request, response, generation)
+        return response
+
+    # Sends HTTP POST requests and returns the parsed JSON response, failed
+    # requests are retried as allowed by the retry policy, then raise an
+    # IronBoxDXRequestError with the error message of the request
+    # The body is serialized once up front, so its size is known to the
+    # instrumentation hooks and retries don't serialize it again
+    async def __postWithRetries(self, request):
+        route = request.route
+        body = json.dumps(request.body).encode("utf-8")
+        with self.__instrumentation.request(route, CONTROL_PLANE, len(body)) as event:
+            retryCount = 0
+            while True:
+                event.retryCount = retryCount
+                try:
+                    async with self.__getSession().post(self.__baseAPIUrl + route, data=body, headers={ "Content-Type" : "application/json" }) as response:
+                        content = await response.read()
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    # A connection error means the request never reached the server so it's safe to send again
+                    retryDelay = self.__router.getRetryDelay(request, retryCount, notSent=isinstance(e, aiohttp.ClientConnectorError))
+                    if retryDelay is None:
+                        raise IronBoxDXRequestError(request.errorMessage, route, None, retryCount) from e
+                else:
+                    event.statusCode = response.status
+                    event.responseBytes = len(content)
+                    if self.__showDebugInfo:
+                        logger.debug("%s returned %s: %s", route, response.status, DebugPayload(content))
+                    if response.status == 200:
+                        self.__router.recordCompletion()
+                        return parseResponseContent(content)
+                    retryDelay = self.__router.getRetryDelay(request, retryCount, response.status, response.headers.get("Retry-After"))
+                    if retryDelay is None:
+                        self.__router.recordCompletion()
+                        raise IronBoxDXRequestError(request.errorMessage, route, response.status, retryCount)
+                self.__log("Retrying %s in %.1f seconds", route, retryDelay)
+                await asyncio.sleep(retryDelay)
+                retryCount += 1
+
+    # Logs an object at DEBUG level, serialized and truncated only if the
+    # message is emitted
+    def __debugObject(self, obj):
+        if self.__showDebugInfo is True:
+            logger.debug("%s", DebugPayload(obj))
+        return
+
+    # Logs some information at INFO level, the message is formatted with args
+    # only if it's emitted
+    def __log(self, message, *args):
+        if self.__verbose:
+            logger.info(message, *args)
+
+    # Creates the progress reporter of a transfer job, the shared disabled
+    # reporter when the client has no progress callback
+    def __createProgressReporter(self):
+        if self.__progressCallback is None:
+            return DISABLED_PROGRESS_REPORTER
+        return ProgressReporter(self.__progressCallback, self.__progressIntervalSeconds)
+
+    # Async context manager of the progress reporter of a transfer job run by
+    # coroutines, it's closed from the executor since closing waits for the
+    # reporting thread and sends the final event
+    @contextlib.asynccontextmanager
+    async def __openProgressReporter(self):
+        progress = self.__createProgressReporter()
+        try:
+            yield progress
+        finally:
+            if progress.enabled:
+                await self.__runBlocking(progress.close)
+
+    # Context manager reporting a single transfer run by the executor as a job
+    # of its own, yields the progress callback to give to the transfer engine,
+    # None when progress isn't reported. The callback is called from a
+    # background thread, use loop.call_soon_threadsafe from it to reach the
+    # event loop
+    @contextlib.contextmanager
+    def __reportTransfer(self, name, direction, totalBytes = None):
+        with self.__createProgressReporter() as progress, progress.transfer(name, direction, totalBytes) as transfer:
+            yield transfer
+
+    # Creates the data-plane backend of the blob described by an initialize or
+    # download response
+    def __createBackend(self, sasResponse):
+        backend = createBlockBlobBackend(sasResponse, self.__retryPolicy, self.__storageSessions, self.__dataPlaneBackend)
+        if self.__instrumentation.enabled:
+            backend = InstrumentedBlockBlobBackend(backend, self.__instrumentation)
+        return backend
+
+    # Creates a transfer engine from the client defaults and optional per-call overrides
+    def __createTransferEngine(self, blockSizeBytes = None, maxWorkers = None, rangeSizeBytes = None):
+        return BlockTransferEngine(
+            blockSizeBytes=blockSizeBytes if blockSizeBytes is not None else self.__blockSizeBytes,
+            maxWorkers=maxWorkers if maxWorkers is not None else self.__maxTransferWorkers,
+            rangeSizeBytes=rangeSizeBytes if rangeSizeBytes is not None else self.__rangeSizeBytes)
+
+    # Runs a blocking data-plane call on the default executor of the running
+    # loop, in a copy of the caller's context so the current span follows it
+    async def __runBlocking(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(None, contextvars.copy_context().run, func, *args)
+
+    #--------------------------------------------------------------------------
+    #   Initializes an SSE container blob to IronBox DX
+    #--------------------------------------------------------------------------
+    async def __initializeBlobToSSEContainer(self, containerPublicID, blobName, blobDescription = "", containerAccessPassword = ""):
+        self.__log("Initializing server-side encrypted blob")
+        with self.__tracer.span("initialize", attributes={ "ironboxdx.container_public_id" : containerPublicID, "ironboxdx.blob_name" : blobName }) as span:
+            request = initializeSSEBlobRequest(containerPublicID, blobName, blobDescription, containerAccessPassword)
+            initResponse = await self.__sendPost(request)
+            if not initResponse:
+                raise IronBoxDXRequestError("Initialize SSE blob returned an invalid response", request.route, 200)
+            span.setAttribute("ironboxdx.blob_public_id", initResponse["blobPublicID"])
+        return initResponse
+
+    #--------------------------------------------------------------------------
+    #   Finalize an SSE container blob on IronBox DX
+    #--------------------------------------------------------------------------
+    async def __finalizeBlobInSSEContainer(self, finalizeToken, blobPublicID, blobSizeBytes):
+        self.__log("Finalizing server-side encrypted blob")
+        with self.__tracer.span("finalize", attributes={ "ironboxdx.blob_public_id" : blobPublicID, "ironboxdx.blob_size_bytes" : blobSizeBytes }):
+            finalizeResponse = await self.__sendPost(finalizeSSEBlobRequest(finalizeToken, blobPublicID, blobSizeBytes))
+        # Current implementation returns empty response on finalize, so finalizeResponse will be None
+        return finalizeResponse
+
+    #--------------------------------------------------------------------------
+    #   Retrieves the storage endpoints that the user has access to
+    #--------------------------------------------------------------------------
+    async def listStorageEndpointsForUser(self):
+        self.__log("Retrieving the list of storage endpoints that the current user has access to")
+        return await self.__sendPost(listStorageEndpointsRequest())
+
+    #--------------------------------------------------------------------------
+    #   Create a SSE container
+    #--------------------------------------------------------------------------
+    async def createSSEContainer(self, name, storageEndpointPublicID, description="", anonymousAccessEnabled=False, anonymousAccessPassword="", humanReadableID=""):
+        self.__log("Creating server-side encrypted container")
+        return await self.__sendPost(createSSEContainerRequest(name, storageEndpointPublicID, description, anonymousAccessEnabled, anonymousAccessPassword, humanReadableID))
+
+    #--------------------------------------------------------------------------
+    #   Delete a SSE container
+    #--------------------------------------------------------------------------
+    async def deleteSSEContainer(self, containerPublicID):
+        self.__log("Deleting server-side encrypted container")
+        return await self.__sendPost(deleteSSEContainerRequest(containerPublicID))
+
+    #--------------------------------------------------------------------------
+    #   Get list of SSE containers
+    #--------------------------------------------------------------------------
+    async def listSSEContainers(self, includeContainersQueuedForDelete = False):
+        return await self.__sendPost(listSSEContainersRequest(includeContainersQueuedForDelete))
+
+    #--------------------------------------------------------------------------
+    #   Get list of blobs in an SSE container
+    #
+    #   State table:
+    #       0 = Waiting for upload
+    #       1 = Ready
+    #--------------------------------------------------------------------------
+    async def listSSEContainerBlobs(self, containerPublicID, skipPastNumItems = 0, takeNumItems = 500, state = 1):
+        self.__log("Listing server-side encrypted blobs")
+        return await self.__sendPost(listSSEContainerBlobsRequest(containerPublicID, skipPastNumItems, takeNumItems, state))
+
+    #--------------------------------------------------------------------------
+    #   Iterates over every blob in an SSE container, one page of pageSize
+    #   blobs is held at a time and the next page is fetched in the background
+    #   while the current one is being consumed
+    #
+    #   Pages are addressed by offset, blobs deleted during the iteration can
+    #   shift later blobs into pages that have already been read
+    #--------------------------------------------------------------------------
+    async def iterateSSEContainerBlobs(self, containerPublicID, pageSize = 500, state = 1):
+        if pageSize <= 0:
+            raise ValueError("pageSize must be greater than zero")
+        skipPastNumItems = 0
+        nextPage = asyncio.ensure_future(self.listSSEContainerBlobs(containerPublicID, skipPastNumItems, pageSize, state))
+        try:
+            while nextPage is not None:
+                blobs = (await nextPage)["blobs"]
+                skipPastNumItems += len(blobs)
+                nextPage = None
+                if len(blobs) >= pageSize:
+                    nextPage = asyncio.ensure_future(self.listSSEContainerBlobs(containerPublicID, skipPastNumItems, pageSize, state))
+                for blob in blobs:
+                    yield blob
+        finally:
+            if nextPage is not None:
+                nextPage.cancel()
+
+    #--------------------------------------------------------------------------
+    #   Deletes a SSE container blob
+    #--------------------------------------------------------------------------
+    async def deleteSSEContainerBlob(self, blobPublicID):
+        self.__log("Deleting server-side encrypted blob")
+        await self.__sendPost(deleteSSEContainerBlobRequest(blobPublicID))
+        self.__log("Delete complete")
+
+    #--------------------------------------------------------------------------
+    #   Downloads a specified SSE blob to a given destination path
+    #
+    #   When the client has a blob content cache, blobs already in the cache
+    #   are placed at the destination without being fetched again
+    #--------------------------------------------------------------------------
+    async def downloadSSEContainerBlobToPath(self, blobPublicID, destinationFilePath, rangeSizeBytes = None, maxWorkers = None):
+        self.__log("Downloading server-side encrypted blob with publicID = %s", blobPublicID)
+        with self.__tracer.span("downloadBlobToPath", attributes={ "ironboxdx.blob_public_id" : blobPublicID }) as operationSpan:
+            downloadResponse = await self.__requestBlobDownload(blobPublicID)
+            engine = self.__createTransferEngine(maxWorkers=maxWorkers, rangeSizeBytes=rangeSizeBytes)
+
+            def download(filePath):
+                backend = self.__createBackend(downloadResponse)
+                with self.__tracer.span("download") as span, self.__reportTransfer(blobPublicID, DOWNLOAD_DIRECTION) as transfer:
+                    downloadedBytes = engine.downloadToFile(
+                        backend=backend,
+                        filePath=filePath,
+                        progressCallback=transfer)
+                    span.setAttributes(transferAttributes(backend, downloadedBytes, engine.rangeSizeBytes, "range"))
+
+            if self.__blobContentCache is None:
+                await self.__runBlocking(download, destinationFilePath)
+            elif await self.__runBlocking(self.__blobContentCache.fetch, blobPublicID, destinationFilePath, download):
+                operationSpan.setAttribute("ironboxdx.cache_hit", True)
+                self.__log("Served from the blob content cache")
+        self.__log("Download complete")
+
+    #--------------------------------------------------------------------------
+    #   Downloads a specified SSE blob into a writable stream, returns the
+    #   number of bytes written
+    #
+    #   The stream is written from the executor, so it must be a blocking
+    #   stream, see IronBoxDXRESTClient.downloadSSEContainerBlobToStream
+    #--------------------------------------------------------------------------
+    async def downloadSSEContainerBlobToStream(self, blobPublicID, destinationStream, rangeSizeBytes = None, maxWorkers = None):
+        self.__log("Downloading server-side encrypted blob with publicID = %s", blobPublicID)
+        with self.__tracer.span("downloadBlobToStream", attributes={ "ironboxdx.blob_public_id" : blobPublicID }):
+            downloadResponse = await self.__requestBlobDownload(blobPublicID)
+            engine = self.__createTransferEngine(maxWorkers=maxWorkers, rangeSizeBytes=rangeSizeBytes)
+
+            def download():
+                backend = self.__createBackend(downloadResponse)
+                with self.__tracer.span("download") as span, self.__reportTransfer(blobPublicID, DOWNLOAD_DIRECTION) as transfer:
+                    downloadedBytes = engine.downloadToStream(
+                        backend=backend,
+                        stream=destinationStream,
+                        progressCallback=transfer)
+                    span.setAttributes(transferAttributes(backend, downloadedBytes, engine.rangeSizeBytes, "range"))
+                return downloadedBytes
+
+            downloadedBytes = await self.__runBlocking(download)
+        self.__log("Download complete")
+        return downloadedBytes
+
+    #--------------------------------------------------------------------------
+    #   Downloads a specified SSE blob into a writable buffer at least as
+    #   large as the blob, returns the number of bytes written
+    #--------------------------------------------------------------------------
+    async def downloadSSEContainerBlobIntoBuffer(self, blobPublicID, destinationBuffer, rangeSizeBytes = None, maxWorkers = None):
+        self.__log("Downloading server-side encrypted blob with publicID = %s", blobPublicID)
+        with self.__tracer.span("downloadBlobIntoBuffer", attributes={ "ironboxdx.blob_public_id" : blobPublicID }):
+            downloadResponse = await self.__requestBlobDownload(blobPublicID)
+            engine = self.__createTransferEngine(maxWorkers=maxWorkers, rangeSizeBytes=rangeSizeBytes)
+
+            def download():
+                backend = self.__createBackend(downloadResponse)
+                with self.__tracer.span("download") as span, self.__reportTransfer(blobPublicID, DOWNLOAD_DIRECTION) as transfer:
+                    downloadedBytes = engine.downloadIntoBuffer(
+                        backend=backend,
+                        buffer=destinationBuffer,
+                        progressCallback=transfer)
+                    span.setAttributes(transferAttributes(backend, downloadedBytes, engine.rangeSizeBytes, "range"))
+                return downloadedBytes
+
+            downloadedBytes = await self.__runBlocking(download)
+        self.__log("Download complete")
+        return downloadedBytes
+
+    #--------------------------------------------------------------------------
+    #   Asynchronous generator of the contents of a specified SSE blob, yields
+    #   chunks of chunkSizeBytes in order as they arrive
+    #
+    #   Up to maxWorkers chunks are fetched ahead of the consumer by the
+    #   transfer engine, the event loop only waits for the next chunk
+    #--------------------------------------------------------------------------
+    async def iterateSSEContainerBlobChunks(self, blobPublicID, chunkSizeBytes = None, maxWorkers = None):
+        self.__log("Downloading server-side encrypted blob with publicID = %s", blobPublicID)
+        downloadResponse = await self.__requestBlobDownload(blobPublicID)
+        engine = self.__createTransferEngine(maxWorkers=maxWorkers, rangeSizeBytes=chunkSizeBytes)
+        chunks = engine.downloadChunks(self.__createBackend(downloadResponse))
+        try:
+            while True:
+                chunk = await self.__runBlocking(next, chunks, None)
+                if chunk is None:
+                    return
+                yield chunk
+        finally:
+            await self.__runBlocking(chunks.close)
+
+    #--------------------------------------------------------------------------
+    #   Opens a specified SSE blob as a read-only, seekable binary file object
+    #   (SSEBlobReader), see IronBoxDXRESTClient.openSSEContainerBlob
+    #
+    #   Reads on the returned object block, run them in the executor from
+    #   coroutines
+    #--------------------------------------------------------------------------
+    async def openSSEContainerBlob(self, blobPublicID, blockSizeBytes = DEFAULT_READER_BLOCK_SIZE_BYTES, cacheBlocks = DEFAULT_READER_CACHE_BLOCKS, readAheadBlocks = DEFAULT_READER_READ_AHEAD_BLOCKS):
+        self.__log("Opening server-side encrypted blob with publicID = %s", blobPublicID)
+        downloadResponse = await self.__requestBlobDownload(blobPublicID)
+
+        def openReader():
+            return SSEBlobReader(
+                backend=self.__createBackend(downloadResponse),
+                blockSizeBytes=blockSizeBytes,
+                cacheBlocks=cacheBlocks,
+                readAheadBlocks=readAheadBlocks)
+
+        return await self.__runBlocking(openReader)
+
+    # Requests the shared access signature needed to download an SSE blob
+    async def __requestBlobDownload(self, blobPublicID):
+        with self.__tracer.span("requestDownload", attributes={ "ironboxdx.blob_public_id" : blobPublicID }):
+            downloadResponse = await self.__sendPost(downloadSSEBlobRequest(blobPublicID))
+        return downloadResponse
+
+    #--------------------------------------------------------------------------
+    #   Downloads every ready blob of an SSE container into a local directory,
+    #   returns a report with one entry per blob, see
+    #   IronBoxDXRESTClient.downloadSSEContainerToDirectory
+    #
+    #   Up to maxWorkers blobs are in flight at once, each one a coroutine
+    #   requesting its download shared access signature then fetching its byte
+    #   ranges with rangeWorkersPerBlob threads of the executor
+    #--------------------------------------------------------------------------
+    async def downloadSSEContainerToDirectory(self, containerPublicID, destinationFolderPath, manifestFilePath = None, maxWorkers = None, rangeWorkersPerBlob = 1, rangeSizeBytes = None):
+        self.__log("Downloading server-side encrypted container with public ID [%s] to [%s]", containerPublicID, destinationFolderPath)
+        engine = self.__createTransferEngine(maxWorkers=rangeWorkersPerBlob, rangeSizeBytes=rangeSizeBytes)
+        slots = asyncio.Semaphore(maxWorkers if maxWorkers is not None else self.__maxTransferWorkers)
+        plan = ContainerDownloadPlan(destinationFolderPath, manifestFilePath)
+        report = []
+        downloads = []
+
+        def download(downloadResponse, result, transfer):
+            partialFilePath = plan.preparePartialFile(result)
+            backend = self.__createBackend(downloadResponse)
+            result["sizeBytes"] = engine.downloadToFile(
+                backend=backend,
+                filePath=partialFilePath,
+                progressCallback=transfer)
+            plan.completeBlob(result)
+            return backend
+
+        async def downloadBlob(blob, result):
+            try:
+                with progress.transfer(blob["blobName"], DOWNLOAD_DIRECTION, planned=True) as transfer, \
+                        self.__tracer.span("downloadBlob", attributes={ "ironboxdx.blob_public_id" : blob["blobPublicID"] }) as span:
+                    downloadResponse = await self.__requestBlobDownload(blob["blobPublicID"])
+                    backend = await self.__runBlocking(download, downloadResponse, result, transfer)
+                    span.setAttributes(transferAttributes(backend, result["sizeBytes"], engine.rangeSizeBytes, "range"))
+                result["succeeded"] = True
+            except Exception as e:
+                result["error"] = e
+                self.__log("Unable to download blob with publicID = %s: %s", blob["blobPublicID"], e)
+                await self.__runBlocking(plan.discardBlob, result)
+            finally:
+                slots.release()
+
+        # The blobs are planned as they are listed, a slot is taken before a blob starts so listing stops
+        # while maxWorkers blobs are in flight
+        with self.__tracer.span("downloadContainerToDirectory", attributes={ "ironboxdx.container_public_id" : containerPublicID }):
+            async with self.__openProgressReporter() as progress:
+                await self.__runBlocking(plan.open)
+                try:
+                    async for blob in self.iterateSSEContainerBlobs(containerPublicID):
+                        result = plan.planBlob(blob)
+                        report.append(result)
+                        if result["skipped"]:
+                            continue
+                        progress.planTransfer()
+                        await slots.acquire()
+                        downloads.append(asyncio.ensure_future(downloadBlob(blob, result)))
+                finally:
+                    try:
+                        await asyncio.gather(*downloads)
+                    finally:
+                        await self.__runBlocking(plan.close)
+
+        self.__log("Container download complete, %s of %s blobs downloaded, %s already downloaded",
+            sum(1 for result in report if result["succeeded"] and not result["skipped"]),
+            len(report),
+            sum(1 for result in report if result["skipped"]))
+        return report
+
+    #--------------------------------------------------------------------------
+    #   Initializes, uploads and finalizes a single file path as an SSE blob,
+    #   returns the public ID of the blob and the number of bytes uploaded,
+    #   see IronBoxDXRESTClient.__uploadFileToSSEContainer
+    #
+    #   The journal reads and writes the file system, its calls run on the
+    #   executor like the transfer so the event loop isn't blocked
+    #--------------------------------------------------------------------------
+    async def __uploadFileToSSEContainer(self, containerPublicID, blobName, sourceFilePath, blobDescription, containerAccessPassword, engine, progressCallback = None, journalFilePath = None):
+        with self.__tracer.span("uploadFile", attributes={ "ironboxdx.container_public_id" : containerPublicID, "ironboxdx.blob_name" : blobName, "ironboxdx.resumable" : journalFilePath is not None }):
+            journal = None
+            resuming = False
+            if journalFilePath is not None:
+                journal = await self.__runBlocking(UploadJournal, journalFilePath, containerPublicID, blobName, sourceFilePath, engine.blockSizeBytes)
+                resuming = await self.__runBlocking(journal.load) and canResumeUpload(journal.initResponse)
+            try:
+                if resuming:
+                    initResponse = journal.initResponse
+                    self.__log("Resuming upload of server-side encrypted blob with public ID [%s]", initResponse['blobPublicID'])
+                    await self.__runBlocking(journal.reopen)
+                else:
+                    if (journal is not None) and (journal.initResponse is not None):
+                        await self.__discardJournaledBlob(journal.initResponse)
+
+                    # Initialize an SSE blob
+                    initResponse = await self.__initializeBlobToSSEContainer(containerPublicID=containerPublicID, blobName=blobName, blobDescription=blobDescription, containerAccessPassword=containerAccessPassword)
+                    if journal is not None:
+                        await self.__runBlocking(journal.start, initResponse)
+
+                # Upload the contents to storage backend from the executor so the event loop isn't blocked
+                def upload():
+                    backend = self.__createBackend(initResponse)
+                    stagedBlockIds = None
+                    if resuming:
+                        # Only blocks the storage service still holds are skipped, uncommitted blocks expire
+                        uncommittedBlocks = backend.getUncommittedBlocks()
+                        stagedBlockIds = set(blockId for blockId in journal.stagedBlockIds if blockId in uncommittedBlocks)
+                        self.__log("%s blocks already staged", len(stagedBlockIds))
+                    totalBytes = journal.source["sourceSizeBytes"] if journal is not None else os.path.getsize(sourceFilePath)
+                    with self.__tracer.span("upload") as span:
+                        uploadedBytes = engine.uploadFile(
+                            backend=backend,
+                            filePath=sourceFilePath,
+                            totalBytes=totalBytes,
+                            progressCallback=progressCallback,
+                            stagedBlockIds=stagedBlockIds,
+                            onBlockStaged=journal.recordBlockStaged if journal is not None else None)
+                        span.setAttributes(transferAttributes(backend, uploadedBytes, engine.blockSizeForBlob(totalBytes), "block"))
+                        span.setAttribute("ironboxdx.resumed_block_count", len(stagedBlockIds) if stagedBlockIds is not None else 0)
+                    if journal is not None:
+                        journal.recordCommitted(uploadedBytes)
+                    return uploadedBytes
+
+                if resuming and (journal.committedBytes is not None):
+                    uploadedBytes = journal.committedBytes
+                else:
+                    self.__log("Uploading contents to cloud storage")
+                    uploadedBytes = await self.__runBlocking(upload)
+
+                # Signal that the upload is completed with the number of bytes actually staged
+                await self.__finalizeBlobInSSEContainer(
+                    finalizeToken=initResponse['finalizeToken'],
+                    blobPublicID=initResponse['blobPublicID'],
+                    blobSizeBytes=uploadedBytes
+                )
+                if journal is not None:
+                    await self.__runBlocking(journal.delete)
+            finally:
+                if journal is not None:
+                    await self.__runBlocking(journal.close)
+        return initResponse['blobPublicID'], uploadedBytes
+
+    # Deletes the blob initialized by a journal that can't be resumed, so it
+    # isn't left waiting for an upload that will never come
+    async def __discardJournaledBlob(self, initResponse):
+        self.__log("Upload journal can't be resumed, starting over")
+        try:
+            await self.deleteSSEContainerBlob(initResponse['blobPublicID'])
+        except IronBoxDXRequestError as e:
+            self.__log("Unable to delete the blob of the previous attempt: %s", e)
+
+    #--------------------------------------------------------------------------
+    #   Uploads a specified file path as a blob to a server-side encrypted
+    #   IronBox DX container
+    #
+    #   A resumable upload records its progress in a journal file, by default
+    #   the source file path followed by UPLOAD_JOURNAL_SUFFIX, see
+    #   IronBoxDXRESTClient.uploadBlobToSSEContainerFromPath
+    #--------------------------------------------------------------------------
+    async def uploadBlobToSSEContainerFromPath(self, containerPublicID, blobName, sourceFilePath, blobDescription = "", containerAccessPassword = "", blockSizeBytes = None, maxWorkers = None, resumable = False, journalFilePath = None):
+        self.__log("Uploading [%s] to server-side encrypted container with public ID [%s] as blob with name [%s]", sourceFilePath, containerPublicID, blobName)
+        async with self.__openProgressReporter() as progress:
+            with progress.transfer(blobName, UPLOAD_DIRECTION) as transfer:
+                await self.__uploadFileToSSEContainer(
+                    containerPublicID=containerPublicID,
+                    blobName=blobName,
+                    sourceFilePath=sourceFilePath,
+                    blobDescription=blobDescription,
+                    containerAccessPassword=containerAccessPassword,
+                    engine=self.__createTransferEngine(blockSizeBytes, maxWorkers),
+                    progressCallback=transfer,
+                    journalFilePath=(journalFilePath if journalFilePath is not None else sourceFilePath + UPLOAD_JOURNAL_SUFFIX) if resumable else None)
+        self.__log("Upload complete")
+
+    #--------------------------------------------------------------------------
+    #   Uploads every file under a directory as blobs to a server-side
+    #   encrypted IronBox DX container, returns a report with one entry per
+    #   file, see IronBoxDXRESTClient.uploadDirectoryToSSEContainer
+    #
+    #   Up to maxWorkers files are in flight at once, each one a coroutine
+    #   running its initialize, upload and finalize chain
+    #--------------------------------------------------------------------------
+    async def uploadDirectoryToSSEContainer(self, containerPublicID, sourceDirectoryPath, recursive = True, blobDescription = "", containerAccessPassword = "", maxWorkers = None, blockWorkersPerFile = 1, blockSizeBytes = None):
+        self.__log("Uploading directory [%s] to server-side encrypted container with public ID [%s]", sourceDirectoryPath, containerPublicID)
+        engine = self.__createTransferEngine(blockSizeBytes, blockWorkersPerFile)
+        slots = asyncio.Semaphore(maxWorkers if maxWorkers is not None else self.__maxTransferWorkers)
+
+        async def uploadFile(sourceFilePath, blobName, sizeBytes):
+            result = createUploadResult(sourceFilePath, blobName)
+            async with slots:
+                try:
+                    with progress.transfer(blobName, UPLOAD_DIRECTION, sizeBytes, planned=True) as transfer:
+                        result["blobPublicID"], result["sizeBytes"] = await self.__uploadFileToSSEContainer(
+                            containerPublicID=containerPublicID,
+                            blobName=blobName,
+                            sourceFilePath=sourceFilePath,
+                            blobDescription=blobDescription,
+                            containerAccessPassword=containerAccessPassword,
+                            engine=engine,
+                            progressCallback=transfer)
+                    result["succeeded"] = True
+                except Exception as e:
+                    result["error"] = e
+                    self.__log("Unable to upload [%s]: %s", sourceFilePath, e)
+            return result
+
+        # Every file is planned before the first one starts so the size and ETA of the job cover the whole directory
+        with self.__tracer.span("uploadDirectory", attributes={ "ironboxdx.container_public_id" : containerPublicID }):
+            async with self.__openProgressReporter() as progress:
+                sourceFiles = await self.__runBlocking(scanDirectory, sourceDirectoryPath, recursive)
+                for sourceFilePath, blobName, sizeBytes in sourceFiles:
+                    progress.planTransfer(sizeBytes)
+                report = list(await asyncio.gather(*(uploadFile(sourceFilePath, blobName, sizeBytes) for sourceFilePath, blobName, sizeBytes in sourceFiles)))
+
+        self.__log("Directory upload complete, %s of %s files uploaded", sum(1 for result in report if result["succeeded"]), len(report))
+        return report
+
+    #--------------------------------------------------------------------------
+    #   Uploads a specified text string as a blob to a server-side encrypted
+    #   IronBox DX container
+    #--------------------------------------------------------------------------
+    async def uploadBlobToSSEContainerFromText(self, containerPublicID, blobName, sourceText, encoding = "utf-8",  blobDescription = "", containerAccessPassword = ""):
+        self.__log("Uploading text to server-side encrypted container with public ID [%s] as blob with name [%s]", containerPublicID, blobName)
+        await self.__uploadBytesToSSEContainer(
+            containerPublicID=containerPublicID,
+            blobName=blobName,
+            sourceBytes=sourceText.encode(encoding),
+            blobDescription=blobDescription,
+            containerAccessPassword=containerAccessPassword,
+            engine=self.__createTransferEngine())
+        self.__log("Upload complete")
+
+    #--------------------------------------------------------------------------
+    #   Uploads in-memory binary data as a blob to a server-side encrypted
+    #   IronBox DX container, returns the public ID of the blob
+    #
+    #   sourceBytes is any object supporting the buffer protocol, it's sliced
+    #   into blocks with memoryview so the payload isn't copied. It must not be
+    #   modified until the upload completes
+    #--------------------------------------------------------------------------
+    async def uploadBlobToSSEContainerFromBytes(self, containerPublicID, blobName, sourceBytes, blobDescription = "", containerAccessPassword = "", blockSizeBytes = None, maxWorkers = None):
+        self.__log("Uploading bytes to server-side encrypted container with public ID [%s] as blob with name [%s]", containerPublicID, blobName)
+        blobPublicID = await self.__uploadBytesToSSEContainer(
+            containerPublicID=containerPublicID,
+            blobName=blobName,
+            sourceBytes=sourceBytes,
+            blobDescription=blobDescription,
+            containerAccessPassword=containerAccessPassword,
+            engine=self.__createTransferEngine(blockSizeBytes, maxWorkers))
+        self.__log("Upload complete")
+        return blobPublicID
+
+    # Initializes, uploads and finalizes in-memory data as an SSE blob, returns
+    # the public ID of the blob
+    async def __uploadBytesToSSEContainer(self, containerPublicID, blobName, sourceBytes, blobDescription, containerAccessPassword, engine):
+
+        with self.__tracer.span("uploadBytes", attributes={ "ironboxdx.container_public_id" : containerPublicID, "ironboxdx.blob_name" : blobName }):
+            # Initialize an SSE blob
+            initResponse = await self.__initializeBlobToSSEContainer(containerPublicID=containerPublicID, blobName=blobName,  blobDescription=blobDescription, containerAccessPassword=containerAccessPassword)
+
+            # Upload the contents to storage backend from the executor so the event loop isn't blocked
+            self.__log("Uploading contents to cloud storage")
+            totalBytes = memoryview(sourceBytes).nbytes
+
+            def upload():
+                backend = self.__createBackend(initResponse)
+                with self.__tracer.span("upload") as span, self.__reportTransfer(blobName, UPLOAD_DIRECTION, totalBytes) as transfer:
+                    uploadedBytes = engine.uploadBlocks(
+                        backend=backend,
+                        blocks=sliceBlocks(sourceBytes, engine.blockSizeForBlob(totalBytes)),
+                        totalBytes=totalBytes,
+                        progressCallback=transfer)
+                    span.setAttributes(transferAttributes(backend, uploadedBytes, engine.blockSizeForBlob(totalBytes), "block"))
+                return uploadedBytes
+
+            uploadedBytes = await self.__runBlocking(upload)
+
+            # Signal that the upload is completed
+            await self.__finalizeBlobInSSEContainer(
+                finalizeToken=initResponse['finalizeToken'],
+                blobPublicID=initResponse['blobPublicID'],
+                blobSizeBytes=uploadedBytes
+            )
+        return initResponse['blobPublicID']
+
+    #--------------------------------------------------------------------------
+    #   Uploads a readable stream, or an iterator of bytes chunks, as a blob to
+    #   a server-side encrypted IronBox DX container
+    #
+    #   The stream is read from the executor, so it must be a blocking stream
+    #   or iterator, see IronBoxDXRESTClient.uploadBlobToSSEContainerFromStream
+    #--------------------------------------------------------------------------
+    async def uploadBlobToSSEContainerFromStream(self, containerPublicID, blobName, sourceStream, blobDescription = "", containerAccessPassword = "", blockSizeBytes = None, maxWorkers = None):
+        self.__log("Uploading stream to server-side encrypted container with public ID [%s] as blob with name [%s]", containerPublicID, blobName)
+
+        with self.__tracer.span("uploadStream", attributes={ "ironboxdx.container_public_id" : containerPublicID, "ironboxdx.blob_name" : blobName }):
+            # Initialize an SSE blob
+            initResponse = await self.__initializeBlobToSSEContainer(containerPublicID=containerPublicID, blobName=blobName, blobDescription=blobDescription, containerAccessPassword=containerAccessPassword)
+
+            # Upload the contents to storage backend from the executor so the event loop isn't blocked
+            self.__log("Uploading contents to cloud storage")
+            engine = self.__createTransferEngine(blockSizeBytes, maxWorkers)
+
+            def upload():
+                backend = self.__createBackend(initResponse)
+                with self.__tracer.span("upload") as span, self.__reportTransfer(blobName, UPLOAD_DIRECTION) as transfer:
+                    uploadedBytes = engine.uploadStream(
+                        backend=backend,
+                        source=sourceStream,
+                        progressCallback=transfer)
+                    span.setAttributes(transferAttributes(backend, uploadedBytes, engine.blockSizeBytes, "block"))
+                return uploadedBytes
+
+            uploadedBytes = await self.__runBlocking(upload)
+
+            # Signal that the upload is completed with the number of bytes actually staged
+            await self.__finalizeBlobInSSEContainer(
+                finalizeToken=initResponse['finalizeToken'],
+                blobPublicID=initResponse['blobPublicID'],
+                blobSizeBytes=uploadedBytes
+            )
+        self.__log("Upload complete, %s bytes", uploadedBytes)
+        return initResponse['blobPublicID']
+
+    #--------------------------------------------------------------------------
+    #   Reads the notification settings for a container (SSE or CSE)
+    #--------------------------------------------------------------------------
+    async def getContainerNotificationSettings(self, containerPublicID):
+        self.__log("Reading container notification settings")
+        notificationResponse = await self.__sendPost(getContainerNotificationSettingsRequest(containerPublicID))
+        self.__log("Read container notification settings completed")
+        return notificationResponse
+
+    #--------------------------------------------------------------------------
+    #   Sets the notification settings for a container (SSE or CSE)
+    #--------------------------------------------------------------------------
+    async def setContainerNotificationSettings(self, containerPublicID, uploadNotificationList, downloadNotificationList):
+        self.__log("Setting container notification settings")
+        notificationResponse = await self.__sendPost(setContainerNotificationSettingsRequest(containerPublicID, uploadNotificationList, downloadNotificationList))
+        self.__log("Set container notification settings completed")
+        return notificationResponse
+
+    #--------------------------------------------------------------------------
+    #   Adds a user to a SSE container's ACLs
+    #--------------------------------------------------------------------------
+    async def addUserToSSEContainerACLs(self, containerPublicID, userEmail, canRead, canWrite, isAdmin, enabled, availableUtc = "", expiresUtc = ""):
+        self.__log("Adding user to server-side encrypted container ACLs")
+        sseACLResponse = await self.__sendPost(addUserToSSEContainerACLsRequest(containerPublicID, userEmail, canRead, canWrite, isAdmin, enabled, availableUtc, expiresUtc))
+        self.__log("Add user to SSE container ACLs completed")
+        return sseACLResponse
+
+    #--------------------------------------------------------------------------
+    #   Adds a custom security group to a SSE container's ACLs
+    #--------------------------------------------------------------------------
+    async def addCustomSecurityGroupToSSEContainerACLs(self, containerPublicID, customSecurityGroupPublicID, canRead, canWrite, isAdmin, enabled, availableUtc = "", expiresUtc = ""):
+        self.__log("Adding custom security group to server-side encrypted container ACLs")
+        sseACLResponse = await self.__sendPost(addCustomSecurityGroupToSSEContainerACLsRequest(containerPublicID, customSecurityGroupPublicID, canRead, canWrite, isAdmin, enabled, availableUtc, expiresUtc))
+        self.__log("Add custom security group to SSE container ACLs completed")
+        return sseACLResponse
+
+    #--------------------------------------------------------------------------
+    #   Removes a single SSE container ACL
+    #--------------------------------------------------------------------------
+    async def deleteSSEContainerACL(self, containerPublicID, membershipPublicID):
+        self.__log("Removing server-side encrypted container ACL")
+        sseACLResponse = await self.__sendPost(deleteSSEContainerACLRequest(containerPublicID, membershipPublicID))
+        self.__log("Remove SSE container ACL completed")
+        return sseACLResponse
+
+    #--------------------------------------------------------------------------
+    #   Reads the ACLs for a SSE container
+    #--------------------------------------------------------------------------
+    async def listSSEContainerACLs(self, containerPublicID):
+        self.__log("Reading server-side encrypted container ACLs")
+        sseACLResponse = await self.__sendPost(listSSEContainerACLsRequest(containerPublicID))
+        self.__log("SSE container ACLs listing completed")
+        return sseACLResponse
+
+
+    '''
+    Note: Management API calls must use API keys whose owners are administrators of their
+    organizations for these calls to work
+    '''
+
+    #--------------------------------------------------------------------------
+    #   Reads the meta data for a container
+    #--------------------------------------------------------------------------
+    async def management_readContainerMetaData(self, containerPublicID):
+        self.__log("Reading container meta data for container with public ID [%s]", containerPublicID)
+        return await self.__sendPost(readContainerMetaDataRequest(containerPublicID))
+
+    #--------------------------------------------------------------------------
+    #   Enable/disable entity organization membership status
+    #--------------------------------------------------------------------------
+    async def management_setEntityOrganizationMembershipStatus(self, memberEmail, enabled):
+        self.__log("Setting organization membership for user [%s] to %s", memberEmail, enabled)
+        return await self.__sendPost(setEntityOrganizationMembershipStatusRequest(memberEmail, enabled))
+
+    #--------------------------------------------------------------------------
+    #   Create an entity organization membership status, see
+    #   IronBoxDXRESTClient.management_createOrganizationEntity for remarks
+    #--------------------------------------------------------------------------
+    async def management_createOrganizationEntity(self, memberEmail, memberPassword, enabled):
+        self.__log("Creating an organization entity account for %s, enabled = %s", memberEmail, enabled)
+        return await self.__sendPost(createOrganizationEntityRequest(memberEmail, memberPassword, enabled))
+
+    #--------------------------------------------------------------------------
+    #   List the member entities of an organization
+    #--------------------------------------------------------------------------
+    async def management_listOrganizationMemberEntities(self, skipPastNumItems = 0, takeNumItems = -1):
+        self.__log("Listing organization members")
+        return await self.__sendPost(listOrganizationMemberEntitiesRequest(skipPastNumItems, takeNumItems))
+
+    #--------------------------------------------------------------------------
+    #   Get an organization member entity meta data
+    #--------------------------------------------------------------------------
+    async def management_readOrganizationMemberEntityMetadata(self, memberPublicID):
+        self.__log("Reading organization member entity meta data for user with publicID = %s", memberPublicID)
+        return await self.__sendPost(readOrganizationMemberEntityMetadataRequest(memberPublicID))
+
+    #--------------------------------------------------------------------------
+    #   Sets the data ttl value for a container
+    #   Note: This requires that the organization has custom container data
+    #   ttl enabled, contact the IronBox team to enable this
+    #--------------------------------------------------------------------------
+    async def management_setContainerDataTtl(self, containerPublicID, containerDataTTLHours, containerDataTTLEnabled):
+        self.__log("Setting data ttl for container with publicID = %s", containerPublicID)
+        return await self.__sendPost(setContainerDataTtlRequest(containerPublicID, containerDataTTLHours, containerDataTTLEnabled))
+
+    #--------------------------------------------------------------------------
+    #   Sets meta data for a container
+    #   Valid values for metaDataTarget:
+    #
+    #   0 = Migrated IronBoxSFT ContainerID
+    #--------------------------------------------------------------------------
+    async def management_setContainerMetadata(self, containerPublicID, metaDataTarget, metaDataValue):
+        self.__log("Setting metadata for container with publicID = %s", containerPublicID)
+        return await self.__sendPost(setContainerMetadataRequest(containerPublicID, metaDataTarget, metaDataValue))
+
+    #--------------------------------------------------------------------------
+    #   Creates a custom security group
+    #--------------------------------------------------------------------------
+    async def management_createCustomSecurityGroup(self, name, enabled):
+        self.__log("Creating custom security group named = %s, enabled = %s", name,enabled)
+        return await self.__sendPost(createCustomSecurityGroupRequest(name, enabled))
+
+    #--------------------------------------------------------------------------
+    #   Deletes a custom security group
+    #--------------------------------------------------------------------------
+    async def management_deleteCustomSecurityGroup(self, publicID):
+        self.__log("Deleting custom security group with publicID %s", publicID)
+        return await self.__sendPost(deleteCustomSecurityGroupRequest(publicID))
+
+    #--------------------------------------------------------------------------
+    #   Updates a custom security group
+    #--------------------------------------------------------------------------
+    async def management_updateCustomSecurityGroup(self, publicID, name, enabled):
+        self.__log("Updating custom security group with publicID %s", publicID)
+        return await self.__sendPost(updateCustomSecurityGroupRequest(publicID, name, enabled))
+
+    #--------------------------------------------------------------------------
+    #   Adds a member to a custom security group
+    #--------------------------------------------------------------------------
+    async def management_addMemberToCustomSecurityGroup(self, publicID, memberEmail):
+        self.__log("Adding member to custom security group with publicID %s, email = %s", publicID, memberEmail)
+        return await self.__sendPost(addMemberToCustomSecurityGroupRequest(publicID, memberEmail))
+
+    #--------------------------------------------------------------------------
+    #   Removes a member from a custom security group
+    #--------------------------------------------------------------------------
+    async def management_removeMemberFromCustomSecurityGroup(self, publicID, memberEmail):
+        self.__log("Removing member from custom security group with publicID %s, email = %s", publicID, memberEmail)
+        return await self.__sendPost(removeMemberFromCustomSecurityGroupRequest(publicID, memberEmail))
+
+    #--------------------------------------------------------------------------
+    #   List custom security groups
+    #--------------------------------------------------------------------------
+    async def management_listCustomSecurityGroups(self):
+        self.__log("Listing custom security groups")
+        return await self.__sendPost(listCustomSecurityGroupsRequest())
+
+    #--------------------------------------------------------------------------
+    #   Read custom security group
+    #--------------------------------------------------------------------------
+    async def management_readCustomSecurityGroup(self, publicID):
+        self.__log("Reading custom security group with publicID = %s", publicID)
+        return await self.__sendPost(readCustomSecurityGroupRequest(publicID))
+
+    #--------------------------------------------------------------------------
+    #   Read container link-based access settings
+    #--------------------------------------------------------------------------
+    async def management_readContainerLinkBasedAccessSettings(self, publicID):
+        self.__log("Reading container link-based access settings with publicID = %s", publicID)
+        return await self.__sendPost(readContainerLinkBasedAccessSettingsRequest(publicID))
+
+    #--------------------------------------------------------------------------
+    #   Set container link-based access settings
+    #--------------------------------------------------------------------------
+    async def management_setContainerLinkBasedAccessSettings(self, publicID, enabled, canRead, canWrite, accessPassword):
+        self.__log("Setting container link-based access settings with publicID = %s", publicID)
+        return await self.__sendPost(setContainerLinkBasedAccessSettingsRequest(publicID, enabled, canRead, canWrite, accessPassword))
+
+    #--------------------------------------------------------------------------
+    #   Add to built-in security group
+    #--------------------------------------------------------------------------
+    async def management_addMemberToBuiltInSecurityGroup(self, groupName, memberEmail):
+        self.__log("Adding member %s to built-in security group %s", memberEmail,groupName)
+        return await self.__sendPost(addMemberToBuiltInSecurityGroupRequest(groupName, memberEmail))
+
+    #--------------------------------------------------------------------------
+    #   Remove from built-in security group
+    #--------------------------------------------------------------------------
+    async def management_removeMemberFromBuiltInSecurityGroup(self, groupName, memberEmail):
+        self.__log("Removing member %s from built-in security group %s", memberEmail,groupName)
+        return await self.__sendPost(removeMemberFromBuiltInSecurityGroupRequest(groupName, memberEmail))
+
+    #--------------------------------------------------------------------------
+    #   Read bulit-in security group
+    #--------------------------------------------------------------------------
+    async def management_readBuiltInSecurityGroup(self, groupName):
+        self.__log("Reading built-in security group %s", groupName)
+        return await self.__sendPost(readBuiltInSecurityGroupRequest(groupName))
@@ -0,0 +1,33 @@
+#   IronBox DX asyncio request coalescing
+#
+#   asyncio variant of SingleFlight, kept in its own module so the threaded
+#   client doesn't import asyncio
+#
+#   Revision History:
+#   -----------------
+#       10/16/2026  - v2.0: Initial release
+#
+import asyncio
+import copy
+
+
+class AsyncSingleFlight():
+
+    def __init__(self):
+        self.__calls = {}                               # Key to the in-flight call, a dictionary with future and waiters
+        return
+
+    # Awaits coroutineFunction() for the given key, or the call already in
+    # flight for that key and returns a copy of its result. Callers waiting
+    # on a call aren't affected if the first caller is cancelled
+    async def do(self, key, coroutineFunction):
+        call = self.__calls.get(key)
+        if call is not None:
+            call["waiters"] += 1
+            return copy.deepcopy(await asyncio.shield(call["future"]))
+
+        call = { "future" : asyncio.ensure_future(coroutineFunction()), "waiters" : 0 }
+        self.__calls[key] = call
+        call["future"].add_done_callback(lambda future: self.__calls.pop(key, None))
+        result = await asyncio.shield(call["future"])
+        return copy.deepcopy(result) if call["waiters"] else result
@@ -0,0 +1,221 @@
+#   IronBox DX blob content cache
+#
+#   A size-bounded local disk cache of downloaded SSE blob contents, keyed by
+#   blob public ID. Entries are populated atomically (downloaded to a temp file
+#   in the cache directory then renamed), evicted least recently used first,
+#   and served to destination paths with a hard link, or a copy where hard
+#   links aren't supported. Concurrent requests for the same blob wait for a
+#   single download
+#
+#   Revision History:
+#   -----------------
+#       10/16/2026  - v2.0: Initial release
+#
+import hashlib
+import os
+import shutil
+import threading
+import time
+import uuid
+
+CACHE_ENTRY_SUFFIX = ".blob"            # Suffix of the cache entry files
+CACHE_TEMP_PREFIX = ".tmp-"             # Prefix of the files being populated
+STALE_TEMP_FILE_SECONDS = 24 * 3600     # Temp files older than this were left by interrupted downloads
+
+
+class BlobContentCache():
+
+    #--------------------------------------------------------------------------
+    #   cacheDirectoryPath is created if needed and can be shared by several
+    #   processes, maxBytes bounds the total size of the entries. When
+    #   useHardLinks is True, hits are served as hard links to the cache
+    #   entry, so the served files must not be modified in place
+    #--------------------------------------------------------------------------
+    def __init__(self, cacheDirectoryPath, maxBytes, useHardLinks = True):
+        if maxBytes <= 0:
+            raise ValueError("maxBytes must be greater than zero")
+        self.cacheDirectoryPath = cacheDirectoryPath    # Directory holding the cache entries
+        self.maxBytes = maxBytes                        # Maximum total size of the cache entries
+        self.useHardLinks = useHardLinks                # Serve hits as hard links instead of copies
+        self.__entries = {}                             # Entry file name to (size in bytes, last use time)
+        self.__totalBytes = 0
+        self.__readers = {}                             # Entry file name to number of copies in progress, not evicted meanwhile
+        self.__inFlight = {}                            # Blob public ID to event set when its download completes
+        self.__lock = threading.Lock()
+        os.makedirs(cacheDirectoryPath, exist_ok=True)
+        self.__loadEntries()
+        return
+
+    # Total size of the cache entries in bytes
+    @property
+    def totalBytes(self):
+        with self.__lock:
+            return self.__totalBytes
+
+    #--------------------------------------------------------------------------
+    #   Places the contents of a blob at a destination path, from the cache if
+    #   present, otherwise by calling populate(tempFilePath) to download it
+    #   into a temp file that then becomes the cache entry. Returns True on a
+    #   cache hit
+    #
+    #   Only one download per blob runs at a time, concurrent callers wait for
+    #   it and are then served from the cache
+    #--------------------------------------------------------------------------
+    def fetch(self, blobPublicID, destinationFilePath, populate):
+        entryName = self.__entryName(blobPublicID)
+        while True:
+            with self.__lock:
+                if self.__hasEntry(entryName):
+                    self.__readers[entryName] = self.__readers.get(entryName, 0) + 1
+                    hit = True
+                    break
+                inFlight = self.__inFlight.get(blobPublicID)
+                if inFlight is None:
+                    self.__inFlight[blobPublicID] = threading.Event()
+                    hit = False
+                    break
+            inFlight.wait()     # Another caller is downloading the blob, then check the cache again
+
+        if hit:
+            try:
+                self.__place(entryName, destinationFilePath)
+                return True
+            except FileNotFoundError:
+                with self.__lock:
+                    self.__forgetEntry(entryName)   # Evicted by another process sharing the directory, download it again
+            finally:
+                self.__releaseReader(entryName)
+            return self.fetch(blobPublicID, destinationFilePath, populate)
+
+        try:
+            self.__populate(entryName, destinationFilePath, populate)
+        finally:
+            with self.__lock:
+                self.__inFlight.pop(blobPublicID).set()
+        return False
+
+    # Removes every entry from the cache
+    def clear(self):
+        with self.__lock:
+            for entryName in list(self.__entries):
+                self.__removeEntry(entryName)
+
+    # Returns the entry file name of a blob, hashed so any public ID gives a
+    # valid file name
+    def __entryName(self, blobPublicID):
+        return hashlib.sha256(blobPublicID.encode("utf-8")).hexdigest() + CACHE_ENTRY_SUFFIX
+
+    def __entryPath(self, entryName):
+        return os.path.join(self.cacheDirectoryPath, entryName)
+
+    # Indexes the entries already in the cache directory and removes stale
+    # temp files left by interrupted downloads, recent ones may still be
+    # written by another process
+    def __loadEntries(self):
+        for fileName in os.listdir(self.cacheDirectoryPath):
+            filePath = self.__entryPath(fileName)
+            if fileName.startswith(CACHE_TEMP_PREFIX):
+                try:
+                    if time.time() - os.path.getmtime(filePath) > STALE_TEMP_FILE_SECONDS:
+                        os.remove(filePath)
+                except OSError:
+                    pass
+            elif fileName.endswith(CACHE_ENTRY_SUFFIX):
+                fileStat = os.stat(filePath)
+                self.__entries[fileName] = (fileStat.st_size, fileStat.st_mtime)
+                self.__totalBytes += fileStat.st_size
+        self.__evict()
+
+    # Indicates if an entry is in the cache, picking up entries added by other
+    # processes sharing the directory. Called with the lock held
+    def __hasEntry(self, entryName):
+        if entryName not in self.__entries:
+            try:
+                fileStat = os.stat(self.__entryPath(entryName))
+            except FileNotFoundError:
+                return False
+            self.__entries[entryName] = (fileStat.st_size, fileStat.st_mtime)
+            self.__totalBytes += fileStat.st_size
+        return True
+
+    def __releaseReader(self, entryName):
+        with self.__lock:
+            self.__readers[entryName] -= 1
+            if self.__readers[entryName] == 0:
+                del self.__readers[entryName]
+            self.__evict()
+
+    # Downloads a blob into a temp file, adds it to the cache and places it at
+    # the destination path. A blob larger than the whole cache isn't cached
+    def __populate(self, entryName, destinationFilePath, populate):
+        tempFilePath = self.__entryPath(CACHE_TEMP_PREFIX + uuid.uuid4().hex)
+        try:
+            populate(tempFilePath)
+            sizeBytes = os.path.getsize(tempFilePath)
+            if sizeBytes > self.maxBytes:
+                shutil.move(tempFilePath, destinationFilePath)
+                return
+            os.replace(tempFilePath, self.__entryPath(entryName))
+        finally:
+            if os.path.exists(tempFilePath):
+                os.remove(tempFilePath)
+
+        with self.__lock:
+            previous = self.__entries.get(entryName)
+            if previous is not None:
+                self.__totalBytes -= previous[0]
+            self.__entries[entryName] = (sizeBytes, time.time())
+            self.__totalBytes += sizeBytes
+            self.__readers[entryName] = self.__readers.get(entryName, 0) + 1
+        try:
+            self.__place(entryName, destinationFilePath)
+        finally:
+            self.__releaseReader(entryName)
+
+    # Places an entry at a destination path and marks it as recently used
+    def __place(self, entryName, destinationFilePath):
+        entryPath = self.__entryPath(entryName)
+        placed = False
+        if self.useHardLinks:
+            # Link next to the destination then rename, so an existing destination is replaced atomically
+            linkFilePath = destinationFilePath + CACHE_TEMP_PREFIX + uuid.uuid4().hex
+            try:
+                os.link(entryPath, linkFilePath)
+                os.replace(linkFilePath, destinationFilePath)
+                placed = True
+            except OSError:
+                if os.path.exists(linkFilePath):
+                    os.remove(linkFilePath)
+        if not placed:
+            shutil.copyfile(entryPath, destinationFilePath)
+        # The last use time is kept in memory, file times may be too coarse to order uses, and in the
+        # modification time of the entry so other processes and later runs see it
+        with self.__lock:
+            if entryName in self.__entries:
+                self.__entries[entryName] = (self.__entries[entryName][0], time.time())
+        os.utime(entryPath)
+
+    # Removes least recently used entries until the cache fits in maxBytes,
+    # entries being copied are kept. Called with the lock held
+    def __evict(self):
+        if self.__totalBytes <= self.maxBytes:
+            return
+        for entryName, entry in sorted(self.__entries.items(), key=lambda item: item[1][1]):
+            if self.__totalBytes <= self.maxBytes:
+                return
+            if entryName not in self.__readers:
+                self.__removeEntry(entryName)
+
+    # Removes an entry from the index, called with the lock held
+    def __forgetEntry(self, entryName):
+        entry = self.__entries.pop(entryName, None)
+        if entry is not None:
+            self.__totalBytes -= entry[0]
+
+    # Removes an entry, called with the lock held
+    def __removeEntry(self, entryName):
+        self.__forgetEntry(entryName)
+        try:
+            os.remove(self.__entryPath(entryName))
+        except FileNotFoundError:
+            pass    # Already evicted by another process
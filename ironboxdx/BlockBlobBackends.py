@@ -0,0 +1,307 @@
+#   IronBox DX block blob data-plane backends
+#
+#   A backend is bound to a single cloud blob, it's created from the shared
+#   access signature returned by the IronBox DX initialize/download routes and
+#   exposes the handful of block blob operations used by BlockTransferEngine
+#
+#   Revision History:
+#   -----------------
+#       10/16/2026  - v2.0: Initial release, backend built on the azure-storage BlockBlobService, SDK retries
+#                           follow the client retry policy and draw from its retry budget, uncommitted block listing
+#                           and shared access signature expiry for resumable uploads, blocks may be given as any
+#                           bytes-like object, backends of blobs in the same storage account share a pooled
+#                           keep-alive HTTP session, the azure-storage SDK is imported when the first SDK backend
+#                           is created, HTTPBlockBlobBackend calls the Blob service REST API directly on the
+#                           pooled session without the SDK
+#
+#   Additional Information:
+#   -----------------------
+#       https://github.com/Azure/azure-storage-python
+#       https://docs.microsoft.com/en-us/rest/api/storageservices/blob-service-rest-api
+#
+import base64
+import calendar
+import threading
+import time
+
+import requests
+import xml.etree.ElementTree as ElementTree
+
+from requests.adapters import (
+    HTTPAdapter
+)
+
+from urllib.parse import (
+    quote,
+    urlparse,
+    parse_qs,
+)
+
+from .RetryPolicy import (
+    IronBoxDXRequestError
+)
+
+BLOCK_BLOB_BACKENDS = ("sdk", "http")       # Names of the data-plane backends accepted by createBlockBlobBackend
+STORAGE_SERVICE_VERSION = "2018-11-09"      # Blob service REST API version sent by HTTPBlockBlobBackend
+
+
+
+#------------------------------------------------------------------------------
+#   Creates a backend for the blob described by an IronBox DX initialize or
+#   download response, using the HTTP session of its storage account from the
+#   given session pool. backendName is one of BLOCK_BLOB_BACKENDS, "sdk" for
+#   the azure-storage SDK or "http" for the built-in REST implementation
+#------------------------------------------------------------------------------
+def createBlockBlobBackend(sasResponse, retryPolicy = None, sessionPool = None, backendName = "sdk"):
+    if backendName not in BLOCK_BLOB_BACKENDS:
+        raise ValueError("Unknown data-plane backend {}, expected one of {}".format(backendName, ", ".join(BLOCK_BLOB_BACKENDS)))
+    storage_account_name = urlparse(sasResponse["accessSignatureUri"]).hostname.split('.')[0]   # Extract the Azure account name
+    if backendName == "http":
+        return HTTPBlockBlobBackend(
+            accountUrl="https://" + urlparse(sasResponse["accessSignatureUri"]).hostname,
+            sasToken=sasResponse["accessToken"],
+            containerName=sasResponse["cloudContainerStorageName"],
+            blobName=sasResponse["cloudBlobStorageName"],
+            retryPolicy=retryPolicy,
+            requestSession=sessionPool.getSession(storage_account_name) if sessionPool is not None else None)
+    return SDKBlockBlobBackend(
+        accountName=storage_account_name,
+        sasToken=sasResponse["accessToken"],
+        containerName=sasResponse["cloudContainerStorageName"],
+        blobName=sasResponse["cloudBlobStorageName"],
+        retryPolicy=retryPolicy,
+        requestSession=sessionPool.getSession(storage_account_name) if sessionPool is not None else None)
+
+#------------------------------------------------------------------------------
+#   Returns the expiry time, in seconds since the epoch, of the shared access
+#   signature of an IronBox DX initialize or download response, None if the
+#   signature doesn't tell
+#------------------------------------------------------------------------------
+def getSASExpiryTime(sasResponse):
+    signedExpiry = parse_qs(sasResponse["accessToken"].lstrip("?")).get("se")
+    if not signedExpiry:
+        return None
+    for timeFormat in ("%Y-%m-%dT%H:%M:%SZ", "%Y-%m-%dT%H:%MZ", "%Y-%m-%d"):
+        try:
+            return calendar.timegm(time.strptime(signedExpiry[0], timeFormat))
+        except ValueError:
+            continue
+    return None
+
+#------------------------------------------------------------------------------
+#   Adapts a RetryPolicy to the retry callable of the azure-storage SDK, all
+#   block blob operations used by the backends are idempotent
+#
+#   The SDK's RetryContext doesn't count retries, its own retry policies keep
+#   the count on the context, so this callable does the same
+#------------------------------------------------------------------------------
+def createSDKRetry(retryPolicy):
+    def retry(context):
+        response = getattr(context, "response", None)
+        statusCode = response.status if response is not None else None
+        retryAfter = response.headers.get("retry-after") if response is not None else None
+        if (statusCode is not None) and (200 <= statusCode < 300):
+            statusCode = None   # Failed while reading a successful response, retry like a dropped connection
+        retryCount = getattr(context, "count", 0)
+        retryDelay = retryPolicy.getRetryDelay(retryCount, statusCode, retryAfter, idempotent=True)
+        if retryDelay is not None:
+            context.count = retryCount + 1
+        return retryDelay
+    return retry
+
+
+class StorageSessionPool():
+
+    #--------------------------------------------------------------------------
+    #   Keeps one pooled keep-alive HTTP session per storage account, shared by
+    #   every backend of that account so transfers after the first one reuse
+    #   warm connections instead of opening new TLS sessions. Credentials
+    #   aren't part of the session, each backend signs its requests with the
+    #   shared access signature of its own blob
+    #--------------------------------------------------------------------------
+    def __init__(self, poolMaxPerAccount = 64):
+        self.poolMaxPerAccount = poolMaxPerAccount      # Maximum number of connections kept open to each account
+        self.__sessions = {}                            # Storage account name to session
+        self.__lock = threading.Lock()
+        return
+
+    # Returns the session of a storage account, created on first use
+    def getSession(self, accountName):
+        with self.__lock:
+            session = self.__sessions.get(accountName)
+            if session is None:
+                session = requests.Session()
+                session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=self.poolMaxPerAccount))
+                # The SDK removes these default headers from the session of every BlockBlobService it
+                # builds, without a lock. They're removed here once so concurrent backends find nothing to remove
+                for name in ("Accept", "Accept-Encoding"):
+                    session.headers.pop(name, None)
+                self.__sessions[accountName] = session
+            return session
+
+    # Closes the sessions and their connections
+    def close(self):
+        with self.__lock:
+            for session in self.__sessions.values():
+                session.close()
+            self.__sessions.clear()
+
+
+#------------------------------------------------------------------------------
+#   Imports the azure-storage blob SDK on first use, so importing the clients
+#   doesn't load it, and tools that never transfer data don't need it
+#------------------------------------------------------------------------------
+def importAzureStorageBlob():
+    try:
+        import azure.storage.blob
+    except ImportError as e:
+        raise ImportError("The azure-storage-blob package is required for data transfers, install it with: pip install -r requirements.txt") from e
+    return azure.storage.blob
+
+
+class SDKBlockBlobBackend():
+
+    def __init__(self, accountName, sasToken, containerName, blobName, retryPolicy = None, requestSession = None):
+        self.accountName = accountName                  # Azure storage account name
+        self.containerName = containerName              # Cloud container storage name
+        self.blobName = blobName                        # Cloud blob storage name
+        self.__azureStorageBlob = importAzureStorageBlob()
+        self.__service = self.__azureStorageBlob.BlockBlobService(account_name=accountName, sas_token=sasToken, request_session=requestSession)
+        if retryPolicy is not None:
+            self.__service.retry = createSDKRetry(retryPolicy)
+            self.__service.response_callback = lambda response: retryPolicy.recordCompletion() if response.status < 500 else None
+        return
+
+    # Stages a single uncommitted block, data is any bytes-like object
+    def putBlock(self, blockId, data):
+        # The SDK only accepts bytes, so memoryview blocks are copied one block at a time
+        block = data if isinstance(data, bytes) else bytes(data)
+        self.__service.put_block(container_name=self.containerName, blob_name=self.blobName, block=block, block_id=blockId)
+
+    # Commits the given block ids, in order, as the content of the blob
+    def putBlockList(self, blockIds):
+        self.__service.put_block_list(container_name=self.containerName, blob_name=self.blobName, block_list=[self.__azureStorageBlob.BlobBlock(id=blockId) for blockId in blockIds])
+
+    # Returns the uncommitted blocks of the blob as a dictionary of block id to
+    # block size in bytes
+    def getUncommittedBlocks(self):
+        blockList = self.__service.get_block_list(container_name=self.containerName, blob_name=self.blobName, block_list_type=self.__azureStorageBlob.BlockListType.Uncommitted)
+        return { block.id : block.size for block in blockList.uncommitted_blocks }
+
+    # Returns the size of the committed blob in bytes
+    def getBlobSize(self):
+        blob = self.__service.get_blob_properties(container_name=self.containerName, blob_name=self.blobName)
+        return blob.properties.content_length
+
+    # Returns length bytes of the blob starting at offset
+    def getRange(self, offset, length):
+        blob = self.__service.get_blob_to_bytes(
+            container_name=self.containerName,
+            blob_name=self.blobName,
+            start_range=offset,
+            end_range=offset + length - 1,
+            max_connections=1)
+        return blob.content
+
+
+class HTTPBlockBlobBackend():
+
+    #--------------------------------------------------------------------------
+    #   Calls the Blob service REST API directly with the shared access
+    #   signature of the blob, on the given pooled session. Blocks are sent
+    #   from the caller's buffer without copies, and failed calls are retried
+    #   as allowed by the retry policy, all of them being idempotent
+    #--------------------------------------------------------------------------
+    def __init__(self, accountUrl, sasToken, containerName, blobName, retryPolicy = None, requestSession = None):
+        self.accountName = urlparse(accountUrl).hostname.split('.')[0]  # Azure storage account name
+        self.containerName = containerName              # Cloud container storage name
+        self.blobName = blobName                        # Cloud blob storage name
+        self.__blobUrl = "{}/{}/{}".format(accountUrl.rstrip("/"), quote(containerName), quote(blobName))
+        self.__sasParams = { name : values[0] for name, values in parse_qs(sasToken.lstrip("?"), keep_blank_values=True).items() }
+        self.__retryPolicy = retryPolicy
+        self.__session = requestSession if requestSession is not None else requests.Session()
+        self.__lastRequest = threading.local()          # Status code and retry count of the last request of each thread
+        return
+
+    #--------------------------------------------------------------------------
+    #   Returns (status code, retry count) of the last request sent by the
+    #   calling thread, after its retries. The status code is None when no
+    #   response was received. Transfer workers share a backend, so each
+    #   thread only sees its own requests
+    #--------------------------------------------------------------------------
+    def getLastRequestResult(self):
+        return getattr(self.__lastRequest, "statusCode", None), getattr(self.__lastRequest, "retryCount", 0)
+
+    # Stages a single uncommitted block, data is any bytes-like object
+    def putBlock(self, blockId, data):
+        self.__send("PUT", "Unable to stage block", { "comp" : "block", "blockid" : self.__encodeBlockId(blockId) }, data=memoryview(data).cast("B"))
+
+    # Commits the given block ids, in order, as the content of the blob
+    def putBlockList(self, blockIds):
+        blockList = ElementTree.Element("BlockList")
+        for blockId in blockIds:
+            ElementTree.SubElement(blockList, "Latest").text = self.__encodeBlockId(blockId)
+        body = b'<?xml version="1.0" encoding="utf-8"?>' + ElementTree.tostring(blockList)
+        self.__send("PUT", "Unable to commit block list", { "comp" : "blocklist" }, data=body, headers={ "Content-Type" : "application/xml" })
+
+    # Returns the uncommitted blocks of the blob as a dictionary of block id to
+    # block size in bytes
+    def getUncommittedBlocks(self):
+        response = self.__send("GET", "Unable to get block list", { "comp" : "blocklist", "blocklisttype" : "uncommitted" })
+        blockList = ElementTree.fromstring(response.content)
+        return {
+            base64.b64decode(block.findtext("Name")).decode("utf-8") : int(block.findtext("Size"))
+            for block in blockList.iterfind("UncommittedBlocks/Block")
+        }
+
+    # Returns the size of the committed blob in bytes
+    def getBlobSize(self):
+        response = self.__send("HEAD", "Unable to get blob properties")
+        return int(response.headers["Content-Length"])
+
+    # Returns length bytes of the blob starting at offset
+    def getRange(self, offset, length):
+        response = self.__send("GET", "Unable to read blob range", headers={ "x-ms-range" : "bytes={}-{}".format(offset, offset + length - 1) })
+        return response.content
+
+    # Block ids are base64 encoded in the URL and the block list, like the SDK
+    # does, so journaled ids work with both backends
+    def __encodeBlockId(self, blockId):
+        return base64.b64encode(blockId.encode("utf-8")).decode("utf-8")
+
+    # Sends a request to the blob and returns its successful response, failed
+    # requests are retried as allowed by the retry policy, then raise an
+    # IronBoxDXRequestError with the given message
+    def __send(self, method, errorMessage, params = None, data = None, headers = None):
+        requestParams = dict(self.__sasParams)
+        requestParams.update(params or {})
+        requestHeaders = { "x-ms-version" : STORAGE_SERVICE_VERSION }
+        requestHeaders.update(headers or {})
+        retryCount = 0
+        self.__lastRequest.statusCode = None
+        while True:
+            self.__lastRequest.retryCount = retryCount
+            try:
+                response = self.__session.request(method, self.__blobUrl, params=requestParams, data=data, headers=requestHeaders)
+            except requests.exceptions.RequestException as e:
+                self.__lastRequest.statusCode = None
+                retryDelay = self.__retryPolicy.getRetryDelay(retryCount) if self.__retryPolicy is not None else None
+                if retryDelay is None:
+                    raise IronBoxDXRequestError(errorMessage, self.__describe(method), None, retryCount) from e
+            else:
+                self.__lastRequest.statusCode = response.status_code
+                if 200 <= response.status_code < 300:
+                    if self.__retryPolicy is not None:
+                        self.__retryPolicy.recordCompletion()
+                    return response
+                retryDelay = self.__retryPolicy.getRetryDelay(retryCount, response.status_code, response.headers.get("Retry-After")) if self.__retryPolicy is not None else None
+                if retryDelay is None:
+                    if self.__retryPolicy is not None:
+                        self.__retryPolicy.recordCompletion()
+                    raise IronBoxDXRequestError(errorMessage, self.__describe(method), response.status_code, retryCount)
+            time.sleep(retryDelay)
+            retryCount += 1
+
+    # Describes a request in errors, without the shared access signature
+    def __describe(self, method):
+        return "{} {}/{}".format(method, self.containerName, self.blobName)
@@ -0,0 +1,366 @@
+#   IronBox DX block transfer engine
+#
+#   Moves blob contents through a data-plane backend (see BlockBlobBackends.py)
+#   using a bounded pool of worker threads
+#
+#   Revision History:
+#   -----------------
+#       10/16/2026  - v2.0: Initial release, concurrent block staging for uploads, concurrent ranged downloads
+#                           into a preallocated file, file uploads can skip blocks staged by an earlier attempt,
+#                           block uploads from readable streams and iterators of bytes chunks, in-memory buffers
+#                           are sliced into blocks without copying, ranged downloads into writable streams, writable
+#                           buffers and ordered chunk iterators, workers run in a copy of the caller's context
+#                           so context variables such as the current tracing span follow the blocks
+#
+import collections
+import contextvars
+import os
+import threading
+
+from concurrent.futures import (
+    ThreadPoolExecutor,
+    FIRST_COMPLETED,
+    wait,
+)
+
+DEFAULT_BLOCK_SIZE_BYTES = 4 * 1024 * 1024     # Size of each staged block
+DEFAULT_RANGE_SIZE_BYTES = 8 * 1024 * 1024     # Size of each byte range fetched by downloads
+DEFAULT_MAX_WORKERS = 8                         # Number of blocks or ranges transferred concurrently
+MAX_BLOCKS_PER_BLOB = 50000                     # Azure limit on the number of committed blocks in a block blob
+
+
+#------------------------------------------------------------------------------
+#   Returns the id of the block at the given index, all block ids of a blob
+#   must have the same length
+#------------------------------------------------------------------------------
+def blockIdForIndex(index):
+    return "{0:032d}".format(index)
+
+#------------------------------------------------------------------------------
+#   Slices any object supporting the buffer protocol (bytes, bytearray,
+#   memoryview, array, ...) in blocks of the given size, the blocks are
+#   memoryview slices sharing the memory of the data, nothing is copied
+#------------------------------------------------------------------------------
+def sliceBlocks(data, blockSizeBytes):
+    view = memoryview(data).cast("B")
+    for offset in range(0, view.nbytes, blockSizeBytes):
+        yield view[offset:offset + blockSizeBytes]
+
+#------------------------------------------------------------------------------
+#   Reads a readable stream, or an iterator of bytes chunks, in blocks of the
+#   given size, the last block may be shorter. Chunks are buffered only until
+#   a full block is available. Only an empty read ends a stream, non-blocking
+#   streams returning None when no data is ready raise ValueError
+#------------------------------------------------------------------------------
+def readStreamBlocks(source, blockSizeBytes):
+    if hasattr(source, "read"):
+        while True:
+            # Pipes and raw streams may return less than asked for, read until the block is full
+            chunks = []
+            remaining = blockSizeBytes
+            while remaining > 0:
+                chunk = source.read(remaining)
+                if chunk is None:
+                    raise ValueError("Non-blocking streams aren't supported, the source returned no data without reaching the end of the stream")
+                if len(chunk) == 0:
+                    break
+                chunks.append(chunk)
+                remaining -= len(chunk)
+            if not chunks:
+                return
+            yield chunks[0] if len(chunks) == 1 else b"".join(chunks)
+            if remaining > 0:
+                return
+    else:
+        buffer = bytearray()
+        for chunk in source:
+            buffer += chunk
+            while len(buffer) >= blockSizeBytes:
+                yield bytes(buffer[:blockSizeBytes])
+                del buffer[:blockSizeBytes]
+        if buffer:
+            yield bytes(buffer)
+
+#------------------------------------------------------------------------------
+#   Returns a function that reads up to length bytes at a given offset of an
+#   open file, using positional reads where the platform supports them so
+#   concurrent readers don't share a file position
+#------------------------------------------------------------------------------
+def positionalReader(fileObject):
+    if hasattr(os, "pread"):
+        fileDescriptor = fileObject.fileno()
+
+        def readAt(offset, length):
+            chunks = []
+            while length > 0:
+                chunk = os.pread(fileDescriptor, length, offset)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+                offset += len(chunk)
+                length -= len(chunk)
+            return chunks[0] if len(chunks) == 1 else b"".join(chunks)
+    else:
+        lock = threading.Lock()
+
+        def readAt(offset, length):
+            with lock:
+                fileObject.seek(offset)
+                return fileObject.read(length)
+    return readAt
+
+#------------------------------------------------------------------------------
+#   Returns a function that writes data at a given offset of an open file,
+#   using positional writes where the platform supports them so concurrent
+#   writers don't share a file position
+#------------------------------------------------------------------------------
+def positionalWriter(fileObject):
+    if hasattr(os, "pwrite"):
+        fileDescriptor = fileObject.fileno()
+
+        def writeAt(data, offset):
+            view = memoryview(data)
+            while view:
+                written = os.pwrite(fileDescriptor, view, offset)
+                view = view[written:]
+                offset += written
+    else:
+        lock = threading.Lock()
+
+        def writeAt(data, offset):
+            with lock:
+                fileObject.seek(offset)
+                fileObject.write(data)
+    return writeAt
+
+
+class BlockTransferEngine():
+
+    def __init__(self, blockSizeBytes = DEFAULT_BLOCK_SIZE_BYTES, maxWorkers = DEFAULT_MAX_WORKERS, rangeSizeBytes = DEFAULT_RANGE_SIZE_BYTES):
+        if blockSizeBytes <= 0:
+            raise ValueError("blockSizeBytes must be greater than zero")
+        if rangeSizeBytes <= 0:
+            raise ValueError("rangeSizeBytes must be greater than zero")
+        if maxWorkers <= 0:
+            raise ValueError("maxWorkers must be greater than zero")
+        self.blockSizeBytes = blockSizeBytes            # Size of each staged block
+        self.rangeSizeBytes = rangeSizeBytes            # Size of each byte range fetched by downloads
+        self.maxWorkers = maxWorkers                    # Number of blocks or ranges transferred concurrently
+        return
+
+    # Runs the given (function, arguments) calls on the worker pool, the calls
+    # iterable is only advanced as workers free up so at most two calls per
+    # worker are pending at any time
+    def __runConcurrently(self, calls):
+        pending = set()
+        executor = ThreadPoolExecutor(max_workers=self.maxWorkers)
+        try:
+            for func, args in calls:
+                if len(pending) >= self.maxWorkers * 2:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        future.result()     # Surface the first failure as soon as possible
+                pending.add(executor.submit(contextvars.copy_context().run, func, *args))
+            for future in wait(pending)[0]:
+                future.result()
+        except BaseException:
+            for future in pending:
+                future.cancel()
+            raise
+        finally:
+            executor.shutdown(wait=True)
+
+    # Returns the block size to use for a blob of the given size, grown if
+    # needed so the blob fits within the maximum number of blocks
+    def blockSizeForBlob(self, totalBytes):
+        if totalBytes is None:
+            return self.blockSizeBytes
+        return max(self.blockSizeBytes, -(-totalBytes // MAX_BLOCKS_PER_BLOB))
+
+    #--------------------------------------------------------------------------
+    #   Uploads the first totalBytes of a file path through a backend, returns
+    #   the number of bytes uploaded
+    #
+    #   Each worker reads its own block from the file. Blocks whose ids are in
+    #   stagedBlockIds were staged by an earlier attempt, they aren't read or
+    #   sent again but are committed and counted as uploaded. onBlockStaged is
+    #   called with the id of each block once it's staged
+    #--------------------------------------------------------------------------
+    def uploadFile(self, backend, filePath, totalBytes, progressCallback = None, stagedBlockIds = None, onBlockStaged = None):
+        blockSizeBytes = self.blockSizeForBlob(totalBytes)
+        stagedBlockIds = stagedBlockIds if stagedBlockIds is not None else frozenset()
+        progressLock = threading.Lock()
+        progress = { "uploadedBytes" : 0 }
+        blockIds = []
+
+        with open(filePath, "rb") as sourceFile:
+            readAt = positionalReader(sourceFile)
+
+            def stageBlock(blockId, offset, length):
+                block = readAt(offset, length)
+                backend.putBlock(blockId, block)
+                if onBlockStaged is not None:
+                    onBlockStaged(blockId)
+                with progressLock:
+                    progress["uploadedBytes"] += len(block)
+                    if progressCallback is not None:
+                        progressCallback(progress["uploadedBytes"], totalBytes)
+
+            def stageCalls():
+                for index, offset in enumerate(range(0, totalBytes, blockSizeBytes)):
+                    blockId = blockIdForIndex(index)
+                    blockIds.append(blockId)
+                    length = min(blockSizeBytes, totalBytes - offset)
+                    if blockId in stagedBlockIds:
+                        with progressLock:
+                            progress["uploadedBytes"] += length
+                        continue
+                    yield stageBlock, (blockId, offset, length)
+
+            self.__runConcurrently(stageCalls())
+
+        # All blocks are staged, commit them in order
+        backend.putBlockList(blockIds)
+        return progress["uploadedBytes"]
+
+    #--------------------------------------------------------------------------
+    #   Stages the given blocks concurrently then commits the block list,
+    #   returns the number of bytes uploaded
+    #
+    #   At most two blocks per worker are held in memory at any time,
+    #   onBlockStaged is called with the id of each block once it's staged
+    #--------------------------------------------------------------------------
+    def uploadBlocks(self, backend, blocks, totalBytes = None, progressCallback = None, onBlockStaged = None):
+        progressLock = threading.Lock()
+        progress = { "uploadedBytes" : 0 }
+
+        def stageBlock(blockId, block):
+            backend.putBlock(blockId, block)
+            if onBlockStaged is not None:
+                onBlockStaged(blockId)
+            with progressLock:
+                progress["uploadedBytes"] += len(block)
+                if progressCallback is not None:
+                    progressCallback(progress["uploadedBytes"], totalBytes)
+
+        blockIds = []
+
+        def stageCalls():
+            for index, block in enumerate(blocks):
+                if index >= MAX_BLOCKS_PER_BLOB:
+                    raise ValueError("Blob exceeds {} blocks of {} bytes, use a larger block size".format(MAX_BLOCKS_PER_BLOB, self.blockSizeBytes))
+                blockId = blockIdForIndex(index)
+                blockIds.append(blockId)
+                yield stageBlock, (blockId, block)
+
+        self.__runConcurrently(stageCalls())
+
+        # All blocks are staged, commit them in order
+        backend.putBlockList(blockIds)
+        return progress["uploadedBytes"]
+
+    #--------------------------------------------------------------------------
+    #   Uploads a readable stream, or an iterator of bytes chunks, through a
+    #   backend as the data arrives, returns the number of bytes uploaded
+    #
+    #   The size isn't known up front so blocks are always blockSizeBytes,
+    #   which bounds the blob to MAX_BLOCKS_PER_BLOB blocks of that size
+    #--------------------------------------------------------------------------
+    def uploadStream(self, backend, source, progressCallback = None):
+        return self.uploadBlocks(backend, readStreamBlocks(source, self.blockSizeBytes), None, progressCallback)
+
+    #--------------------------------------------------------------------------
+    #   Downloads a blob through a backend into a file path, the file is
+    #   preallocated to the blob size and byte ranges are fetched concurrently
+    #   and written in place, returns the number of bytes downloaded
+    #--------------------------------------------------------------------------
+    def downloadToFile(self, backend, filePath, progressCallback = None):
+        totalBytes = backend.getBlobSize()
+        progressLock = threading.Lock()
+        progress = { "downloadedBytes" : 0 }
+
+        with open(filePath, "wb") as destinationFile:
+            destinationFile.truncate(totalBytes)
+            writeAt = positionalWriter(destinationFile)
+
+            def fetchRange(offset, length):
+                writeAt(backend.getRange(offset, length), offset)
+                with progressLock:
+                    progress["downloadedBytes"] += length
+                    if progressCallback is not None:
+                        progressCallback(progress["downloadedBytes"], totalBytes)
+
+            self.__runConcurrently(
+                (fetchRange, (offset, min(self.rangeSizeBytes, totalBytes - offset))) for offset in range(0, totalBytes, self.rangeSizeBytes))
+        return totalBytes
+
+    #--------------------------------------------------------------------------
+    #   Downloads a blob through a backend into a writable buffer (bytearray,
+    #   memoryview, mmap, ...) at least as large as the blob, byte ranges are
+    #   fetched concurrently and copied in place, returns the number of bytes
+    #   downloaded
+    #--------------------------------------------------------------------------
+    def downloadIntoBuffer(self, backend, buffer, progressCallback = None):
+        totalBytes = backend.getBlobSize()
+        view = memoryview(buffer).cast("B")
+        if view.readonly:
+            raise ValueError("buffer must be writable")
+        if view.nbytes < totalBytes:
+            raise ValueError("buffer holds {} bytes, the blob is {} bytes".format(view.nbytes, totalBytes))
+        progressLock = threading.Lock()
+        progress = { "downloadedBytes" : 0 }
+
+        def fetchRange(offset, length):
+            view[offset:offset + length] = backend.getRange(offset, length)
+            with progressLock:
+                progress["downloadedBytes"] += length
+                if progressCallback is not None:
+                    progressCallback(progress["downloadedBytes"], totalBytes)
+
+        self.__runConcurrently(
+            (fetchRange, (offset, min(self.rangeSizeBytes, totalBytes - offset))) for offset in range(0, totalBytes, self.rangeSizeBytes))
+        return totalBytes
+
+    #--------------------------------------------------------------------------
+    #   Downloads a blob through a backend as a generator of chunks of
+    #   rangeSizeBytes, in blob order, the last chunk may be shorter
+    #
+    #   Up to maxWorkers ranges are fetched ahead of the consumer, so at most
+    #   that many chunks are held in memory. Closing the generator early stops
+    #   the fetching
+    #--------------------------------------------------------------------------
+    def downloadChunks(self, backend, progressCallback = None):
+        totalBytes = backend.getBlobSize()
+        offsets = iter(range(0, totalBytes, self.rangeSizeBytes))
+        pending = collections.deque()
+        downloadedBytes = 0
+        executor = ThreadPoolExecutor(max_workers=self.maxWorkers)
+        try:
+            while True:
+                while len(pending) < self.maxWorkers:
+                    offset = next(offsets, None)
+                    if offset is None:
+                        break
+                    pending.append(executor.submit(contextvars.copy_context().run, backend.getRange, offset, min(self.rangeSizeBytes, totalBytes - offset)))
+                if not pending:
+                    return
+                chunk = pending.popleft().result()
+                downloadedBytes += len(chunk)
+                if progressCallback is not None:
+                    progressCallback(downloadedBytes, totalBytes)
+                yield chunk
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    #--------------------------------------------------------------------------
+    #   Downloads a blob through a backend into a writable stream, chunks are
+    #   written in order as they arrive, returns the number of bytes downloaded
+    #--------------------------------------------------------------------------
+    def downloadToStream(self, backend, stream, progressCallback = None):
+        downloadedBytes = 0
+        for chunk in self.downloadChunks(backend, progressCallback):
+            stream.write(chunk)
+            downloadedBytes += len(chunk)
+        return downloadedBytes
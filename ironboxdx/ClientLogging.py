@@ -0,0 +1,80 @@
+#   IronBox DX client logging
+#
+#   The clients write their messages to the "ironboxdx" logger of the logging
+#   module, progress messages at INFO in verbose mode and request payloads at
+#   DEBUG when showDebugInfo is on. Messages are formatted lazily, so they
+#   cost little more than a level check when the level is disabled, and
+#   payloads are truncated to DEBUG_PAYLOAD_MAX_BYTES
+#
+#   The clients never change the logging configuration of the application:
+#   messages go through the handlers and levels it configured. A client
+#   created with logToConsole=True opts in to a handler writing the messages
+#   to standard output, as the clients printed them before
+#
+#   Revision History:
+#   -----------------
+#       10/16/2026  - v2.0: Initial release
+#
+import json
+import logging
+import sys
+import threading
+
+LOGGER_NAME = "ironboxdx"                       # Name of the logger the clients write to
+DEBUG_PAYLOAD_MAX_BYTES = 4096                  # Payloads logged by showDebugInfo are truncated past this size
+CONSOLE_HANDLER_NAME = "ironboxdx-console"      # Name of the standard output handler added by configureConsoleLogging
+
+logger = logging.getLogger(LOGGER_NAME)
+_consoleLevel = None                            # Level set on the logger by configureConsoleLogging, None until it sets one
+_consoleLock = threading.Lock()                 # Serializes configureConsoleLogging across clients created concurrently
+
+
+class DebugPayload():
+
+    #--------------------------------------------------------------------------
+    #   Logging argument standing for a request or response payload, bytes or
+    #   a JSON serializable object. It's only decoded or serialized when the
+    #   message is emitted, and truncated to maxBytes characters
+    #--------------------------------------------------------------------------
+    def __init__(self, payload, maxBytes = DEBUG_PAYLOAD_MAX_BYTES):
+        self.payload = payload                          # Payload to log
+        self.maxBytes = maxBytes                        # Characters kept, None keeps the whole payload
+        return
+
+    def __str__(self):
+        if isinstance(self.payload, (bytes, bytearray, memoryview)):
+            if (self.maxBytes is None) or (len(self.payload) <= self.maxBytes):
+                return bytes(self.payload).decode("utf-8", errors="replace")
+            text = bytes(self.payload[:self.maxBytes]).decode("utf-8", errors="replace")
+            return "{}... ({} more bytes)".format(text, len(self.payload) - self.maxBytes)
+        # Objects are serialized chunk by chunk and serialization stops once
+        # maxBytes characters are out, large listings are never serialized whole
+        chunks = []
+        length = 0
+        for chunk in json.JSONEncoder(indent=4, sort_keys=True, default=str).iterencode(self.payload):
+            chunks.append(chunk)
+            length += len(chunk)
+            if (self.maxBytes is not None) and (length > self.maxBytes):
+                return "{}... (truncated)".format("".join(chunks)[:self.maxBytes])
+        return "".join(chunks)
+
+
+#------------------------------------------------------------------------------
+#   Makes the messages of the clients created with logToConsole=True visible
+#   on standard output: adds a handler writing the bare messages, once, and
+#   sets the level of the logger to INFO, or DEBUG when showDebugInfo is on.
+#   A level set by the application is never changed, only the level set by a
+#   previous call can be lowered
+#------------------------------------------------------------------------------
+def configureConsoleLogging(showDebugInfo = False):
+    global _consoleLevel
+    with _consoleLock:
+        if not any(handler.get_name() == CONSOLE_HANDLER_NAME for handler in logger.handlers):
+            handler = logging.StreamHandler(sys.stdout)
+            handler.set_name(CONSOLE_HANDLER_NAME)
+            handler.setFormatter(logging.Formatter("%(message)s"))
+            logger.addHandler(handler)
+        level = logging.DEBUG if showDebugInfo else logging.INFO
+        if (logger.level == logging.NOTSET) or ((logger.level == _consoleLevel) and (logger.level > level)):
+            logger.setLevel(level)
+            _consoleLevel = level
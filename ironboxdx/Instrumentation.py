@@ -0,0 +1,149 @@
+#   IronBox DX instrumentation hooks
+#
+#   Hooks observe the requests made by a client: the control-plane calls to
+#   the IronBox DX routes (initialize, finalize, listings, management...) and
+#   the data-plane block blob operations of transfers (staging and committing
+#   blocks, reading ranges). Each request fires onRequestStart then
+#   onRequestEnd with a RequestEvent carrying its route, status, latency,
+#   sizes and retry count
+#
+#   Hooks are called on the thread making the request, transfer workers
+#   included, so they must be thread-safe and quick. An exception raised by a
+#   hook is reported as a warning and doesn't fail the request
+#
+#   Revision History:
+#   -----------------
+#       10/16/2026  - v2.0: Initial release
+#
+import contextlib
+import time
+import warnings
+
+CONTROL_PLANE = "control"                       # Plane of the requests sent to the IronBox DX routes
+DATA_PLANE = "data"                             # Plane of the block blob operations sent to cloud storage
+
+# Routes of the data-plane operations, named after the Blob service operations
+PUT_BLOCK_ROUTE = "storage/putBlock"
+PUT_BLOCK_LIST_ROUTE = "storage/putBlockList"
+GET_BLOCK_LIST_ROUTE = "storage/getBlockList"
+GET_BLOB_PROPERTIES_ROUTE = "storage/getBlobProperties"
+GET_BLOB_RANGE_ROUTE = "storage/getBlobRange"
+
+
+class RequestEvent():
+
+    def __init__(self, route, plane, requestBytes = 0):
+        self.route = route                              # IronBox DX route, or one of the storage/... data-plane routes
+        self.plane = plane                              # CONTROL_PLANE or DATA_PLANE
+        self.startTime = time.time()                    # Wall clock time the request started, in seconds since the epoch
+        self.latencySeconds = None                      # Duration of the request including retries, set when it ends
+        self.requestBytes = requestBytes                # Size of the request body
+        self.responseBytes = 0                          # Size of the response body
+        self.statusCode = None                          # HTTP status code of the last response, None if none was received or the backend doesn't tell
+        self.retryCount = 0                             # Number of retries sent, retries made inside the azure-storage SDK backend aren't counted
+        self.error = None                               # Exception that failed the request, None on success
+        self.hookData = {}                              # Free for hooks to keep their own state between start and end
+        return
+
+
+class InstrumentationHook():
+
+    # Called before a request is sent
+    def onRequestStart(self, event):
+        pass
+
+    # Called once a request has succeeded or failed, after its retries
+    def onRequestEnd(self, event):
+        pass
+
+
+class Instrumentation():
+
+    def __init__(self, hooks = None):
+        self.hooks = list(hooks) if hooks is not None else []   # InstrumentationHook instances, called in order
+        return
+
+    # Indicates if there are hooks to call
+    @property
+    def enabled(self):
+        return bool(self.hooks)
+
+    #--------------------------------------------------------------------------
+    #   Context manager wrapping a request, yields its RequestEvent for the
+    #   caller to fill in and fires the hooks around it. An exception leaving
+    #   the block is recorded as the error of the event
+    #--------------------------------------------------------------------------
+    @contextlib.contextmanager
+    def request(self, route, plane, requestBytes = 0):
+        event = RequestEvent(route, plane, requestBytes)
+        if not self.hooks:
+            yield event
+            return
+        self.__dispatch("onRequestStart", event)
+        startCounter = time.perf_counter()
+        try:
+            yield event
+        except BaseException as e:
+            event.error = e
+            if event.statusCode is None:
+                event.statusCode = getattr(e, "statusCode", None) or getattr(e, "status_code", None)
+            raise
+        finally:
+            event.latencySeconds = time.perf_counter() - startCounter
+            self.__dispatch("onRequestEnd", event)
+
+    def __dispatch(self, methodName, event):
+        for hook in self.hooks:
+            try:
+                getattr(hook, methodName)(event)
+            except Exception as e:
+                warnings.warn("Instrumentation hook {} failed in {}: {!r}".format(type(hook).__name__, methodName, e), RuntimeWarning)
+
+
+class InstrumentedBlockBlobBackend():
+
+    #--------------------------------------------------------------------------
+    #   Wraps a block blob backend (see BlockBlobBackends.py) so each of its
+    #   operations fires the hooks of the given instrumentation as a
+    #   data-plane request
+    #--------------------------------------------------------------------------
+    def __init__(self, backend, instrumentation):
+        self.accountName = backend.accountName          # Azure storage account name
+        self.containerName = backend.containerName      # Cloud container storage name
+        self.blobName = backend.blobName                # Cloud blob storage name
+        self.__backend = backend
+        self.__instrumentation = instrumentation
+        return
+
+    def putBlock(self, blockId, data):
+        with self.__instrumentation.request(PUT_BLOCK_ROUTE, DATA_PLANE, memoryview(data).nbytes) as event:
+            self.__call(event, self.__backend.putBlock, blockId, data)
+
+    def putBlockList(self, blockIds):
+        with self.__instrumentation.request(PUT_BLOCK_LIST_ROUTE, DATA_PLANE) as event:
+            self.__call(event, self.__backend.putBlockList, blockIds)
+
+    def getUncommittedBlocks(self):
+        with self.__instrumentation.request(GET_BLOCK_LIST_ROUTE, DATA_PLANE) as event:
+            return self.__call(event, self.__backend.getUncommittedBlocks)
+
+    def getBlobSize(self):
+        with self.__instrumentation.request(GET_BLOB_PROPERTIES_ROUTE, DATA_PLANE) as event:
+            return self.__call(event, self.__backend.getBlobSize)
+
+    def getRange(self, offset, length):
+        with self.__instrumentation.request(GET_BLOB_RANGE_ROUTE, DATA_PLANE) as event:
+            content = self.__call(event, self.__backend.getRange, offset, length)
+            event.responseBytes = len(content)
+            return content
+
+    # Calls a backend operation and copies the status code and retry count of
+    # its request to the event, for backends telling them through
+    # getLastRequestResult (HTTPBlockBlobBackend), whether it succeeds or not
+    def __call(self, event, operation, *args):
+        try:
+            return operation(*args)
+        finally:
+            getLastRequestResult = getattr(self.__backend, "getLastRequestResult", None)
+            if getLastRequestResult is not None:
+                event.statusCode, event.retryCount = getLastRequestResult()
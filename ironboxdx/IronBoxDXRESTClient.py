@@ -24,117 +24,363 @@
 #       6/1/2020    - v1.7: Added management API support for reading/setting container link-based access settings
 #       8/12/2020   - v1.8: Added management API support for adding to/removing from/reading built-in security groups
 #       10/7/2020   - v1.9: Add support to read/set container notification settings, list/add/remove users and custom security groups to container ACLs
+#       10/16/2026  - v2.0: Performance and scalability improvements:
+#                               - Pooled keep-alive HTTP session shared by all control-plane calls, close()/context manager support
+#                               - Added AsyncIronBoxDXRESTClient, an asyncio variant of this client (AsyncIronBoxDXRESTClient.py)
+#                               - Parallel block upload engine with configurable block size and worker count (BlockTransferEngine.py)
+#                               - Parallel ranged downloads into a preallocated file with configurable range size and worker count
+#                               - Auto-paginating SSE container blob iterator with next page prefetch
+#                               - Thread-safe client, per-operation state is kept local to each call so one instance can be shared by a worker pool
+#                               - Bulk directory upload with initialize/upload/finalize overlapped across files and a per-file result report
+#                               - Bulk parallel container download with download SAS prefetch and a resumable manifest
+#                               - Automatic retries with jittered exponential backoff, Retry-After support and a per-client retry budget,
+#                                 failed requests raise IronBoxDXRequestError carrying the route and status code
+#                               - Resumable file uploads, staged blocks are recorded in a local journal (UploadJournal.py)
+#                               - Streaming upload from readable streams and iterators of bytes chunks
+#                               - Upload from bytes, bytearray, memoryview and other buffers, sliced into blocks without copying
+#                               - Streaming download to writable streams, writable buffers and ordered chunk generators
+#                               - Seekable SSE blob reader with an LRU block cache and sequential read-ahead (SSEBlobReader.py)
+#                               - Optional size-bounded local disk cache of downloaded blobs (BlobContentCache.py)
+#                               - Optional TTL/LRU cache of read-only control-plane responses with write invalidation (ResponseCache.py)
+#                               - Identical concurrent read-only requests are coalesced into a single HTTP call (SingleFlight.py)
+#                               - Data-plane HTTP sessions are kept warm per storage account and shared by all transfers
+#                               - The Azure storage SDK is only imported by the first data transfer, management-only tools
+#                                 start faster and don't need it installed
+#                               - Built-in pure-HTTP data-plane backend calling the Blob service REST API on the pooled
+#                                 sessions, selected with dataPlaneBackend="http" instead of the azure-storage SDK
+#                               - Instrumentation hooks fired around every control-plane call and data-plane block
+#                                 operation with route, status, latency, sizes and retry count (Instrumentation.py)
+#                               - Optional metrics registry with per-route latency percentiles, error counts and
+#                                 throughput, exported as OpenMetrics text or a snapshot dictionary (MetricsRegistry.py)
+#                               - Optional tracing of transfers as nested spans for the initialize, upload or download and
+#                                 finalize phases and each block or range, with an OpenTelemetry exporter (Tracing.py)
+#                               - Progress reporting API replacing the console progress bar, a user callback receives
+#                                 throttled events aggregating the bytes, throughput and ETA of every transfer of a
+#                                 job, planned or in flight, from a background thread, off the transfer workers (ProgressReporter.py)
+#                               - Messages go to the "ironboxdx" logger with lazy formatting instead of print, debug
+#                                 payloads are truncated, written to standard output with logToConsole=True (ClientLogging.py)
+#                               - Request bodies, response cache, coalescing and retry rules of control-plane calls
+#                                 (IronBoxDXRequests.py) and the planning of directory and container transfers
+#                                 (TransferPlanning.py) are shared with AsyncIronBoxDXRESTClient
 #
 #   Additional Information:
 #   -----------------------
 #       https://github.com/Azure/azure-storage-python
+#       benchmarks/IronBoxDX_ImportTimeBenchmark.py measures the cold import time of this module
 #
 import requests
+import contextlib
+import contextvars
 import json
 import os
-import sys
-import io
+import time
+import threading
 
-from urllib.parse import (
-    urlparse
+from concurrent.futures import (
+    ThreadPoolExecutor
 )
 
-from azure.storage.blob import (
-    BlockBlobService,
-    ContainerPermissions,
-    BlobPermissions,
-    PublicAccess,
+from requests.adapters import (
+    HTTPAdapter
 )
-from azure.storage.common import (
-    AccessPolicy,
-    ResourceTypes,
-    AccountPermissions,
+
+from .BlockBlobBackends import (
+    BLOCK_BLOB_BACKENDS,
+    createBlockBlobBackend,
+    StorageSessionPool,
+)
+from .SSEBlobReader import (
+    SSEBlobReader,
+    DEFAULT_READER_BLOCK_SIZE_BYTES,
+    DEFAULT_READER_CACHE_BLOCKS,
+    DEFAULT_READER_READ_AHEAD_BLOCKS,
+)
+from .UploadJournal import (
+    UploadJournal,
+    UPLOAD_JOURNAL_SUFFIX,
+)
+from .Instrumentation import (
+    CONTROL_PLANE,
+    Instrumentation,
+    InstrumentedBlockBlobBackend,
+)
+
+from .Tracing import (
+    Tracer
+)
+from .ClientLogging import (
+    logger,
+    configureConsoleLogging,
+    DebugPayload,
+)
+from .ProgressReporter import (
+    ProgressReporter,
+    DISABLED_PROGRESS_REPORTER,
+    UPLOAD_DIRECTION,
+    DOWNLOAD_DIRECTION,
+    DEFAULT_PROGRESS_INTERVAL_SECONDS,
+)
+
+from .IronBoxDXRequests import (
+    ControlPlaneRouter,
+    parseResponseContent,
+    initializeSSEBlobRequest,
+    finalizeSSEBlobRequest,
+    listSSEContainerBlobsRequest,
+    deleteSSEContainerBlobRequest,
+    downloadSSEBlobRequest,
+    listStorageEndpointsRequest,
+    createSSEContainerRequest,
+    deleteSSEContainerRequest,
+    listSSEContainersRequest,
+    getContainerNotificationSettingsRequest,
+    setContainerNotificationSettingsRequest,
+    addUserToSSEContainerACLsRequest,
+    addCustomSecurityGroupToSSEContainerACLsRequest,
+    deleteSSEContainerACLRequest,
+    listSSEContainerACLsRequest,
+    readContainerMetaDataRequest,
+    setEntityOrganizationMembershipStatusRequest,
+    createOrganizationEntityRequest,
+    listOrganizationMemberEntitiesRequest,
+    readOrganizationMemberEntityMetadataRequest,
+    setContainerDataTtlRequest,
+    setContainerMetadataRequest,
+    createCustomSecurityGroupRequest,
+    deleteCustomSecurityGroupRequest,
+    updateCustomSecurityGroupRequest,
+    addMemberToCustomSecurityGroupRequest,
+    removeMemberFromCustomSecurityGroupRequest,
+    listCustomSecurityGroupsRequest,
+    readCustomSecurityGroupRequest,
+    readContainerLinkBasedAccessSettingsRequest,
+    setContainerLinkBasedAccessSettingsRequest,
+    addMemberToBuiltInSecurityGroupRequest,
+    removeMemberFromBuiltInSecurityGroupRequest,
+    readBuiltInSecurityGroupRequest,
+)
+from .TransferPlanning import (
+    ContainerDownloadPlan,
+    scanDirectory,
+    createUploadResult,
+    canResumeUpload,
+    transferAttributes,
+    DOWNLOAD_MANIFEST_FILE_NAME,
+    PARTIAL_DOWNLOAD_SUFFIX,
+)
+from .SingleFlight import (
+    SingleFlight
+)
+from .RetryPolicy import (
+    IronBoxDXRequestError,
+    RetryPolicy,
+)
+from .BlockTransferEngine import (
+    BlockTransferEngine,
+    sliceBlocks,
+    DEFAULT_BLOCK_SIZE_BYTES,
+    DEFAULT_RANGE_SIZE_BYTES,
+    DEFAULT_MAX_WORKERS,
 )
 
 
 class IronBoxDXRESTClient():
 
-    def __init__(self, apiKeyPublicID, apiKeySecret, baseAPIUrl = "https://dx-api.ironbox.app/api/v2/", verifySSLCert = True, showDebugInfo = False, verbose = True):
+    def __init__(self, apiKeyPublicID, apiKeySecret, baseAPIUrl = "https://dx-api.ironbox.app/api/v2/", verifySSLCert = True, showDebugInfo = False, verbose = True, poolSize = 10, poolMaxPerHost = 10, keepAliveTimeout = 60, blockSizeBytes = DEFAULT_BLOCK_SIZE_BYTES, rangeSizeBytes = DEFAULT_RANGE_SIZE_BYTES, maxTransferWorkers = DEFAULT_MAX_WORKERS, retryPolicy = None, blobContentCache = None, responseCache = None, coalesceReads = True, dataPlaneBackend = "sdk", instrumentationHooks = None, metricsRegistry = None, tracer = None, progressCallback = None, progressIntervalSeconds = DEFAULT_PROGRESS_INTERVAL_SECONDS, logToConsole = False):
+        if dataPlaneBackend not in BLOCK_BLOB_BACKENDS:
+            raise ValueError("dataPlaneBackend must be one of {}".format(", ".join(BLOCK_BLOB_BACKENDS)))
         self.__apiKeyPublicID = apiKeyPublicID          # Developer key public ID
         self.__apiKeySecret = apiKeySecret              # Developer key secret
         self.__baseAPIUrl = baseAPIUrl                  # The base IronBox API url
         self.__verifySSLCert = verifySSLCert            # Indicates if SSL certificates should be validated, used primarily for dev environment
         self.__showDebugInfo = showDebugInfo            # Shows debug information like REST body dummps
         self.__verbose = verbose                        # Shows human friendly information
-        self.__lastUploadTotalBytes = 0                 # Size of the last upload in bytes
+        self.__poolSize = poolSize                      # Number of per-host connection pools kept by the HTTP session
+        self.__poolMaxPerHost = poolMaxPerHost          # Maximum number of keep-alive connections kept per host
+        self.__keepAliveTimeout = keepAliveTimeout      # Seconds an idle pooled connection is kept before it's discarded, None keeps them forever
+        self.__lastRequestTime = None                   # Monotonic time of the last control-plane request
+        self.__lastRequestTimeLock = threading.Lock()   # Guards the last request time across threads sharing the client
+        self.__session = self.__createSession()         # Pooled keep-alive HTTP session shared by all control-plane calls
+        self.__blockSizeBytes = blockSizeBytes          # Default size of the blocks staged by data-plane transfers
+        self.__rangeSizeBytes = rangeSizeBytes          # Default size of the byte ranges fetched by data-plane downloads
+        self.__maxTransferWorkers = maxTransferWorkers  # Default number of blocks or ranges transferred concurrently by a single transfer
+        self.__blobContentCache = blobContentCache      # Optional BlobContentCache serving repeated downloads to paths
+        self.__readSingleFlight = SingleFlight() if coalesceReads else None   # Coalesces identical concurrent read-only requests
+        self.__retryPolicy = retryPolicy if retryPolicy is not None else RetryPolicy()  # Retry policy and budget shared by control-plane and data-plane calls
+        self.__router = ControlPlaneRouter(self.__retryPolicy, responseCache)  # Response cache, coalescing and retry rules of control-plane calls
+        self.__storageSessions = StorageSessionPool(poolMaxPerAccount=max(poolMaxPerHost, maxTransferWorkers * 2))  # Warm data-plane sessions per storage account
+        self.__dataPlaneBackend = dataPlaneBackend      # Data-plane backend of transfers, "sdk" (azure-storage SDK) or "http" (built-in REST calls)
+        self.__tracer = tracer if tracer is not None else Tracer()     # Traces transfers as spans, off without exporters
+        hooks = list(instrumentationHooks or [])
+        if metricsRegistry is not None:
+            hooks.append(metricsRegistry)
+        if self.__tracer.enabled:
+            hooks.append(self.__tracer)
+        self.__instrumentation = Instrumentation(hooks) # Calls the hooks given, the metrics registry and the tracer around each request
+        self.__progressCallback = progressCallback      # Called with the ProgressEvent of transfers, progress isn't tracked without it
+        self.__progressIntervalSeconds = progressIntervalSeconds   # Minimum time between two progress events
+        if logToConsole:
+            configureConsoleLogging(showDebugInfo)
         return
 
+    #--------------------------------------------------------------------------
+    #   Lifecycle
+    #--------------------------------------------------------------------------
+    # Closes the pooled connections held by this client
+    def close(self):
+        self.__session.close()
+        self.__storageSessions.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     #--------------------------------------------------------------------------
     #   REST helpers
     #--------------------------------------------------------------------------
-    # Sends HTTP POST requests
-    def __sendPost(self, route, data):
-        headers = { "ironbox_apikey_publicid": self.__apiKeyPublicID, "ironbox_apikey_secret" : self.__apiKeySecret }
-        response = requests.post(self.__baseAPIUrl + route, json=data, headers=headers, verify=self.__verifySSLCert)
-        if self.__showDebugInfo:
-            print(response.status_code)
-            print(response.content)
+    # Creates the HTTP session used for all control-plane calls, connections to
+    # dx-api are kept alive and reused across requests
+    def __createSession(self):
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.__poolSize, pool_maxsize=self.__poolMaxPerHost)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update({ "ironbox_apikey_publicid": self.__apiKeyPublicID, "ironbox_apikey_secret" : self.__apiKeySecret })
+        session.verify = self.__verifySSLCert
+        return session
+
+    # Drops pooled connections that have been idle longer than the keep-alive
+    # timeout, they are reopened on demand by the next request
+    def __dropIdleConnections(self):
+        if self.__keepAliveTimeout is None:
+            return
+        with self.__lastRequestTimeLock:
+            now = time.monotonic()
+            idle = (self.__lastRequestTime is not None) and ((now - self.__lastRequestTime) > self.__keepAliveTimeout)
+            self.__lastRequestTime = now
+        if idle:
+            for adapter in self.__session.adapters.values():
+                adapter.close()
+
+    # Sends a control-plane request through the response cache, read-only
+    # routes are answered from the cache when possible and write routes
+    # invalidate the responses they make stale. Identical read-only requests
+    # in flight at the same time share a single HTTP call, a read sent after
+    # a write completed never shares a call started before it
+    def __sendPost(self, request):
+        hit, response, generation = self.__router.getCachedResponse(request)
+        if hit:
+            return response
+        if not self.__router.isReadOnly(request.route):
+            try:
+                response = self.__postWithRetries(request)
+            finally:
+                self.__router.recordWrite(request)
+        elif self.__readSingleFlight is not None:
+            response = self.__readSingleFlight.do(self.__router.getCoalescingKey(request), lambda: self.__postWithRetries(request))
+        else:
+            response = self.__postWithRetries(request)
+        self.__router.putCachedResponse(request, response, generation)
         return response
 
-    # Outputs an object to the console
+    # Sends HTTP POST requests and returns the parsed JSON response, failed 
+    # requests are retried as allowed by the retry policy, then raise an
+    # IronBoxDXRequestError with the error message of the request
+    # The body is serialized once up front, so its size is known to the
+    # instrumentation hooks and retries don't serialize it again
+    def __postWithRetries(self, request):
+        route = request.route
+        body = json.dumps(request.body).encode("utf-8")
+        with self.__instrumentation.request(route, CONTROL_PLANE, len(body)) as event:
+            retryCount = 0
+            while True:
+                self.__dropIdleConnections()
+                event.retryCount = retryCount
+                try:
+                    response = self.__session.post(self.__baseAPIUrl + route, data=body, headers={ "Content-Type" : "application/json" })
+                except requests.exceptions.RequestException as e:
+                    # A connect timeout means the request never reached the server so it's safe to send again
+                    retryDelay = self.__router.getRetryDelay(request, retryCount, notSent=isinstance(e, requests.exceptions.ConnectTimeout))
+                    if retryDelay is None:
+                        raise IronBoxDXRequestError(request.errorMessage, route, None, retryCount) from e
+                else:
+                    event.statusCode = response.status_code
+                    event.responseBytes = len(response.content)
+                    if self.__showDebugInfo:
+                        logger.debug("%s returned %s: %s", route, response.status_code, DebugPayload(response.content))
+                    if response.status_code == requests.codes["ok"]:
+                        self.__router.recordCompletion()
+                        return parseResponseContent(response.content)
+                    retryDelay = self.__router.getRetryDelay(request, retryCount, response.status_code, response.headers.get("Retry-After"))
+                    if retryDelay is None:
+                        self.__router.recordCompletion()
+                        raise IronBoxDXRequestError(request.errorMessage, route, response.status_code, retryCount)
+                self.__log("Retrying %s in %.1f seconds", route, retryDelay)
+                time.sleep(retryDelay)
+                retryCount += 1
+
+    # Logs an object at DEBUG level, serialized and truncated only if the
+    # message is emitted
     def __debugObject(self, obj):
         if self.__showDebugInfo is True:
-            print(json.dumps(obj, indent=4, sort_keys=True))
+            logger.debug("%s", DebugPayload(obj))
         return
 
-    # Logs some information
-    def __log(self, message):
+    # Logs some information at INFO level, the message is formatted with args
+    # only if it's emitted
+    def __log(self, message, *args):
         if self.__verbose:
-            print(message)
-
-    # Extracts the Azure storage account name from a given access signature URI
-    def __extractStorageAccountName(self, accessSignatureUri):
-        storage_account_name = urlparse(accessSignatureUri).hostname.split('.')[0]
-        return storage_account_name
-
-    def __progressbar(self, current, total, label="", progressBarSize=40, outstream=sys.stdout):
-        def show(j):
-            x = 0 if current == 0 else int(progressBarSize * (j/total))
-            outstream.write("%s [%s%s] %i/%i\r" % (label, "#"*x, "."*(progressBarSize-x), j, total))
-            outstream.flush()        
-        show(current)
-        outstream.write("\r")       # Back to the beginning of the line
-        outstream.flush()
-        if current == total:
-            outstream.write("\n")   # On the final block go to a new line
-            outstream.flush()
+            logger.info(message, *args)
+
+    #--------------------------------------------------------------------------
+    #   Progress helpers
+    #--------------------------------------------------------------------------
+    # Creates the progress reporter of a transfer job, the shared disabled
+    # reporter when the client has no progress callback
+    def __createProgressReporter(self):
+        if self.__progressCallback is None:
+            return DISABLED_PROGRESS_REPORTER
+        return ProgressReporter(self.__progressCallback, self.__progressIntervalSeconds)
+
+    # Context manager reporting a single transfer as a job of its own, yields
+    # the progress callback to give to the transfer engine, None when progress
+    # isn't reported
+    @contextlib.contextmanager
+    def __reportTransfer(self, name, direction, totalBytes = None):
+        with self.__createProgressReporter() as progress, progress.transfer(name, direction, totalBytes) as transfer:
+            yield transfer
 
     #--------------------------------------------------------------------------
     #   Azure storage helpers
     #--------------------------------------------------------------------------
-    def __upload_callback(self, current, total):
-        if self.__verbose and (current != 0):
-            #print('Uploaded ({} of {} bytes)'.format(current, total))
-            self.__progressbar(current = current, total = total, label = "Uploading")
-            self.__lastUploadTotalBytes = total # track total size of uploaded data
-            
-    def __download_callback(self, current, total):
-        if self.__verbose and (current != 0):
-            #print("Downloaded ({} of {} bytes)".format(current, total))
-            self.__progressbar(current = current, total = total, label = "Downloading")
+    # Creates the data-plane backend of the blob described by an initialize or
+    # download response
+    def __createBackend(self, sasResponse):
+        backend = createBlockBlobBackend(sasResponse, self.__retryPolicy, self.__storageSessions, self.__dataPlaneBackend)
+        if self.__instrumentation.enabled:
+            backend = InstrumentedBlockBlobBackend(backend, self.__instrumentation)
+        return backend
+
+    # Creates a transfer engine from the client defaults and optional per-call overrides
+    def __createTransferEngine(self, blockSizeBytes = None, maxWorkers = None, rangeSizeBytes = None):
+        return BlockTransferEngine(
+            blockSizeBytes=blockSizeBytes if blockSizeBytes is not None else self.__blockSizeBytes,
+            maxWorkers=maxWorkers if maxWorkers is not None else self.__maxTransferWorkers,
+            rangeSizeBytes=rangeSizeBytes if rangeSizeBytes is not None else self.__rangeSizeBytes)
 
     #--------------------------------------------------------------------------
     #   Initializes an SSE container blob to IronBox DX
     #--------------------------------------------------------------------------
     def __initializeBlobToSSEContainer(self, containerPublicID, blobName, blobDescription = "", containerAccessPassword = ""):
         self.__log("Initializing server-side encrypted blob")
-        post_initialize_body = {
-            "containerPublicID" : containerPublicID,
-            "blobName" : blobName,
-            "blobDescription" : blobDescription,
-            "containerAccessPassword" : containerAccessPassword
-        }
-        initPostResponse = self.__sendPost("dx/cloud/sse/blob/initialize/api", post_initialize_body)
-        if initPostResponse.status_code != requests.codes["ok"]:
-            raise Exception("Unable to initialize SSE blob")
-        initResponse = initPostResponse.json()
-        if not initResponse:
-            raise Exception("Initialize SSE blob returned an invalid response")
+        with self.__tracer.span("initialize", attributes={ "ironboxdx.container_public_id" : containerPublicID, "ironboxdx.blob_name" : blobName }) as span:
+            request = initializeSSEBlobRequest(containerPublicID, blobName, blobDescription, containerAccessPassword)
+            initResponse = self.__sendPost(request)
+            if not initResponse:
+                raise IronBoxDXRequestError("Initialize SSE blob returned an invalid response", request.route, requests.codes["ok"])
+            span.setAttribute("ironboxdx.blob_public_id", initResponse["blobPublicID"])
         return initResponse
         
     #--------------------------------------------------------------------------
@@ -142,16 +388,8 @@ class IronBoxDXRESTClient():
     #--------------------------------------------------------------------------
     def __finalizeBlobInSSEContainer(self, finalizeToken, blobPublicID, blobSizeBytes):
         self.__log("Finalizing server-side encrypted blob")
-        post_finalize_body = {
-            "finalizeToken" : finalizeToken,
-            "blobPublicID" : blobPublicID,
-            "originalSizeBytes" : blobSizeBytes
-        }
-        finalizePostResponse = self.__sendPost("dx/cloud/sse/blob/finalize/api", post_finalize_body)
-        if finalizePostResponse.status_code != requests.codes["ok"]:
-            raise Exception("Unable to finalize SSE blob")
-        
-        finalizeResponse = finalizePostResponse.json()
+        with self.__tracer.span("finalize", attributes={ "ironboxdx.blob_public_id" : blobPublicID, "ironboxdx.blob_size_bytes" : blobSizeBytes }):
+            finalizeResponse = self.__sendPost(finalizeSSEBlobRequest(finalizeToken, blobPublicID, blobSizeBytes))
         # Current implementation returns empty response on finalize, so finalizeResponse will be None
         return finalizeResponse
 
@@ -160,13 +398,7 @@ class IronBoxDXRESTClient():
     #--------------------------------------------------------------------------
     def listStorageEndpointsForUser(self):
         self.__log("Retrieving the list of storage endpoints that the current user has access to")
-        post_list_body = {
-        }
-        listPostResponse = self.__sendPost("dx/storage/list/api", post_list_body)
-        if listPostResponse.status_code != requests.codes["ok"]:
-            raise Exception("Unable to get list of accessible storage endpoints")
-        
-        listResponse = listPostResponse.json()
+        listResponse = self.__sendPost(listStorageEndpointsRequest())
         return listResponse
 
     #--------------------------------------------------------------------------
@@ -174,19 +406,7 @@ class IronBoxDXRESTClient():
     #--------------------------------------------------------------------------
     def createSSEContainer(self, name, storageEndpointPublicID, description="", anonymousAccessEnabled=False, anonymousAccessPassword="", humanReadableID=""):
         self.__log("Creating server-side encrypted container")
-        post_create_body = {
-            "name" : name,
-            "description" : description,
-            "anonymousAccessEnabled" : anonymousAccessEnabled,
-            "anonymousAccessPassword" : anonymousAccessPassword,
-            "cloudStorageEndpointPublicID" : storageEndpointPublicID,
-            "humanReadableID" : humanReadableID
-        }
-        createPostResponse = self.__sendPost("dx/cloud/sse/container/create/api", post_create_body)
-        if createPostResponse.status_code != requests.codes["ok"]:
-            raise Exception("Unable to create SSE container")
-        
-        createResponse = createPostResponse.json()
+        createResponse = self.__sendPost(createSSEContainerRequest(name, storageEndpointPublicID, description, anonymousAccessEnabled, anonymousAccessPassword, humanReadableID))
         return createResponse
 
     #--------------------------------------------------------------------------
@@ -194,27 +414,14 @@ class IronBoxDXRESTClient():
     #--------------------------------------------------------------------------
     def deleteSSEContainer(self, containerPublicID):
         self.__log("Deleting server-side encrypted container")
-        post_delete_body = {
-            "containerPublicID" : containerPublicID
-        }
-        deletePostResponse = self.__sendPost("dx/cloud/sse/container/delete/api", post_delete_body)
-        if deletePostResponse.status_code != requests.codes["ok"]:
-            raise Exception("Unable to delete SSE container")
-        
-        deleteResponse = deletePostResponse.json()
+        deleteResponse = self.__sendPost(deleteSSEContainerRequest(containerPublicID))
         return deleteResponse
 
     #--------------------------------------------------------------------------
     #   Get list of SSE containers
     #--------------------------------------------------------------------------
     def listSSEContainers(self, includeContainersQueuedForDelete = False):
-        post_list_body = {
-            "includeContainersQueuedForDelete" : includeContainersQueuedForDelete
-        }
-        listPostResponse = self.__sendPost("dx/cloud/sse/containers/get/api", post_list_body)
-        if (listPostResponse.status_code != requests.codes["ok"]):
-            raise Exception("Unable to list server-side encrypted containers")
-        listResponse = listPostResponse.json()
+        listResponse = self.__sendPost(listSSEContainersRequest(includeContainersQueuedForDelete))
         return listResponse
 
     #--------------------------------------------------------------------------
@@ -226,30 +433,44 @@ class IronBoxDXRESTClient():
     #--------------------------------------------------------------------------
     def listSSEContainerBlobs(self, containerPublicID, skipPastNumItems = 0, takeNumItems = 500, state = 1):
         self.__log("Listing server-side encrypted blobs")
-        post_list_body = {
-            "containerPublicID" : containerPublicID,
-            "skipPastNumItems" : skipPastNumItems,
-            "takeNumItems" : takeNumItems,
-            "state" : state
-        }
-        listPostResponse = self.__sendPost("dx/cloud/sse/blob/get/api", post_list_body)
-        if (listPostResponse.status_code != requests.codes["ok"]):
-            raise Exception("Unable to list server-side encrypted blobs")
-        listResponse = listPostResponse.json()
+        listResponse = self.__sendPost(listSSEContainerBlobsRequest(containerPublicID, skipPastNumItems, takeNumItems, state))
         return listResponse
 
+    #--------------------------------------------------------------------------
+    #   Iterates over every blob in an SSE container, one page of pageSize
+    #   blobs is held at a time and the next page is fetched in the background
+    #   while the current one is being consumed
+    #
+    #   Pages are addressed by offset, blobs deleted during the iteration can
+    #   shift later blobs into pages that have already been read
+    #--------------------------------------------------------------------------
+    def iterateSSEContainerBlobs(self, containerPublicID, pageSize = 500, state = 1):
+        if pageSize <= 0:
+            raise ValueError("pageSize must be greater than zero")
+        prefetcher = ThreadPoolExecutor(max_workers=1)
+        skipPastNumItems = 0
+        nextPage = None
+        try:
+            nextPage = prefetcher.submit(self.listSSEContainerBlobs, containerPublicID, skipPastNumItems, pageSize, state)
+            while nextPage is not None:
+                blobs = nextPage.result()["blobs"]
+                skipPastNumItems += len(blobs)
+                nextPage = None
+                if len(blobs) >= pageSize:
+                    nextPage = prefetcher.submit(self.listSSEContainerBlobs, containerPublicID, skipPastNumItems, pageSize, state)
+                for blob in blobs:
+                    yield blob
+        finally:
+            if nextPage is not None:
+                nextPage.cancel()
+            prefetcher.shutdown(wait=False)
+
     #--------------------------------------------------------------------------
     #   Deletes a SSE container blob
     #--------------------------------------------------------------------------
     def deleteSSEContainerBlob(self, blobPublicID):
         self.__log("Deleting server-side encrypted blob")
-        post_delete_body = {
-            "blobPublicID" : blobPublicID
-        }
-        deletePostResponse = self.__sendPost("dx/cloud/sse/blob/delete/api", post_delete_body)
-        if (deletePostResponse.status_code != requests.codes["ok"]):
-            raise Exception("Unable to delete server-side encrypted blob")
-        deleteResponse = deletePostResponse.json()
+        deleteResponse = self.__sendPost(deleteSSEContainerBlobRequest(blobPublicID))
         self.__log("Delete complete")
         # delete response is empty, will be used in the future possibly
         #return deleteResponse
@@ -257,62 +478,365 @@ class IronBoxDXRESTClient():
 
     #--------------------------------------------------------------------------
     #   Downloads a specified SSE blob to a given destination path
+    #
+    #   The destination file is preallocated and byte ranges of rangeSizeBytes
+    #   are fetched by maxWorkers threads, both default to the values given
+    #   to the client
+    #
+    #   When the client has a blob content cache, blobs already in the cache
+    #   are placed at the destination without being fetched again. The
+    #   download is still requested from IronBox DX so access is checked and
+    #   download notifications are sent
     #--------------------------------------------------------------------------
-    def downloadSSEContainerBlobToPath(self, blobPublicID, destinationFilePath):
-
-        self.__log("Downloading server-side encrypted blob with publicID = %s" % (blobPublicID))
-        post_download_body = {
-            "blobPublicID" : blobPublicID
-        }
-        downloadPostResponse = self.__sendPost("dx/cloud/sse/blob/download/api", post_download_body)
-        if downloadPostResponse.status_code != requests.codes["ok"]:
-            raise Exception("Unable to download SSE blob")
-        downloadResponse = downloadPostResponse.json()
-        storage_account_name = self.__extractStorageAccountName(downloadResponse["accessSignatureUri"])   # Extract the Azure account name
-        self.sas_service = BlockBlobService(account_name=storage_account_name, sas_token=downloadResponse["accessToken"])
-        self.sas_service.get_blob_to_path(
-            file_path=destinationFilePath,
-            blob_name=downloadResponse["cloudBlobStorageName"], 
-            container_name=downloadResponse["cloudContainerStorageName"],
-            progress_callback=self.__download_callback)
+    def downloadSSEContainerBlobToPath(self, blobPublicID, destinationFilePath, rangeSizeBytes = None, maxWorkers = None):
+
+        self.__log("Downloading server-side encrypted blob with publicID = %s", blobPublicID)
+        with self.__tracer.span("downloadBlobToPath", attributes={ "ironboxdx.blob_public_id" : blobPublicID }) as operationSpan:
+            downloadResponse = self.__requestBlobDownload(blobPublicID)
+            engine = self.__createTransferEngine(maxWorkers=maxWorkers, rangeSizeBytes=rangeSizeBytes)
+
+            def download(filePath):
+                backend = self.__createBackend(downloadResponse)
+                with self.__tracer.span("download") as span, self.__reportTransfer(blobPublicID, DOWNLOAD_DIRECTION) as transfer:
+                    downloadedBytes = engine.downloadToFile(
+                        backend=backend,
+                        filePath=filePath,
+                        progressCallback=transfer)
+                    span.setAttributes(transferAttributes(backend, downloadedBytes, engine.rangeSizeBytes, "range"))
+
+            if self.__blobContentCache is None:
+                download(destinationFilePath)
+            elif self.__blobContentCache.fetch(blobPublicID, destinationFilePath, download):
+                operationSpan.setAttribute("ironboxdx.cache_hit", True)
+                self.__log("Served from the blob content cache")
         
         self.__log("Download complete")
 
+    #--------------------------------------------------------------------------
+    #   Downloads a specified SSE blob into a writable stream, such as an open
+    #   file, a socket file or an HTTP response, returns the number of bytes
+    #   written
+    #
+    #   Byte ranges of rangeSizeBytes are fetched ahead by maxWorkers threads
+    #   and written in order, so at most maxWorkers ranges are held in memory.
+    #   The stream isn't closed
+    #--------------------------------------------------------------------------
+    def downloadSSEContainerBlobToStream(self, blobPublicID, destinationStream, rangeSizeBytes = None, maxWorkers = None):
+
+        self.__log("Downloading server-side encrypted blob with publicID = %s", blobPublicID)
+        with self.__tracer.span("downloadBlobToStream", attributes={ "ironboxdx.blob_public_id" : blobPublicID }):
+            downloadResponse = self.__requestBlobDownload(blobPublicID)
+            engine = self.__createTransferEngine(maxWorkers=maxWorkers, rangeSizeBytes=rangeSizeBytes)
+            backend = self.__createBackend(downloadResponse)
+            with self.__tracer.span("download") as span, self.__reportTransfer(blobPublicID, DOWNLOAD_DIRECTION) as transfer:
+                downloadedBytes = engine.downloadToStream(
+                    backend=backend,
+                    stream=destinationStream,
+                    progressCallback=transfer)
+                span.setAttributes(transferAttributes(backend, downloadedBytes, engine.rangeSizeBytes, "range"))
+
+        self.__log("Download complete")
+        return downloadedBytes
+
+    #--------------------------------------------------------------------------
+    #   Downloads a specified SSE blob into a writable buffer, such as a 
+    #   bytearray, memoryview or mmap, at least as large as the blob, returns
+    #   the number of bytes written at the start of the buffer
+    #
+    #   Byte ranges are fetched concurrently and copied in place, raises a
+    #   ValueError when the buffer is too small
+    #--------------------------------------------------------------------------
+    def downloadSSEContainerBlobIntoBuffer(self, blobPublicID, destinationBuffer, rangeSizeBytes = None, maxWorkers = None):
+
+        self.__log("Downloading server-side encrypted blob with publicID = %s", blobPublicID)
+        with self.__tracer.span("downloadBlobIntoBuffer", attributes={ "ironboxdx.blob_public_id" : blobPublicID }):
+            downloadResponse = self.__requestBlobDownload(blobPublicID)
+            engine = self.__createTransferEngine(maxWorkers=maxWorkers, rangeSizeBytes=rangeSizeBytes)
+            backend = self.__createBackend(downloadResponse)
+            with self.__tracer.span("download") as span, self.__reportTransfer(blobPublicID, DOWNLOAD_DIRECTION) as transfer:
+                downloadedBytes = engine.downloadIntoBuffer(
+                    backend=backend,
+                    buffer=destinationBuffer,
+                    progressCallback=transfer)
+                span.setAttributes(transferAttributes(backend, downloadedBytes, engine.rangeSizeBytes, "range"))
+
+        self.__log("Download complete")
+        return downloadedBytes
+
+    #--------------------------------------------------------------------------
+    #   Generator of the contents of a specified SSE blob, yields chunks of 
+    #   chunkSizeBytes (defaults to the range size given to the client) in
+    #   order as they arrive
+    #
+    #   Up to maxWorkers chunks are fetched ahead of the consumer. Closing the
+    #   generator before the end stops the download
+    #--------------------------------------------------------------------------
+    def iterateSSEContainerBlobChunks(self, blobPublicID, chunkSizeBytes = None, maxWorkers = None):
+        self.__log("Downloading server-side encrypted blob with publicID = %s", blobPublicID)
+        downloadResponse = self.__requestBlobDownload(blobPublicID)
+        engine = self.__createTransferEngine(maxWorkers=maxWorkers, rangeSizeBytes=chunkSizeBytes)
+        yield from engine.downloadChunks(self.__createBackend(downloadResponse))
+
+    #--------------------------------------------------------------------------
+    #   Opens a specified SSE blob as a read-only, seekable binary file object
+    #   (SSEBlobReader) supporting read, readinto, seek and tell
+    #
+    #   Only the blocks of blockSizeBytes that are read are fetched, the last
+    #   cacheBlocks are kept in memory and sequential reads fetch the next 
+    #   readAheadBlocks ahead. The reader relies on the download shared access
+    #   signature, it can be used until the signature expires. Close it, or use
+    #   it as a context manager, to stop the read-ahead threads
+    #--------------------------------------------------------------------------
+    def openSSEContainerBlob(self, blobPublicID, blockSizeBytes = DEFAULT_READER_BLOCK_SIZE_BYTES, cacheBlocks = DEFAULT_READER_CACHE_BLOCKS, readAheadBlocks = DEFAULT_READER_READ_AHEAD_BLOCKS):
+        self.__log("Opening server-side encrypted blob with publicID = %s", blobPublicID)
+        downloadResponse = self.__requestBlobDownload(blobPublicID)
+        return SSEBlobReader(
+            backend=self.__createBackend(downloadResponse),
+            blockSizeBytes=blockSizeBytes,
+            cacheBlocks=cacheBlocks,
+            readAheadBlocks=readAheadBlocks)
+
+    # Requests the shared access signature needed to download an SSE blob
+    def __requestBlobDownload(self, blobPublicID):
+        with self.__tracer.span("requestDownload", attributes={ "ironboxdx.blob_public_id" : blobPublicID }):
+            downloadResponse = self.__sendPost(downloadSSEBlobRequest(blobPublicID))
+        return downloadResponse
+
+    #--------------------------------------------------------------------------
+    #   Downloads every ready blob of an SSE container into a local directory
+    #
+    #   Up to maxWorkers blobs are downloaded at once, each fetching its byte
+    #   ranges with rangeWorkersPerBlob threads. Download SAS tokens are 
+    #   requested by a separate pool ahead of the downloads that need them,
+    #   at most two blobs per worker are in flight so tokens are used soon
+    #   after they are issued
+    #
+    #   Blobs are saved under their blob name, names already taken in the
+    #   directory are prefixed with (1), (2)... Each completed blob is appended
+    #   to a manifest (manifestFilePath, defaults to a file in the destination
+    #   directory), blobs listed in an existing manifest are skipped so an 
+    #   interrupted download restarts where it stopped. Blobs are written to a
+    #   '.partial' file that is renamed once the download completes and 
+    #   removed if it fails
+    #
+    #   A failed blob doesn't stop the others, the returned report has one 
+    #   entry per blob with these keys:
+    #
+    #       blobPublicID, blobName, destinationFilePath, sizeBytes, succeeded, skipped, error
+    #--------------------------------------------------------------------------
+    def downloadSSEContainerToDirectory(self, containerPublicID, destinationFolderPath, manifestFilePath = None, maxWorkers = None, rangeWorkersPerBlob = 1, rangeSizeBytes = None, sasPrefetchWorkers = 2):
+        self.__log("Downloading server-side encrypted container with public ID [%s] to [%s]", containerPublicID, destinationFolderPath)
+        maxWorkers = maxWorkers if maxWorkers is not None else self.__maxTransferWorkers
+        engine = self.__createTransferEngine(maxWorkers=rangeWorkersPerBlob, rangeSizeBytes=rangeSizeBytes)
+        inFlight = threading.BoundedSemaphore(maxWorkers * 2)
+        report = []
+
+        def downloadBlob(blob, sasFuture, result):
+            try:
+                with progress.transfer(blob["blobName"], DOWNLOAD_DIRECTION, planned=True) as transfer:
+                    partialFilePath = plan.preparePartialFile(result)
+                    with self.__tracer.span("downloadBlob", attributes={ "ironboxdx.blob_public_id" : blob["blobPublicID"] }) as span:
+                        backend = self.__createBackend(sasFuture.result())
+                        result["sizeBytes"] = engine.downloadToFile(
+                            backend=backend,
+                            filePath=partialFilePath,
+                            progressCallback=transfer)
+                        span.setAttributes(transferAttributes(backend, result["sizeBytes"], engine.rangeSizeBytes, "range"))
+                    plan.completeBlob(result)
+                result["succeeded"] = True
+            except Exception as e:
+                result["error"] = e
+                self.__log("Unable to download blob with publicID = %s: %s", blob["blobPublicID"], e)
+                plan.discardBlob(result)
+            finally:
+                inFlight.release()
+
+        # The workers run in a copy of the caller's context so their spans are children of the container span,
+        # the progress of the blobs is reported as a single job planning each blob to download as it's listed
+        with self.__tracer.span("downloadContainerToDirectory", attributes={ "ironboxdx.container_public_id" : containerPublicID }), \
+                self.__createProgressReporter() as progress, \
+                ContainerDownloadPlan(destinationFolderPath, manifestFilePath) as plan, \
+                ThreadPoolExecutor(max_workers=sasPrefetchWorkers) as sasExecutor, \
+                ThreadPoolExecutor(max_workers=maxWorkers) as downloadExecutor:
+            for blob in self.iterateSSEContainerBlobs(containerPublicID):
+                result = plan.planBlob(blob)
+                report.append(result)
+                if result["skipped"]:
+                    continue
+                progress.planTransfer()
+                inFlight.acquire()
+                sasFuture = sasExecutor.submit(contextvars.copy_context().run, self.__requestBlobDownload, blob["blobPublicID"])
+                downloadExecutor.submit(contextvars.copy_context().run, downloadBlob, blob, sasFuture, result)
+
+        # Done
+        self.__log("Container download complete, %s of %s blobs downloaded, %s already downloaded",
+            sum(1 for result in report if result["succeeded"] and not result["skipped"]),
+            len(report),
+            sum(1 for result in report if result["skipped"]))
+        return report
+
+    #--------------------------------------------------------------------------
+    #   Initializes, uploads and finalizes a single file path as an SSE blob,
+    #   returns the public ID of the blob and the number of bytes uploaded
+    #
+    #   When a journal file path is given, the upload is resumed from the
+    #   journal left by an earlier attempt if it's for the same source file
+    #   and its shared access signature is still valid
+    #--------------------------------------------------------------------------
+    def __uploadFileToSSEContainer(self, containerPublicID, blobName, sourceFilePath, blobDescription, containerAccessPassword, engine, progressCallback = None, journalFilePath = None):
+        with self.__tracer.span("uploadFile", attributes={ "ironboxdx.container_public_id" : containerPublicID, "ironboxdx.blob_name" : blobName, "ironboxdx.resumable" : journalFilePath is not None }):
+            journal = None
+            resuming = False
+            if journalFilePath is not None:
+                journal = UploadJournal(journalFilePath, containerPublicID, blobName, sourceFilePath, engine.blockSizeBytes)
+                resuming = journal.load() and canResumeUpload(journal.initResponse)
+            try:
+                if resuming:
+                    initResponse = journal.initResponse
+                    self.__log("Resuming upload of server-side encrypted blob with public ID [%s]", initResponse['blobPublicID'])
+                    journal.reopen()
+                else:
+                    if (journal is not None) and (journal.initResponse is not None):
+                        self.__discardJournaledBlob(journal.initResponse)
+
+                    # Initialize an SSE blob
+                    initResponse = self.__initializeBlobToSSEContainer(containerPublicID=containerPublicID, blobName=blobName, blobDescription=blobDescription, containerAccessPassword=containerAccessPassword)
+                    if journal is not None:
+                        journal.start(initResponse)
+
+                # Upload the contents to storage backend, create a account service reference from the 
+                # shared access signature we received from the initialization process
+                backend = self.__createBackend(initResponse)
+                if resuming and (journal.committedBytes is not None):
+                    uploadedBytes = journal.committedBytes
+                else:
+                    stagedBlockIds = None
+                    if resuming:
+                        # Only blocks the storage service still holds are skipped, uncommitted blocks expire
+                        uncommittedBlocks = backend.getUncommittedBlocks()
+                        stagedBlockIds = set(blockId for blockId in journal.stagedBlockIds if blockId in uncommittedBlocks)
+                        self.__log("%s blocks already staged", len(stagedBlockIds))
+                    self.__log("Uploading contents to cloud storage")
+                    totalBytes = journal.source["sourceSizeBytes"] if journal is not None else os.path.getsize(sourceFilePath)
+                    with self.__tracer.span("upload") as span:
+                        uploadedBytes = engine.uploadFile(
+                            backend=backend,
+                            filePath=sourceFilePath,
+                            totalBytes=totalBytes,
+                            progressCallback=progressCallback,
+                            stagedBlockIds=stagedBlockIds,
+                            onBlockStaged=journal.recordBlockStaged if journal is not None else None)
+                        span.setAttributes(transferAttributes(backend, uploadedBytes, engine.blockSizeForBlob(totalBytes), "block"))
+                        span.setAttribute("ironboxdx.resumed_block_count", len(stagedBlockIds) if stagedBlockIds is not None else 0)
+                    if journal is not None:
+                        journal.recordCommitted(uploadedBytes)
+            
+                # Signal that the upload is completed with the number of bytes actually staged
+                finalizeResponse = self.__finalizeBlobInSSEContainer(
+                    finalizeToken=initResponse['finalizeToken'], 
+                    blobPublicID=initResponse['blobPublicID'], 
+                    blobSizeBytes=uploadedBytes
+                )
+                if journal is not None:
+                    journal.delete()
+            finally:
+                if journal is not None:
+                    journal.close()
+        return initResponse['blobPublicID'], uploadedBytes
+
+    # Deletes the blob initialized by a journal that can't be resumed, so it
+    # isn't left waiting for an upload that will never come
+    def __discardJournaledBlob(self, initResponse):
+        self.__log("Upload journal can't be resumed, starting over")
+        try:
+            self.deleteSSEContainerBlob(initResponse['blobPublicID'])
+        except IronBoxDXRequestError as e:
+            self.__log("Unable to delete the blob of the previous attempt: %s", e)
+
     #--------------------------------------------------------------------------
     #   Uploads a specified file path as a blob to a server-side encrypted 
     #   IronBox DX container
-    #--------------------------------------------------------------------------
-    def uploadBlobToSSEContainerFromPath(self, containerPublicID, blobName, sourceFilePath, blobDescription = "", containerAccessPassword = ""):
+    #
+    #   Blocks of blockSizeBytes are staged by maxWorkers threads, both default
+    #   to the values given to the client
+    #
+    #   A resumable upload records its progress in a journal file, by default
+    #   the source file path followed by UPLOAD_JOURNAL_SUFFIX. Running the
+    #   same upload again after a failure only sends the blocks that weren't
+    #   staged yet, as long as the source file is unchanged and the shared
+    #   access signature of the blob is still valid. The journal is removed
+    #   once the blob is finalized
+    #--------------------------------------------------------------------------
+    def uploadBlobToSSEContainerFromPath(self, containerPublicID, blobName, sourceFilePath, blobDescription = "", containerAccessPassword = "", blockSizeBytes = None, maxWorkers = None, resumable = False, journalFilePath = None):
 
         
-        self.__log("Uploading [{}] to server-side encrypted container with public ID [{}] as blob with name [{}]".format(sourceFilePath, containerPublicID, blobName))
-
-        # Initialize an SSE blob
-        initResponse = self.__initializeBlobToSSEContainer(containerPublicID=containerPublicID, blobName=blobName, blobDescription=blobDescription, containerAccessPassword=containerAccessPassword)
-
-        # Upload the contents to storage backend, create a account service reference from the 
-        # shared access signature we received from the initialization process
-        self.__log("Uploading contents to cloud storage")
-        storage_account_name = self.__extractStorageAccountName(initResponse["accessSignatureUri"])   # Extract the Azure account name
-        self.sas_service = BlockBlobService(account_name=storage_account_name, sas_token=initResponse["accessToken"])
-        self.sas_service.create_blob_from_path(
-            file_path=sourceFilePath, 
-            progress_callback=self.__upload_callback, 
-            blob_name=initResponse["cloudBlobStorageName"], 
-            container_name=initResponse["cloudContainerStorageName"])
-        
-        # Signal that the upload is completed
-        #st = os.stat(sourceFilePath)
-        finalizeResponse = self.__finalizeBlobInSSEContainer(
-            finalizeToken=initResponse['finalizeToken'], 
-            blobPublicID=initResponse['blobPublicID'], 
-            #blobSizeBytes=st.st_size
-            blobSizeBytes=self.__lastUploadTotalBytes
-        )
+        self.__log("Uploading [%s] to server-side encrypted container with public ID [%s] as blob with name [%s]", sourceFilePath, containerPublicID, blobName)
+        with self.__reportTransfer(blobName, UPLOAD_DIRECTION) as transfer:
+            self.__uploadFileToSSEContainer(
+                containerPublicID=containerPublicID,
+                blobName=blobName,
+                sourceFilePath=sourceFilePath,
+                blobDescription=blobDescription,
+                containerAccessPassword=containerAccessPassword,
+                engine=self.__createTransferEngine(blockSizeBytes, maxWorkers),
+                progressCallback=transfer,
+                journalFilePath=(journalFilePath if journalFilePath is not None else sourceFilePath + UPLOAD_JOURNAL_SUFFIX) if resumable else None)
         
         # Done
         self.__log("Upload complete")
-        
+
+    #--------------------------------------------------------------------------
+    #   Uploads every file under a directory as blobs to a server-side 
+    #   encrypted IronBox DX container
+    #
+    #   Up to maxWorkers files are in flight at once, each running its own
+    #   initialize, upload and finalize chain, so control-plane round trips of
+    #   some files overlap the data transfers of others. Each file stages its
+    #   blocks with blockWorkersPerFile threads
+    #
+    #   Blob names are the paths relative to sourceDirectoryPath using '/' 
+    #   separators. A failed file doesn't stop the others, the returned report
+    #   has one entry per file, in scan order, with these keys:
+    #
+    #       sourceFilePath, blobName, blobPublicID, sizeBytes, succeeded, error
+    #--------------------------------------------------------------------------
+    def uploadDirectoryToSSEContainer(self, containerPublicID, sourceDirectoryPath, recursive = True, blobDescription = "", containerAccessPassword = "", maxWorkers = None, blockWorkersPerFile = 1, blockSizeBytes = None):
+        self.__log("Uploading directory [%s] to server-side encrypted container with public ID [%s]", sourceDirectoryPath, containerPublicID)
+        engine = self.__createTransferEngine(blockSizeBytes, blockWorkersPerFile)
+
+        def uploadFile(sourceFilePath, blobName, sizeBytes):
+            result = createUploadResult(sourceFilePath, blobName)
+            try:
+                with progress.transfer(blobName, UPLOAD_DIRECTION, sizeBytes, planned=True) as transfer:
+                    result["blobPublicID"], result["sizeBytes"] = self.__uploadFileToSSEContainer(
+                        containerPublicID=containerPublicID,
+                        blobName=blobName,
+                        sourceFilePath=sourceFilePath,
+                        blobDescription=blobDescription,
+                        containerAccessPassword=containerAccessPassword,
+                        engine=engine,
+                        progressCallback=transfer)
+                result["succeeded"] = True
+            except Exception as e:
+                result["error"] = e
+                self.__log("Unable to upload [%s]: %s", sourceFilePath, e)
+            return result
+
+        # The workers run in a copy of the caller's context so their spans are children of the directory span,
+        # the progress of the files is reported as a single job, every file is planned before the first one
+        # starts so the size and ETA of the job cover the whole directory
+        with self.__tracer.span("uploadDirectory", attributes={ "ironboxdx.container_public_id" : containerPublicID }), \
+                self.__createProgressReporter() as progress, \
+                ThreadPoolExecutor(max_workers=maxWorkers if maxWorkers is not None else self.__maxTransferWorkers) as executor:
+            sourceFiles = scanDirectory(sourceDirectoryPath, recursive)
+            for sourceFilePath, blobName, sizeBytes in sourceFiles:
+                progress.planTransfer(sizeBytes)
+            futures = [executor.submit(contextvars.copy_context().run, uploadFile, sourceFilePath, blobName, sizeBytes) for sourceFilePath, blobName, sizeBytes in sourceFiles]
+        report = [future.result() for future in futures]
+
+        # Done
+        self.__log("Directory upload complete, %s of %s files uploaded", sum(1 for result in report if result["succeeded"]), len(report))
+        return report
 
     #--------------------------------------------------------------------------
     #   Uploads a specified text string as a blob to a server-side encrypted 
@@ -320,47 +844,121 @@ class IronBoxDXRESTClient():
     #--------------------------------------------------------------------------
     def uploadBlobToSSEContainerFromText(self, containerPublicID, blobName, sourceText, encoding = "utf-8",  blobDescription = "", containerAccessPassword = ""):
 
-        self.__log("Uploading text to server-side encrypted container with public ID [{}] as blob with name [{}]".format(containerPublicID, blobName))
-
-        # Initialize an SSE blob
-        initResponse = self.__initializeBlobToSSEContainer(containerPublicID=containerPublicID, blobName=blobName,  blobDescription=blobDescription, containerAccessPassword=containerAccessPassword)
-
-        # Upload the contents to storage backend, create a account service reference from the 
-        # shared access signature we received from the initialization process
-        self.__log("Uploading contents to cloud storage")
-        storage_account_name = self.__extractStorageAccountName(initResponse["accessSignatureUri"])   # Extract the Azure account name
-        self.sas_service = BlockBlobService(account_name=storage_account_name, sas_token=initResponse["accessToken"])
-        self.sas_service.create_blob_from_text(
-            text=sourceText, 
-            encoding=encoding, 
-            progress_callback=self.__upload_callback, 
-            blob_name=initResponse["cloudBlobStorageName"], 
-            container_name=initResponse["cloudContainerStorageName"]
-        )
-
-        # Signal that the upload is completed
-        finalizeResponse = self.__finalizeBlobInSSEContainer(
-            finalizeToken=initResponse['finalizeToken'], 
-            blobPublicID=initResponse['blobPublicID'], 
-            blobSizeBytes=self.__lastUploadTotalBytes
-        )
+        self.__log("Uploading text to server-side encrypted container with public ID [%s] as blob with name [%s]", containerPublicID, blobName)
+        self.__uploadBytesToSSEContainer(
+            containerPublicID=containerPublicID,
+            blobName=blobName,
+            sourceBytes=sourceText.encode(encoding),
+            blobDescription=blobDescription,
+            containerAccessPassword=containerAccessPassword,
+            engine=self.__createTransferEngine())
         
         # Done
         self.__log("Upload complete")
 
+    #--------------------------------------------------------------------------
+    #   Uploads in-memory binary data as a blob to a server-side encrypted
+    #   IronBox DX container, returns the public ID of the blob
+    #
+    #   sourceBytes is any object supporting the buffer protocol, such as 
+    #   bytes, bytearray, memoryview or array. It's sliced into blocks with
+    #   memoryview so the payload isn't copied, only the blocks in flight are.
+    #   It must not be modified until the upload completes
+    #--------------------------------------------------------------------------
+    def uploadBlobToSSEContainerFromBytes(self, containerPublicID, blobName, sourceBytes, blobDescription = "", containerAccessPassword = "", blockSizeBytes = None, maxWorkers = None):
+
+        self.__log("Uploading bytes to server-side encrypted container with public ID [%s] as blob with name [%s]", containerPublicID, blobName)
+        blobPublicID, uploadedBytes = self.__uploadBytesToSSEContainer(
+            containerPublicID=containerPublicID,
+            blobName=blobName,
+            sourceBytes=sourceBytes,
+            blobDescription=blobDescription,
+            containerAccessPassword=containerAccessPassword,
+            engine=self.__createTransferEngine(blockSizeBytes, maxWorkers))
+
+        # Done
+        self.__log("Upload complete")
+        return blobPublicID
+
+    #--------------------------------------------------------------------------
+    #   Initializes, uploads and finalizes in-memory data as an SSE blob,
+    #   returns the public ID of the blob and the number of bytes uploaded
+    #--------------------------------------------------------------------------
+    def __uploadBytesToSSEContainer(self, containerPublicID, blobName, sourceBytes, blobDescription, containerAccessPassword, engine):
+
+        with self.__tracer.span("uploadBytes", attributes={ "ironboxdx.container_public_id" : containerPublicID, "ironboxdx.blob_name" : blobName }):
+            # Initialize an SSE blob
+            initResponse = self.__initializeBlobToSSEContainer(containerPublicID=containerPublicID, blobName=blobName,  blobDescription=blobDescription, containerAccessPassword=containerAccessPassword)
+
+            # Upload the contents to storage backend, create a account service reference from the 
+            # shared access signature we received from the initialization process
+            self.__log("Uploading contents to cloud storage")
+            totalBytes = memoryview(sourceBytes).nbytes
+            backend = self.__createBackend(initResponse)
+            with self.__tracer.span("upload") as span, self.__reportTransfer(blobName, UPLOAD_DIRECTION, totalBytes) as transfer:
+                uploadedBytes = engine.uploadBlocks(
+                    backend=backend,
+                    blocks=sliceBlocks(sourceBytes, engine.blockSizeForBlob(totalBytes)),
+                    totalBytes=totalBytes,
+                    progressCallback=transfer)
+                span.setAttributes(transferAttributes(backend, uploadedBytes, engine.blockSizeForBlob(totalBytes), "block"))
+
+            # Signal that the upload is completed
+            finalizeResponse = self.__finalizeBlobInSSEContainer(
+                finalizeToken=initResponse['finalizeToken'], 
+                blobPublicID=initResponse['blobPublicID'], 
+                blobSizeBytes=uploadedBytes
+            )
+        return initResponse['blobPublicID'], uploadedBytes
+
+
+    #--------------------------------------------------------------------------
+    #   Uploads a readable stream, or an iterator of bytes chunks, as a blob to
+    #   a server-side encrypted IronBox DX container
+    #
+    #   Blocks are staged as the data arrives, at most two blocks per worker
+    #   are held in memory, so pipes and generated content don't need a temp
+    #   file. The stream isn't closed. Its size isn't known up front so blocks
+    #   are always blockSizeBytes, which bounds the blob to 50,000 blocks of
+    #   that size (about 195 GB with the default 4 MB blocks)
+    #--------------------------------------------------------------------------
+    def uploadBlobToSSEContainerFromStream(self, containerPublicID, blobName, sourceStream, blobDescription = "", containerAccessPassword = "", blockSizeBytes = None, maxWorkers = None):
+
+        self.__log("Uploading stream to server-side encrypted container with public ID [%s] as blob with name [%s]", containerPublicID, blobName)
+
+        with self.__tracer.span("uploadStream", attributes={ "ironboxdx.container_public_id" : containerPublicID, "ironboxdx.blob_name" : blobName }):
+            # Initialize an SSE blob
+            initResponse = self.__initializeBlobToSSEContainer(containerPublicID=containerPublicID, blobName=blobName,  blobDescription=blobDescription, containerAccessPassword=containerAccessPassword)
+
+            # Upload the contents to storage backend as they are read
+            self.__log("Uploading contents to cloud storage")
+            engine = self.__createTransferEngine(blockSizeBytes, maxWorkers)
+            backend = self.__createBackend(initResponse)
+            with self.__tracer.span("upload") as span, self.__reportTransfer(blobName, UPLOAD_DIRECTION) as transfer:
+                uploadedBytes = engine.uploadStream(
+                    backend=backend,
+                    source=sourceStream,
+                    progressCallback=transfer)
+                span.setAttributes(transferAttributes(backend, uploadedBytes, engine.blockSizeBytes, "block"))
+
+            # Signal that the upload is completed with the number of bytes actually staged
+            finalizeResponse = self.__finalizeBlobInSSEContainer(
+                finalizeToken=initResponse['finalizeToken'], 
+                blobPublicID=initResponse['blobPublicID'], 
+                blobSizeBytes=uploadedBytes
+            )
+        
+        # Done
+        self.__log("Upload complete, %s bytes", uploadedBytes)
+        return initResponse['blobPublicID']
+
 
     #--------------------------------------------------------------------------
     #   Reads the notification settings for a container (SSE or CSE)
     #--------------------------------------------------------------------------
     def getContainerNotificationSettings(self, containerPublicID):
         self.__log("Reading container notification settings")
-        post_notification_body = {
-            "containerPublicID" : containerPublicID
-        }
-        notificationPostResponse = self.__sendPost("dx/cloud/container/notification/get/api", post_notification_body)
-        if (notificationPostResponse.status_code != requests.codes["ok"]):
-            raise Exception("Unable to read container notification settings")
-        notificationResponse = notificationPostResponse.json()
+        notificationResponse = self.__sendPost(getContainerNotificationSettingsRequest(containerPublicID))
         self.__log("Read container notification settings completed")
         return notificationResponse
 
@@ -370,15 +968,7 @@ class IronBoxDXRESTClient():
     #--------------------------------------------------------------------------
     def setContainerNotificationSettings(self, containerPublicID, uploadNotificationList, downloadNotificationList):
         self.__log("Setting container notification settings")
-        post_notification_body = {
-            "containerPublicID" : containerPublicID,
-            "uploadNotificationList" : uploadNotificationList,
-            "downloadNotificationList" : downloadNotificationList
-        }
-        notificationPostResponse = self.__sendPost("dx/cloud/container/notification/set/api", post_notification_body)
-        if (notificationPostResponse.status_code != requests.codes["ok"]):
-            raise Exception("Unable to set container notification settings")
-        notificationResponse = notificationPostResponse.json()
+        notificationResponse = self.__sendPost(setContainerNotificationSettingsRequest(containerPublicID, uploadNotificationList, downloadNotificationList))
         self.__log("Set container notification settings completed")
         return notificationResponse
 
@@ -387,20 +977,7 @@ class IronBoxDXRESTClient():
     #--------------------------------------------------------------------------
     def addUserToSSEContainerACLs(self, containerPublicID, userEmail, canRead, canWrite, isAdmin, enabled, availableUtc = "", expiresUtc = ""):
         self.__log("Adding user to server-side encrypted container ACLs")
-        post_sseContainerACL_body = {
-            "containerPublicID" : containerPublicID,
-            "userEmail" : userEmail,
-            "canRead" : canRead,
-            "canWrite" : canWrite,
-            "isAdmin" : isAdmin,
-            "enabled" : enabled,
-            "availableUtc" : availableUtc,
-            "expiresUtc" : expiresUtc
-        }
-        sseACLPostResponse = self.__sendPost("dx/cloud/sse/containers/acl/add/api", post_sseContainerACL_body)
-        if (sseACLPostResponse.status_code != requests.codes["ok"]):
-            raise Exception("Unable to add user to server-side encrypted container ACLs")
-        sseACLResponse = sseACLPostResponse.json()
+        sseACLResponse = self.__sendPost(addUserToSSEContainerACLsRequest(containerPublicID, userEmail, canRead, canWrite, isAdmin, enabled, availableUtc, expiresUtc))
         self.__log("Add user to SSE container ACLs completed")
         return sseACLResponse
 
@@ -409,20 +986,7 @@ class IronBoxDXRESTClient():
     #--------------------------------------------------------------------------
     def addCustomSecurityGroupToSSEContainerACLs(self, containerPublicID, customSecurityGroupPublicID, canRead, canWrite, isAdmin, enabled, availableUtc = "", expiresUtc = ""):
         self.__log("Adding custom security group to server-side encrypted container ACLs")
-        post_sseContainerACL_body = {
-            "containerPublicID" : containerPublicID,
-            "customSecurityGroupPublicID" : customSecurityGroupPublicID,
-            "canRead" : canRead,
-            "canWrite" : canWrite,
-            "isAdmin" : isAdmin,
-            "enabled" : enabled,
-            "availableUtc" : availableUtc,
-            "expiresUtc" : expiresUtc
-        }
-        sseACLPostResponse = self.__sendPost("dx/cloud/sse/containers/acl/secgroups/custom/add/api", post_sseContainerACL_body)
-        if (sseACLPostResponse.status_code != requests.codes["ok"]):
-            raise Exception("Unable to add custom security group to server-side encrypted container ACLs")
-        sseACLResponse = sseACLPostResponse.json()
+        sseACLResponse = self.__sendPost(addCustomSecurityGroupToSSEContainerACLsRequest(containerPublicID, customSecurityGroupPublicID, canRead, canWrite, isAdmin, enabled, availableUtc, expiresUtc))
         self.__log("Add custom security group to SSE container ACLs completed")
         return sseACLResponse
 
@@ -431,14 +995,7 @@ class IronBoxDXRESTClient():
     #--------------------------------------------------------------------------
     def deleteSSEContainerACL(self, containerPublicID, membershipPublicID):
         self.__log("Removing server-side encrypted container ACL")
-        post_sseContainerACL_body = {
-            "containerPublicID" : containerPublicID,
-            "membershipPublicID" : membershipPublicID
-        }
-        sseACLPostResponse = self.__sendPost("dx/cloud/sse/containers/acl/delete/api", post_sseContainerACL_body)
-        if (sseACLPostResponse.status_code != requests.codes["ok"]):
-            raise Exception("Unable to remove server-side encrypted container ACL")
-        sseACLResponse = sseACLPostResponse.json()
+        sseACLResponse = self.__sendPost(deleteSSEContainerACLRequest(containerPublicID, membershipPublicID))
         self.__log("Remove SSE container ACL completed")
         return sseACLResponse
 
@@ -447,13 +1004,7 @@ class IronBoxDXRESTClient():
     #--------------------------------------------------------------------------
     def listSSEContainerACLs(self, containerPublicID):
         self.__log("Reading server-side encrypted container ACLs")
-        post_sseContainerACL_body = {
-            "publicID" : containerPublicID
-        }
-        sseACLPostResponse = self.__sendPost("dx/cloud/sse/containers/acl/list/api", post_sseContainerACL_body)
-        if (sseACLPostResponse.status_code != requests.codes["ok"]):
-            raise Exception("Unable to read server-side encrypted container ACLs")
-        sseACLResponse = sseACLPostResponse.json()
+        sseACLResponse = self.__sendPost(listSSEContainerACLsRequest(containerPublicID))
         self.__log("SSE container ACLs listing completed")
         return sseACLResponse
 
@@ -467,14 +1018,8 @@ class IronBoxDXRESTClient():
     #   Reads the meta data for a container
     #--------------------------------------------------------------------------
     def management_readContainerMetaData(self, containerPublicID):
-        self.__log("Reading container meta data for container with public ID [{}]".format(containerPublicID))
-        post_readmetadata_body = {
-            "containerPublicID" : containerPublicID
-        }
-        readMetaDataPostResponse = self.__sendPost("dx/management/container/metadata/api", post_readmetadata_body)
-        if readMetaDataPostResponse.status_code != requests.codes["ok"]:
-            raise Exception("Unable to read meta data for blob")
-        readMetaDataResponse = readMetaDataPostResponse.json()
+        self.__log("Reading container meta data for container with public ID [%s]", containerPublicID)
+        readMetaDataResponse = self.__sendPost(readContainerMetaDataRequest(containerPublicID))
         return readMetaDataResponse
 
 
@@ -482,15 +1027,8 @@ class IronBoxDXRESTClient():
     #   Enable/disable entity organization membership status
     #--------------------------------------------------------------------------
     def management_setEntityOrganizationMembershipStatus(self, memberEmail, enabled):
-        self.__log("Setting organization membership for user [{}] to {}".format(memberEmail, enabled))
-        post_enableUser_body = {
-            "memberEmail" : memberEmail,
-            "enabled" : enabled
-        }
-        enableUserPostResponse = self.__sendPost("dx/management/organization/entities/membership/status/set/api", post_enableUser_body)
-        if enableUserPostResponse.status_code != requests.codes["ok"]:
-            raise Exception("Unable to set organization user status")
-        enableUserResponse = enableUserPostResponse.json()
+        self.__log("Setting organization membership for user [%s] to %s", memberEmail, enabled)
+        enableUserResponse = self.__sendPost(setEntityOrganizationMembershipStatusRequest(memberEmail, enabled))
         return enableUserResponse
 
     #--------------------------------------------------------------------------
@@ -509,16 +1047,8 @@ class IronBoxDXRESTClient():
     #     You can create unlimited number of disabled user accounts
     #--------------------------------------------------------------------------
     def management_createOrganizationEntity(self, memberEmail, memberPassword, enabled):
-        self.__log("Creating an organization entity account for {}, enabled = {}".format(memberEmail, enabled))
-        post_createUser_body = {
-            "email" : memberEmail,
-            "password" : memberPassword,
-            "enabled" : enabled
-        }
-        createUserPostResponse = self.__sendPost("dx/management/organization/entities/create/api", post_createUser_body)
-        if createUserPostResponse.status_code != requests.codes["ok"]:
-            raise Exception("Unable to create organization entity")
-        createUserResponse = createUserPostResponse.json()
+        self.__log("Creating an organization entity account for %s, enabled = %s", memberEmail, enabled)
+        createUserResponse = self.__sendPost(createOrganizationEntityRequest(memberEmail, memberPassword, enabled))
         return createUserResponse
 
     #--------------------------------------------------------------------------
@@ -526,28 +1056,15 @@ class IronBoxDXRESTClient():
     #--------------------------------------------------------------------------
     def management_listOrganizationMemberEntities(self, skipPastNumItems = 0, takeNumItems = -1):
         self.__log("Listing organization members")
-        post_listOrgMemberEntities_body = {
-            "skipPastNumItems" : skipPastNumItems,
-            "takeNumItems" : takeNumItems
-        }
-        listOrgMembersPostResponse = self.__sendPost("dx/management/organization/entities/api", post_listOrgMemberEntities_body)
-        if listOrgMembersPostResponse.status_code != requests.codes["ok"]:
-            raise Exception("Unable to list organization member entities")
-        listOrgMembersResponse = listOrgMembersPostResponse.json()
+        listOrgMembersResponse = self.__sendPost(listOrganizationMemberEntitiesRequest(skipPastNumItems, takeNumItems))
         return listOrgMembersResponse
     
     #--------------------------------------------------------------------------
     #   Get an organization member entity meta data
     #--------------------------------------------------------------------------
     def management_readOrganizationMemberEntityMetadata(self, memberPublicID):
-        self.__log("Reading organization member entity meta data for user with publicID = {}".format(memberPublicID))
-        post_readOrgMemberEntityMetadata_body = {
-            "memberPublicID" : memberPublicID
-        }
-        readOrgMemberEntityMetadataPostResponse = self.__sendPost("dx/management/organization/entities/metadata/api", post_readOrgMemberEntityMetadata_body)
-        if readOrgMemberEntityMetadataPostResponse.status_code != requests.codes["ok"]:
-            raise Exception("Unable to read organization member entity metadata")
-        readOrgMemberEntityMetadataResponse = readOrgMemberEntityMetadataPostResponse.json()
+        self.__log("Reading organization member entity meta data for user with publicID = %s", memberPublicID)
+        readOrgMemberEntityMetadataResponse = self.__sendPost(readOrganizationMemberEntityMetadataRequest(memberPublicID))
         return readOrgMemberEntityMetadataResponse
 
     #--------------------------------------------------------------------------
@@ -556,16 +1073,8 @@ class IronBoxDXRESTClient():
     #   ttl enabled, contact the IronBox team to enable this
     #--------------------------------------------------------------------------
     def management_setContainerDataTtl(self, containerPublicID, containerDataTTLHours, containerDataTTLEnabled):
-        self.__log("Setting data ttl for container with publicID = {}".format(containerPublicID))
-        post_body = {
-            "containerPublicID" : containerPublicID,
-            "containerDataTTLHours" : containerDataTTLHours,
-            "containerDataTTLEnabled" : containerDataTTLEnabled
-        }
-        postResponse = self.__sendPost("dx/management/container/datattl/api", post_body)
-        if postResponse.status_code != requests.codes["ok"]:
-            raise Exception("Unable to set container data ttl")
-        response = postResponse.json()
+        self.__log("Setting data ttl for container with publicID = %s", containerPublicID)
+        response = self.__sendPost(setContainerDataTtlRequest(containerPublicID, containerDataTTLHours, containerDataTTLEnabled))
         return response
 
     #--------------------------------------------------------------------------
@@ -575,91 +1084,48 @@ class IronBoxDXRESTClient():
     #   0 = Migrated IronBoxSFT ContainerID
     #--------------------------------------------------------------------------
     def management_setContainerMetadata(self, containerPublicID, metaDataTarget, metaDataValue):
-        self.__log("Setting metadata for container with publicID = {}".format(containerPublicID))
-        post_body = {
-            "containerPublicID" : containerPublicID,
-            "metaDataTarget" : metaDataTarget,
-            "metaDataValue" : metaDataValue
-        }
-        postResponse = self.__sendPost("dx/management/container/metadata/set/api", post_body)
-        if postResponse.status_code != requests.codes["ok"]:
-            raise Exception("Unable to set container metadata")
-        response = postResponse.json()
+        self.__log("Setting metadata for container with publicID = %s", containerPublicID)
+        response = self.__sendPost(setContainerMetadataRequest(containerPublicID, metaDataTarget, metaDataValue))
         return response
 
     #--------------------------------------------------------------------------
     #   Creates a custom security group
     #--------------------------------------------------------------------------
     def management_createCustomSecurityGroup(self, name, enabled):
-        self.__log("Creating custom security group named = {}, enabled = {}".format(name,enabled))
-        post_body = {
-            "name" : name,
-            "enabled" : enabled
-        }
-        postResponse = self.__sendPost("dx/management/organization/secgroups/custom/create/api", post_body)
-        if postResponse.status_code != requests.codes["ok"]:
-            raise Exception("Unable to create custom security group")
-        response = postResponse.json()
+        self.__log("Creating custom security group named = %s, enabled = %s", name,enabled)
+        response = self.__sendPost(createCustomSecurityGroupRequest(name, enabled))
         return response
 
     #--------------------------------------------------------------------------
     #   Deletes a custom security group
     #--------------------------------------------------------------------------
     def management_deleteCustomSecurityGroup(self, publicID):
-        self.__log("Deleting custom security group with publicID {}".format(publicID))
-        post_body = {
-            "publicID" : publicID
-        }
-        postResponse = self.__sendPost("dx/management/organization/secgroups/custom/delete/api", post_body)
-        if postResponse.status_code != requests.codes["ok"]:
-            raise Exception("Unable to delete custom security group")
-        response = postResponse.json()
+        self.__log("Deleting custom security group with publicID %s", publicID)
+        response = self.__sendPost(deleteCustomSecurityGroupRequest(publicID))
         return response
 
     #--------------------------------------------------------------------------
     #   Updates a custom security group
     #--------------------------------------------------------------------------
     def management_updateCustomSecurityGroup(self, publicID, name, enabled):
-        self.__log("Updating custom security group with publicID {}".format(publicID))
-        post_body = {
-            "publicID" : publicID,
-            "name" : name,
-            "enabled" : enabled
-        }
-        postResponse = self.__sendPost("dx/management/organization/secgroups/custom/update/api", post_body)
-        if postResponse.status_code != requests.codes["ok"]:
-            raise Exception("Unable to update custom security group")
-        response = postResponse.json()
+        self.__log("Updating custom security group with publicID %s", publicID)
+        response = self.__sendPost(updateCustomSecurityGroupRequest(publicID, name, enabled))
         return response
 
     #--------------------------------------------------------------------------
     #   Adds a member to a custom security group
     #--------------------------------------------------------------------------
     def management_addMemberToCustomSecurityGroup(self, publicID, memberEmail):
-        self.__log("Adding member to custom security group with publicID {}, email = {}".format(publicID, memberEmail))
-        post_body = {
-            "publicID" : publicID,
-            "memberEmail" : memberEmail
-        }
-        postResponse = self.__sendPost("dx/management/organization/secgroups/custom/addmember/api", post_body)
-        if postResponse.status_code != requests.codes["ok"]:
-            raise Exception("Unable to add member to custom security group")
-        response = postResponse.json()
+        self.__log("Adding member to custom security group with publicID %s, email = %s", publicID, memberEmail)
+        response = self.__sendPost(addMemberToCustomSecurityGroupRequest(publicID, memberEmail))
         return response
 
     #--------------------------------------------------------------------------
     #   Removes a member from a custom security group
     #--------------------------------------------------------------------------
     def management_removeMemberFromCustomSecurityGroup(self, publicID, memberEmail):
-        self.__log("Removing member from custom security group with publicID {}, email = {}".format(publicID, memberEmail))
-        post_body = {
-            "publicID" : publicID,
-            "memberEmail" : memberEmail
-        }
-        postResponse = self.__sendPost("dx/management/organization/secgroups/custom/removemember/api", post_body)
-        if postResponse.status_code != requests.codes["ok"]:
-            raise Exception("Unable to remove member from custom security group")
-        response = postResponse.json()
+        self.__log("Removing member from custom security group with publicID %s, email = %s", publicID, memberEmail)
+        response = self.__sendPost(removeMemberFromCustomSecurityGroupRequest(publicID, memberEmail))
         return response
 
     #--------------------------------------------------------------------------
@@ -667,101 +1133,53 @@ class IronBoxDXRESTClient():
     #--------------------------------------------------------------------------
     def management_listCustomSecurityGroups(self):
         self.__log("Listing custom security groups")
-        post_body = {
-            # No body required for this call
-        }
-        postResponse = self.__sendPost("dx/management/organization/secgroups/custom/api", post_body)
-        if postResponse.status_code != requests.codes["ok"]:
-            raise Exception("Unable to list custom security groups")
-        response = postResponse.json()
+        response = self.__sendPost(listCustomSecurityGroupsRequest())
         return response
 
     #--------------------------------------------------------------------------
     #   Read custom security group
     #--------------------------------------------------------------------------
     def management_readCustomSecurityGroup(self, publicID):
-        self.__log("Reading custom security group with publicID = {}".format(publicID))
-        post_body = {
-            "publicID" : publicID
-        }
-        postResponse = self.__sendPost("dx/management/organization/secgroups/custom/read/api", post_body)
-        if postResponse.status_code != requests.codes["ok"]:
-            raise Exception("Unable to read custom security group")
-        response = postResponse.json()
+        self.__log("Reading custom security group with publicID = %s", publicID)
+        response = self.__sendPost(readCustomSecurityGroupRequest(publicID))
         return response
 
     #--------------------------------------------------------------------------
     #   Read container link-based access settings
     #--------------------------------------------------------------------------
     def management_readContainerLinkBasedAccessSettings(self, publicID):
-        self.__log("Reading container link-based access settings with publicID = {}".format(publicID))
-        post_body = {
-            "publicID" : publicID
-        }
-        postResponse = self.__sendPost("dx/management/container/settings/linkbased/api", post_body)
-        if postResponse.status_code != requests.codes["ok"]:
-            raise Exception("Unable to read container link-based settings")
-        response = postResponse.json()
+        self.__log("Reading container link-based access settings with publicID = %s", publicID)
+        response = self.__sendPost(readContainerLinkBasedAccessSettingsRequest(publicID))
         return response
 
     #--------------------------------------------------------------------------
     #   Set container link-based access settings
     #--------------------------------------------------------------------------
     def management_setContainerLinkBasedAccessSettings(self, publicID, enabled, canRead, canWrite, accessPassword):
-        self.__log("Setting container link-based access settings with publicID = {}".format(publicID))
-        post_body = {
-            "publicID" : publicID,
-            "enabled" : enabled,
-            "canRead" : canRead,
-            "canWrite" : canWrite,
-            "accessPassword" : accessPassword
-        }
-        postResponse = self.__sendPost("dx/management/container/settings/linkbased/set/api", post_body)
-        if postResponse.status_code != requests.codes["ok"]:
-            raise Exception("Unable to set container link-based settings")
-        response = postResponse.json()
+        self.__log("Setting container link-based access settings with publicID = %s", publicID)
+        response = self.__sendPost(setContainerLinkBasedAccessSettingsRequest(publicID, enabled, canRead, canWrite, accessPassword))
         return response
 
     #--------------------------------------------------------------------------
     #   Add to built-in security group
     #--------------------------------------------------------------------------
     def management_addMemberToBuiltInSecurityGroup(self, groupName, memberEmail):
-        self.__log("Adding member {} to built-in security group {}".format(memberEmail,groupName))
-        post_body = {
-            "groupName" : groupName,
-            "memberEmail" : memberEmail,
-        }
-        postResponse = self.__sendPost("dx/management/organization/secgroups/builtin/addmember/api", post_body)
-        if postResponse.status_code != requests.codes["ok"]:
-            raise Exception("Unable to add member to built-in security group")
-        response = postResponse.json()
+        self.__log("Adding member %s to built-in security group %s", memberEmail,groupName)
+        response = self.__sendPost(addMemberToBuiltInSecurityGroupRequest(groupName, memberEmail))
         return response
 
     #--------------------------------------------------------------------------
     #   Remove from built-in security group
     #--------------------------------------------------------------------------
     def management_removeMemberFromBuiltInSecurityGroup(self, groupName, memberEmail):
-        self.__log("Removing member {} from built-in security group {}".format(memberEmail,groupName))
-        post_body = {
-            "groupName" : groupName,
-            "memberEmail" : memberEmail,
-        }
-        postResponse = self.__sendPost("dx/management/organization/secgroups/builtin/removemember/api", post_body)
-        if postResponse.status_code != requests.codes["ok"]:
-            raise Exception("Unable to remove member from built-in security group")
-        response = postResponse.json()
+        self.__log("Removing member %s from built-in security group %s", memberEmail,groupName)
+        response = self.__sendPost(removeMemberFromBuiltInSecurityGroupRequest(groupName, memberEmail))
         return response
 
     #--------------------------------------------------------------------------
     #   Read bulit-in security group
     #--------------------------------------------------------------------------
     def management_readBuiltInSecurityGroup(self, groupName):
-        self.__log("Reading built-in security group {}".format(groupName))
-        post_body = {
-            "groupName" : groupName
-        }
-        postResponse = self.__sendPost("dx/management/organization/secgroups/builtin/read/api", post_body)
-        if postResponse.status_code != requests.codes["ok"]:
-            raise Exception("Unable to read built-in security group")
-        response = postResponse.json()
+        self.__log("Reading built-in security group %s", groupName)
+        response = self.__sendPost(readBuiltInSecurityGroupRequest(groupName))
         return response
\ No newline at end of file
@@ -0,0 +1,327 @@
+#   IronBox DX control-plane requests
+#
+#   The routes, bodies and error messages of the control-plane calls, and the
+#   rules deciding how a call is sent (response cache, coalescing of reads,
+#   invalidation by writes, retries), shared by IronBoxDXRESTClient and
+#   AsyncIronBoxDXRESTClient so both clients send the same requests
+#
+#   Revision History:
+#   -----------------
+#       10/16/2026  - v2.0: Initial release
+#
+import collections
+import itertools
+import json
+
+from .IronBoxDXRoutes import (
+    READ_ONLY_ROUTES
+)
+
+# A control-plane call, the body is serialized as JSON and the error message
+# is given to the IronBoxDXRequestError raised when the call fails
+ControlPlaneRequest = collections.namedtuple("ControlPlaneRequest", ["route", "body", "errorMessage"])
+
+
+#------------------------------------------------------------------------------
+#   Decides how the control-plane calls of a client are sent
+#
+#   Read-only calls are answered from the response cache when possible and
+#   identical reads in flight at the same time can share a single call, their
+#   coalescing key includes the write generation so a read sent after a write
+#   completed never shares a call started before it. Every other call starts
+#   a new write generation and drops the cached responses it makes stale
+#------------------------------------------------------------------------------
+class ControlPlaneRouter():
+
+    def __init__(self, retryPolicy, responseCache = None):
+        self.__retryPolicy = retryPolicy                # Retry policy and budget of the client
+        self.__responseCache = responseCache            # Optional ResponseCache of read-only responses
+        self.__writeGenerations = itertools.count(1)    # Source of the write generations, next() is atomic so concurrent writes never share one
+        self.__writeGeneration = 0                      # Replaced after every request that isn't read-only, part of the coalescing key
+        return
+
+    # Indicates if a route only reads state
+    def isReadOnly(self, route):
+        return route in READ_ONLY_ROUTES
+
+    # Returns (hit, response, generation) for a request about to be sent, the
+    # generation is given back to putCachedResponse, it's None when the route
+    # isn't cached
+    def getCachedResponse(self, request):
+        if (self.__responseCache is None) or not self.__responseCache.isCacheable(request.route):
+            return False, None, None
+        generation = self.__responseCache.getGeneration()
+        hit, response = self.__responseCache.get(request.route, request.body)
+        return hit, response, generation
+
+    # Caches the response of a request, unless an invalidation happened since
+    # getCachedResponse returned its generation
+    def putCachedResponse(self, request, response, generation):
+        if generation is not None:
+            self.__responseCache.put(request.route, request.body, response, generation)
+
+    # Returns the key shared by identical read-only requests sent in the same
+    # write generation
+    def getCoalescingKey(self, request):
+        return (request.route, json.dumps(request.body, sort_keys=True), self.__writeGeneration)
+
+    # Records a request that isn't read-only once it completed or failed
+    def recordWrite(self, request):
+        self.__writeGeneration = next(self.__writeGenerations)
+        if self.__responseCache is not None:
+            self.__responseCache.invalidate(request.route, request.body)
+
+    #--------------------------------------------------------------------------
+    #   Returns the number of seconds to wait before sending a request again,
+    #   or None when it fails, see RetryPolicy.getRetryDelay. notSent tells
+    #   the request never reached the server, it's then safe to send again
+    #   on any route
+    #--------------------------------------------------------------------------
+    def getRetryDelay(self, request, retryCount, statusCode = None, retryAfter = None, notSent = False):
+        idempotent = notSent or self.__retryPolicy.isIdempotent(request.route)
+        return self.__retryPolicy.getRetryDelay(retryCount, statusCode, retryAfter, idempotent)
+
+    # Records a request that completed without needing a further retry
+    def recordCompletion(self):
+        self.__retryPolicy.recordCompletion()
+
+
+# Returns the parsed JSON of a successful response body, None when it's empty
+def parseResponseContent(content):
+    if not content.strip():
+        return None
+    return json.loads(content)
+
+
+#------------------------------------------------------------------------------
+#   SSE blobs
+#------------------------------------------------------------------------------
+def initializeSSEBlobRequest(containerPublicID, blobName, blobDescription = "", containerAccessPassword = ""):
+    return ControlPlaneRequest("dx/cloud/sse/blob/initialize/api", {
+        "containerPublicID" : containerPublicID,
+        "blobName" : blobName,
+        "blobDescription" : blobDescription,
+        "containerAccessPassword" : containerAccessPassword
+    }, "Unable to initialize SSE blob")
+
+def finalizeSSEBlobRequest(finalizeToken, blobPublicID, blobSizeBytes):
+    return ControlPlaneRequest("dx/cloud/sse/blob/finalize/api", {
+        "finalizeToken" : finalizeToken,
+        "blobPublicID" : blobPublicID,
+        "originalSizeBytes" : blobSizeBytes
+    }, "Unable to finalize SSE blob")
+
+def listSSEContainerBlobsRequest(containerPublicID, skipPastNumItems = 0, takeNumItems = 500, state = 1):
+    return ControlPlaneRequest("dx/cloud/sse/blob/get/api", {
+        "containerPublicID" : containerPublicID,
+        "skipPastNumItems" : skipPastNumItems,
+        "takeNumItems" : takeNumItems,
+        "state" : state
+    }, "Unable to list server-side encrypted blobs")
+
+def deleteSSEContainerBlobRequest(blobPublicID):
+    return ControlPlaneRequest("dx/cloud/sse/blob/delete/api", {
+        "blobPublicID" : blobPublicID
+    }, "Unable to delete server-side encrypted blob")
+
+def downloadSSEBlobRequest(blobPublicID):
+    return ControlPlaneRequest("dx/cloud/sse/blob/download/api", {
+        "blobPublicID" : blobPublicID
+    }, "Unable to download SSE blob")
+
+
+#------------------------------------------------------------------------------
+#   Storage endpoints and SSE containers
+#------------------------------------------------------------------------------
+def listStorageEndpointsRequest():
+    return ControlPlaneRequest("dx/storage/list/api", {
+    }, "Unable to get list of accessible storage endpoints")
+
+def createSSEContainerRequest(name, storageEndpointPublicID, description = "", anonymousAccessEnabled = False, anonymousAccessPassword = "", humanReadableID = ""):
+    return ControlPlaneRequest("dx/cloud/sse/container/create/api", {
+        "name" : name,
+        "description" : description,
+        "anonymousAccessEnabled" : anonymousAccessEnabled,
+        "anonymousAccessPassword" : anonymousAccessPassword,
+        "cloudStorageEndpointPublicID" : storageEndpointPublicID,
+        "humanReadableID" : humanReadableID
+    }, "Unable to create SSE container")
+
+def deleteSSEContainerRequest(containerPublicID):
+    return ControlPlaneRequest("dx/cloud/sse/container/delete/api", {
+        "containerPublicID" : containerPublicID
+    }, "Unable to delete SSE container")
+
+def listSSEContainersRequest(includeContainersQueuedForDelete = False):
+    return ControlPlaneRequest("dx/cloud/sse/containers/get/api", {
+        "includeContainersQueuedForDelete" : includeContainersQueuedForDelete
+    }, "Unable to list server-side encrypted containers")
+
+
+#------------------------------------------------------------------------------
+#   Container notifications and SSE container ACLs
+#------------------------------------------------------------------------------
+def getContainerNotificationSettingsRequest(containerPublicID):
+    return ControlPlaneRequest("dx/cloud/container/notification/get/api", {
+        "containerPublicID" : containerPublicID
+    }, "Unable to read container notification settings")
+
+def setContainerNotificationSettingsRequest(containerPublicID, uploadNotificationList, downloadNotificationList):
+    return ControlPlaneRequest("dx/cloud/container/notification/set/api", {
+        "containerPublicID" : containerPublicID,
+        "uploadNotificationList" : uploadNotificationList,
+        "downloadNotificationList" : downloadNotificationList
+    }, "Unable to set container notification settings")
+
+def addUserToSSEContainerACLsRequest(containerPublicID, userEmail, canRead, canWrite, isAdmin, enabled, availableUtc = "", expiresUtc = ""):
+    return ControlPlaneRequest("dx/cloud/sse/containers/acl/add/api", {
+        "containerPublicID" : containerPublicID,
+        "userEmail" : userEmail,
+        "canRead" : canRead,
+        "canWrite" : canWrite,
+        "isAdmin" : isAdmin,
+        "enabled" : enabled,
+        "availableUtc" : availableUtc,
+        "expiresUtc" : expiresUtc
+    }, "Unable to add user to server-side encrypted container ACLs")
+
+def addCustomSecurityGroupToSSEContainerACLsRequest(containerPublicID, customSecurityGroupPublicID, canRead, canWrite, isAdmin, enabled, availableUtc = "", expiresUtc = ""):
+    return ControlPlaneRequest("dx/cloud/sse/containers/acl/secgroups/custom/add/api", {
+        "containerPublicID" : containerPublicID,
+        "customSecurityGroupPublicID" : customSecurityGroupPublicID,
+        "canRead" : canRead,
+        "canWrite" : canWrite,
+        "isAdmin" : isAdmin,
+        "enabled" : enabled,
+        "availableUtc" : availableUtc,
+        "expiresUtc" : expiresUtc
+    }, "Unable to add custom security group to server-side encrypted container ACLs")
+
+def deleteSSEContainerACLRequest(containerPublicID, membershipPublicID):
+    return ControlPlaneRequest("dx/cloud/sse/containers/acl/delete/api", {
+        "containerPublicID" : containerPublicID,
+        "membershipPublicID" : membershipPublicID
+    }, "Unable to remove server-side encrypted container ACL")
+
+def listSSEContainerACLsRequest(containerPublicID):
+    return ControlPlaneRequest("dx/cloud/sse/containers/acl/list/api", {
+        "publicID" : containerPublicID
+    }, "Unable to read server-side encrypted container ACLs")
+
+
+#------------------------------------------------------------------------------
+#   Management, the API key owner must be an administrator of the organization
+#------------------------------------------------------------------------------
+def readContainerMetaDataRequest(containerPublicID):
+    return ControlPlaneRequest("dx/management/container/metadata/api", {
+        "containerPublicID" : containerPublicID
+    }, "Unable to read meta data for blob")
+
+def setEntityOrganizationMembershipStatusRequest(memberEmail, enabled):
+    return ControlPlaneRequest("dx/management/organization/entities/membership/status/set/api", {
+        "memberEmail" : memberEmail,
+        "enabled" : enabled
+    }, "Unable to set organization user status")
+
+def createOrganizationEntityRequest(memberEmail, memberPassword, enabled):
+    return ControlPlaneRequest("dx/management/organization/entities/create/api", {
+        "email" : memberEmail,
+        "password" : memberPassword,
+        "enabled" : enabled
+    }, "Unable to create organization entity")
+
+def listOrganizationMemberEntitiesRequest(skipPastNumItems = 0, takeNumItems = -1):
+    return ControlPlaneRequest("dx/management/organization/entities/api", {
+        "skipPastNumItems" : skipPastNumItems,
+        "takeNumItems" : takeNumItems
+    }, "Unable to list organization member entities")
+
+def readOrganizationMemberEntityMetadataRequest(memberPublicID):
+    return ControlPlaneRequest("dx/management/organization/entities/metadata/api", {
+        "memberPublicID" : memberPublicID
+    }, "Unable to read organization member entity metadata")
+
+def setContainerDataTtlRequest(containerPublicID, containerDataTTLHours, containerDataTTLEnabled):
+    return ControlPlaneRequest("dx/management/container/datattl/api", {
+        "containerPublicID" : containerPublicID,
+        "containerDataTTLHours" : containerDataTTLHours,
+        "containerDataTTLEnabled" : containerDataTTLEnabled
+    }, "Unable to set container data ttl")
+
+def setContainerMetadataRequest(containerPublicID, metaDataTarget, metaDataValue):
+    return ControlPlaneRequest("dx/management/container/metadata/set/api", {
+        "containerPublicID" : containerPublicID,
+        "metaDataTarget" : metaDataTarget,
+        "metaDataValue" : metaDataValue
+    }, "Unable to set container metadata")
+
+def createCustomSecurityGroupRequest(name, enabled):
+    return ControlPlaneRequest("dx/management/organization/secgroups/custom/create/api", {
+        "name" : name,
+        "enabled" : enabled
+    }, "Unable to create custom security group")
+
+def deleteCustomSecurityGroupRequest(publicID):
+    return ControlPlaneRequest("dx/management/organization/secgroups/custom/delete/api", {
+        "publicID" : publicID
+    }, "Unable to delete custom security group")
+
+def updateCustomSecurityGroupRequest(publicID, name, enabled):
+    return ControlPlaneRequest("dx/management/organization/secgroups/custom/update/api", {
+        "publicID" : publicID,
+        "name" : name,
+        "enabled" : enabled
+    }, "Unable to update custom security group")
+
+def addMemberToCustomSecurityGroupRequest(publicID, memberEmail):
+    return ControlPlaneRequest("dx/management/organization/secgroups/custom/addmember/api", {
+        "publicID" : publicID,
+        "memberEmail" : memberEmail
+    }, "Unable to add member to custom security group")
+
+def removeMemberFromCustomSecurityGroupRequest(publicID, memberEmail):
+    return ControlPlaneRequest("dx/management/organization/secgroups/custom/removemember/api", {
+        "publicID" : publicID,
+        "memberEmail" : memberEmail
+    }, "Unable to remove member from custom security group")
+
+def listCustomSecurityGroupsRequest():
+    return ControlPlaneRequest("dx/management/organization/secgroups/custom/api", {
+        # No body required for this call
+    }, "Unable to list custom security groups")
+
+def readCustomSecurityGroupRequest(publicID):
+    return ControlPlaneRequest("dx/management/organization/secgroups/custom/read/api", {
+        "publicID" : publicID
+    }, "Unable to read custom security group")
+
+def readContainerLinkBasedAccessSettingsRequest(publicID):
+    return ControlPlaneRequest("dx/management/container/settings/linkbased/api", {
+        "publicID" : publicID
+    }, "Unable to read container link-based settings")
+
+def setContainerLinkBasedAccessSettingsRequest(publicID, enabled, canRead, canWrite, accessPassword):
+    return ControlPlaneRequest("dx/management/container/settings/linkbased/set/api", {
+        "publicID" : publicID,
+        "enabled" : enabled,
+        "canRead" : canRead,
+        "canWrite" : canWrite,
+        "accessPassword" : accessPassword
+    }, "Unable to set container link-based settings")
+
+def addMemberToBuiltInSecurityGroupRequest(groupName, memberEmail):
+    return ControlPlaneRequest("dx/management/organization/secgroups/builtin/addmember/api", {
+        "groupName" : groupName,
+        "memberEmail" : memberEmail,
+    }, "Unable to add member to built-in security group")
+
+def removeMemberFromBuiltInSecurityGroupRequest(groupName, memberEmail):
+    return ControlPlaneRequest("dx/management/organization/secgroups/builtin/removemember/api", {
+        "groupName" : groupName,
+        "memberEmail" : memberEmail,
+    }, "Unable to remove member from built-in security group")
+
+def readBuiltInSecurityGroupRequest(groupName):
+    return ControlPlaneRequest("dx/management/organization/secgroups/builtin/read/api", {
+        "groupName" : groupName
+    }, "Unable to read built-in security group")
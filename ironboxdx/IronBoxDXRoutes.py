@@ -0,0 +1,119 @@
+#   IronBox DX REST route classification
+#
+#   Revision History:
+#   -----------------
+#       10/16/2026  - v2.0: Initial release, read-only and idempotent route sets used by the retry policy,
+#                           response cache time to live and write invalidation rules
+#
+
+# Routes that only read state, sending them again has no side effect
+READ_ONLY_ROUTES = frozenset([
+    "dx/storage/list/api",
+    "dx/cloud/sse/containers/get/api",
+    "dx/cloud/sse/blob/get/api",
+    "dx/cloud/container/notification/get/api",
+    "dx/cloud/sse/containers/acl/list/api",
+    "dx/management/container/metadata/api",
+    "dx/management/organization/entities/api",
+    "dx/management/organization/entities/metadata/api",
+    "dx/management/organization/secgroups/custom/api",
+    "dx/management/organization/secgroups/custom/read/api",
+    "dx/management/container/settings/linkbased/api",
+    "dx/management/organization/secgroups/builtin/read/api",
+])
+
+# Routes that can safely be sent more than once, the read-only routes plus the
+# routes that set state to the given value and the download route, which only
+# issues a new shared access signature
+IDEMPOTENT_ROUTES = READ_ONLY_ROUTES | frozenset([
+    "dx/cloud/sse/blob/download/api",
+    "dx/cloud/container/notification/set/api",
+    "dx/management/organization/entities/membership/status/set/api",
+    "dx/management/container/datattl/api",
+    "dx/management/container/metadata/set/api",
+    "dx/management/container/settings/linkbased/set/api",
+])
+
+# Default number of seconds the responses of cacheable read routes are kept
+# by ResponseCache
+DEFAULT_CACHE_TTL_SECONDS = {
+    "dx/storage/list/api" : 300,
+    "dx/cloud/sse/containers/get/api" : 30,
+    "dx/management/container/metadata/api" : 30,
+    "dx/management/organization/secgroups/custom/read/api" : 30,
+    "dx/management/organization/secgroups/builtin/read/api" : 30,
+    "dx/cloud/sse/containers/acl/list/api" : 30,
+}
+
+# Cached read responses made stale by each write route, as (read route, read
+# body field, write body field) rules. A rule drops the cached responses of the
+# read route whose read body field equals the write body field, or every
+# response of the read route when the fields are None
+WRITE_INVALIDATIONS = {
+    "dx/cloud/sse/container/create/api" : [
+        ("dx/cloud/sse/containers/get/api", None, None),
+    ],
+    "dx/cloud/sse/container/delete/api" : [
+        ("dx/cloud/sse/containers/get/api", None, None),
+        ("dx/cloud/sse/containers/acl/list/api", "publicID", "containerPublicID"),
+        ("dx/management/container/metadata/api", "containerPublicID", "containerPublicID"),
+    ],
+    "dx/cloud/sse/containers/acl/add/api" : [
+        ("dx/cloud/sse/containers/get/api", None, None),
+        ("dx/cloud/sse/containers/acl/list/api", "publicID", "containerPublicID"),
+        ("dx/management/container/metadata/api", "containerPublicID", "containerPublicID"),
+    ],
+    "dx/cloud/sse/containers/acl/secgroups/custom/add/api" : [
+        ("dx/cloud/sse/containers/get/api", None, None),
+        ("dx/cloud/sse/containers/acl/list/api", "publicID", "containerPublicID"),
+        ("dx/management/container/metadata/api", "containerPublicID", "containerPublicID"),
+    ],
+    "dx/cloud/sse/containers/acl/delete/api" : [
+        ("dx/cloud/sse/containers/get/api", None, None),
+        ("dx/cloud/sse/containers/acl/list/api", "publicID", "containerPublicID"),
+        ("dx/management/container/metadata/api", "containerPublicID", "containerPublicID"),
+    ],
+    "dx/cloud/container/notification/set/api" : [
+        ("dx/management/container/metadata/api", "containerPublicID", "containerPublicID"),
+    ],
+    "dx/management/container/datattl/api" : [
+        ("dx/management/container/metadata/api", "containerPublicID", "containerPublicID"),
+    ],
+    "dx/management/container/metadata/set/api" : [
+        ("dx/cloud/sse/containers/get/api", None, None),
+        ("dx/management/container/metadata/api", "containerPublicID", "containerPublicID"),
+    ],
+    "dx/management/container/settings/linkbased/set/api" : [
+        ("dx/management/container/metadata/api", "containerPublicID", "publicID"),
+    ],
+    "dx/management/organization/entities/membership/status/set/api" : [
+        ("dx/cloud/sse/containers/acl/list/api", None, None),
+        ("dx/management/organization/secgroups/custom/read/api", None, None),
+        ("dx/management/organization/secgroups/builtin/read/api", None, None),
+    ],
+    "dx/management/organization/secgroups/custom/update/api" : [
+        ("dx/cloud/sse/containers/acl/list/api", None, None),
+        ("dx/management/organization/secgroups/custom/read/api", "publicID", "publicID"),
+    ],
+    "dx/management/organization/secgroups/custom/delete/api" : [
+        ("dx/cloud/sse/containers/get/api", None, None),
+        ("dx/cloud/sse/containers/acl/list/api", None, None),
+        ("dx/management/organization/secgroups/custom/read/api", "publicID", "publicID"),
+    ],
+    "dx/management/organization/secgroups/custom/addmember/api" : [
+        ("dx/cloud/sse/containers/get/api", None, None),
+        ("dx/management/organization/secgroups/custom/read/api", "publicID", "publicID"),
+    ],
+    "dx/management/organization/secgroups/custom/removemember/api" : [
+        ("dx/cloud/sse/containers/get/api", None, None),
+        ("dx/management/organization/secgroups/custom/read/api", "publicID", "publicID"),
+    ],
+    "dx/management/organization/secgroups/builtin/addmember/api" : [
+        ("dx/cloud/sse/containers/get/api", None, None),
+        ("dx/management/organization/secgroups/builtin/read/api", "groupName", "groupName"),
+    ],
+    "dx/management/organization/secgroups/builtin/removemember/api" : [
+        ("dx/cloud/sse/containers/get/api", None, None),
+        ("dx/management/organization/secgroups/builtin/read/api", "groupName", "groupName"),
+    ],
+}
@@ -0,0 +1,245 @@
+#   IronBox DX client metrics
+#
+#   An instrumentation hook that keeps request counters and latency
+#   histograms per route, for the IronBox DX routes and the data-plane block
+#   operations of transfers. The metrics can be read as a dictionary snapshot
+#   or exported in the OpenMetrics text format scraped by Prometheus
+#
+#   Latency percentiles are estimated from logarithmic buckets, within
+#   LATENCY_PRECISION of the measured value, so memory doesn't grow with the
+#   number of requests
+#
+#   Revision History:
+#   -----------------
+#       10/16/2026  - v2.0: Initial release
+#
+#   Additional Information:
+#   -----------------------
+#       https://github.com/OpenObservability/OpenMetrics/blob/main/specification/OpenMetrics.md
+#
+import math
+import threading
+
+from .Instrumentation import (
+    InstrumentationHook
+)
+
+LATENCY_PRECISION = 0.05                        # Relative error of the latency percentiles
+LATENCY_MIN_SECONDS = 0.0001                    # Latencies below this fall in the first bucket
+LATENCY_PERCENTILES = (0.5, 0.95, 0.99)         # Percentiles reported by snapshots and exports
+
+# Upper bounds of the latency histogram buckets exported to OpenMetrics
+OPENMETRICS_LATENCY_BUCKETS_SECONDS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+
+
+class LatencyHistogram():
+
+    def __init__(self):
+        self.count = 0                                  # Number of latencies recorded
+        self.sumSeconds = 0.0                           # Sum of the latencies recorded
+        self.maxSeconds = 0.0                           # Largest latency recorded
+        self.__buckets = {}                             # Logarithmic bucket index to number of latencies
+        self.__exportCounts = [0] * len(OPENMETRICS_LATENCY_BUCKETS_SECONDS)   # Number of latencies within each exported bucket bound
+        return
+
+    def record(self, latencySeconds):
+        self.count += 1
+        self.sumSeconds += latencySeconds
+        self.maxSeconds = max(self.maxSeconds, latencySeconds)
+        index = 0
+        if latencySeconds > LATENCY_MIN_SECONDS:
+            index = int(math.log(latencySeconds / LATENCY_MIN_SECONDS) / math.log1p(2 * LATENCY_PRECISION)) + 1
+        self.__buckets[index] = self.__buckets.get(index, 0) + 1
+        for position, bound in enumerate(OPENMETRICS_LATENCY_BUCKETS_SECONDS):
+            if latencySeconds <= bound:
+                self.__exportCounts[position] += 1
+                break
+
+    #--------------------------------------------------------------------------
+    #   Returns the estimated latency below which the given fraction (0 to 1)
+    #   of the recorded latencies fall, None if nothing was recorded
+    #--------------------------------------------------------------------------
+    def getPercentile(self, fraction):
+        if self.count == 0:
+            return None
+        rank = max(1, math.ceil(fraction * self.count))
+        seen = 0
+        for index in sorted(self.__buckets):
+            seen += self.__buckets[index]
+            if seen >= rank:
+                if index == 0:
+                    return LATENCY_MIN_SECONDS
+                # Middle of the bucket, capped to the largest latency seen
+                return min(self.maxSeconds, LATENCY_MIN_SECONDS * ((1 + 2 * LATENCY_PRECISION) ** (index - 0.5)))
+        return self.maxSeconds
+
+    # Returns (upper bound, cumulative count) pairs of the exported buckets,
+    # ending with the +Inf bucket
+    def getExportBuckets(self):
+        buckets = []
+        cumulativeCount = 0
+        for bound, count in zip(OPENMETRICS_LATENCY_BUCKETS_SECONDS, self.__exportCounts):
+            cumulativeCount += count
+            buckets.append((bound, cumulativeCount))
+        buckets.append((math.inf, self.count))
+        return buckets
+
+
+class RouteMetrics():
+
+    def __init__(self, route, plane):
+        self.route = route                              # IronBox DX route, or storage/... data-plane route
+        self.plane = plane                              # CONTROL_PLANE or DATA_PLANE
+        self.requestCount = 0                           # Number of requests completed, successful or not
+        self.errorCount = 0                             # Number of failed requests
+        self.errorsByStatusCode = {}                    # HTTP status code, or None when no response was received, to number of failed requests
+        self.retryCount = 0                             # Number of retries sent
+        self.requestBytes = 0                           # Bytes sent in request bodies
+        self.responseBytes = 0                          # Bytes received in response bodies
+        self.latency = LatencyHistogram()               # Latency of every request, including retries
+        return
+
+    # Bytes moved per second spent in requests of this route, concurrent
+    # requests each count their own time
+    def getBytesPerSecond(self):
+        if self.latency.sumSeconds <= 0:
+            return 0.0
+        return (self.requestBytes + self.responseBytes) / self.latency.sumSeconds
+
+
+class MetricsRegistry(InstrumentationHook):
+
+    #--------------------------------------------------------------------------
+    #   Give the registry to a client with its metricsRegistry argument, or
+    #   among its instrumentation hooks. A registry can be shared by several
+    #   clients, the metrics of their routes are then combined
+    #--------------------------------------------------------------------------
+    def __init__(self, namespace = "ironboxdx"):
+        self.namespace = namespace                      # Prefix of the exported metric names
+        self.__routes = {}                              # Route to RouteMetrics
+        self.__lock = threading.Lock()
+        return
+
+    def onRequestEnd(self, event):
+        with self.__lock:
+            metrics = self.__routes.get(event.route)
+            if metrics is None:
+                metrics = self.__routes[event.route] = RouteMetrics(event.route, event.plane)
+            metrics.requestCount += 1
+            metrics.retryCount += event.retryCount
+            metrics.requestBytes += event.requestBytes
+            metrics.responseBytes += event.responseBytes
+            metrics.latency.record(event.latencySeconds)
+            if event.error is not None:
+                metrics.errorCount += 1
+                metrics.errorsByStatusCode[event.statusCode] = metrics.errorsByStatusCode.get(event.statusCode, 0) + 1
+
+    # Drops every metric
+    def reset(self):
+        with self.__lock:
+            self.__routes.clear()
+
+    #--------------------------------------------------------------------------
+    #   Returns the metrics as a dictionary of route to a dictionary with these
+    #   keys, latencies are in seconds:
+    #
+    #       plane, requestCount, errorCount, errorsByStatusCode, retryCount,
+    #       requestBytes, responseBytes, bytesPerSecond, latency
+    #
+    #   latency holds count, mean, max, p50, p95 and p99
+    #--------------------------------------------------------------------------
+    def snapshot(self):
+        with self.__lock:
+            snapshot = {}
+            for route, metrics in self.__routes.items():
+                latency = {
+                    "count" : metrics.latency.count,
+                    "mean" : metrics.latency.sumSeconds / metrics.latency.count if metrics.latency.count else None,
+                    "max" : metrics.latency.maxSeconds
+                }
+                for fraction in LATENCY_PERCENTILES:
+                    latency["p{:g}".format(fraction * 100)] = metrics.latency.getPercentile(fraction)
+                snapshot[route] = {
+                    "plane" : metrics.plane,
+                    "requestCount" : metrics.requestCount,
+                    "errorCount" : metrics.errorCount,
+                    "errorsByStatusCode" : dict(metrics.errorsByStatusCode),
+                    "retryCount" : metrics.retryCount,
+                    "requestBytes" : metrics.requestBytes,
+                    "responseBytes" : metrics.responseBytes,
+                    "bytesPerSecond" : metrics.getBytesPerSecond(),
+                    "latency" : latency
+                }
+            return snapshot
+
+    #--------------------------------------------------------------------------
+    #   Returns the metrics in the OpenMetrics text format, also accepted by
+    #   Prometheus scrapers. Latencies are exported both as a histogram, which
+    #   can be aggregated across processes, and as a summary holding the
+    #   percentiles estimated by this client
+    #--------------------------------------------------------------------------
+    def toOpenMetrics(self):
+        prefix = self.namespace
+        lines = []
+        with self.__lock:
+            routes = sorted(self.__routes.values(), key=lambda metrics: metrics.route)
+
+            lines.append("# TYPE {}_requests counter".format(prefix))
+            lines.append("# HELP {}_requests Requests completed, successful or not.".format(prefix))
+            for metrics in routes:
+                lines.append("{}_requests_total{} {}".format(prefix, self.__labels(metrics), metrics.requestCount))
+
+            lines.append("# TYPE {}_request_errors counter".format(prefix))
+            lines.append("# HELP {}_request_errors Failed requests by HTTP status code, none when no response was received.".format(prefix))
+            for metrics in routes:
+                for statusCode, count in sorted(metrics.errorsByStatusCode.items(), key=lambda item: str(item[0])):
+                    lines.append("{}_request_errors_total{} {}".format(prefix, self.__labels(metrics, status="none" if statusCode is None else str(statusCode)), count))
+
+            lines.append("# TYPE {}_request_retries counter".format(prefix))
+            lines.append("# HELP {}_request_retries Retries sent.".format(prefix))
+            for metrics in routes:
+                lines.append("{}_request_retries_total{} {}".format(prefix, self.__labels(metrics), metrics.retryCount))
+
+            lines.append("# TYPE {}_transferred_bytes counter".format(prefix))
+            lines.append("# HELP {}_transferred_bytes Bytes of request and response bodies.".format(prefix))
+            lines.append("# UNIT {}_transferred_bytes bytes".format(prefix))
+            for metrics in routes:
+                lines.append("{}_transferred_bytes_total{} {}".format(prefix, self.__labels(metrics, direction="sent"), metrics.requestBytes))
+                lines.append("{}_transferred_bytes_total{} {}".format(prefix, self.__labels(metrics, direction="received"), metrics.responseBytes))
+
+            lines.append("# TYPE {}_request_throughput_bytes_per_second gauge".format(prefix))
+            lines.append("# HELP {}_request_throughput_bytes_per_second Bytes moved per second spent in requests.".format(prefix))
+            for metrics in routes:
+                lines.append("{}_request_throughput_bytes_per_second{} {}".format(prefix, self.__labels(metrics), self.__number(metrics.getBytesPerSecond())))
+
+            lines.append("# TYPE {}_request_duration_seconds histogram".format(prefix))
+            lines.append("# HELP {}_request_duration_seconds Request latency including retries.".format(prefix))
+            lines.append("# UNIT {}_request_duration_seconds seconds".format(prefix))
+            for metrics in routes:
+                for bound, count in metrics.latency.getExportBuckets():
+                    lines.append("{}_request_duration_seconds_bucket{} {}".format(prefix, self.__labels(metrics, le="+Inf" if bound == math.inf else self.__number(bound)), count))
+                lines.append("{}_request_duration_seconds_sum{} {}".format(prefix, self.__labels(metrics), self.__number(metrics.latency.sumSeconds)))
+                lines.append("{}_request_duration_seconds_count{} {}".format(prefix, self.__labels(metrics), metrics.latency.count))
+
+            lines.append("# TYPE {}_request_latency_seconds summary".format(prefix))
+            lines.append("# HELP {}_request_latency_seconds Request latency percentiles estimated by the client.".format(prefix))
+            lines.append("# UNIT {}_request_latency_seconds seconds".format(prefix))
+            for metrics in routes:
+                for fraction in LATENCY_PERCENTILES:
+                    lines.append("{}_request_latency_seconds{} {}".format(prefix, self.__labels(metrics, quantile=self.__number(fraction)), self.__number(metrics.latency.getPercentile(fraction))))
+                lines.append("{}_request_latency_seconds_sum{} {}".format(prefix, self.__labels(metrics), self.__number(metrics.latency.sumSeconds)))
+                lines.append("{}_request_latency_seconds_count{} {}".format(prefix, self.__labels(metrics), metrics.latency.count))
+
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    # Formats the label set of a route with optional extra labels
+    def __labels(self, metrics, **extraLabels):
+        labels = [("route", metrics.route), ("plane", metrics.plane)] + list(extraLabels.items())
+        return "{" + ",".join('{}="{}"'.format(name, self.__escape(value)) for name, value in labels) + "}"
+
+    def __escape(self, value):
+        return value.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+    def __number(self, value):
+        return "NaN" if value is None else repr(float(value))
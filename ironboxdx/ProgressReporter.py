@@ -0,0 +1,328 @@
+#   IronBox DX transfer progress reporting
+#
+#   A progress reporter follows the transfers of a job, a single upload or
+#   download, or every file of a bulk directory upload or container download.
+#   Transfer workers only record the number of bytes moved, a background
+#   thread reads them every intervalSeconds and calls the callback of the
+#   reporter with a ProgressEvent aggregating the whole job, so slow
+#   callbacks and terminal output never hold up the transfers. Bulk jobs plan
+#   their transfers before they start, so the size and ETA of an event cover
+#   the transfers still queued as well as those in flight
+#
+#   ConsoleProgressBar is a ready made callback drawing a progress bar on a
+#   terminal
+#
+#   Revision History:
+#   -----------------
+#       10/16/2026  - v2.0: Initial release
+#
+import contextlib
+import copy
+import sys
+import threading
+import time
+import warnings
+
+UPLOAD_DIRECTION = "upload"                     # Direction of the transfers sending data to cloud storage
+DOWNLOAD_DIRECTION = "download"                 # Direction of the transfers reading data from cloud storage
+
+DEFAULT_PROGRESS_INTERVAL_SECONDS = 0.5         # Default time between two progress events
+THROUGHPUT_SMOOTHING = 0.3                      # Weight of the latest interval in the smoothed throughput of a transfer
+
+
+class TransferProgress():
+
+    #--------------------------------------------------------------------------
+    #   Progress of a single transfer. Instances are callable with
+    #   (transferredBytes, totalBytes), the progress callback signature of
+    #   BlockTransferEngine, which only stores the two numbers
+    #--------------------------------------------------------------------------
+    def __init__(self, name, direction, totalBytes = None):
+        self.name = name                                # Blob name, or blob public ID when the name isn't known
+        self.direction = direction                      # UPLOAD_DIRECTION or DOWNLOAD_DIRECTION
+        self.totalBytes = totalBytes                    # Size of the transfer, None until it's known (streams)
+        self.transferredBytes = 0                       # Bytes transferred so far
+        self.startTime = time.monotonic()               # Monotonic time the transfer started
+        self.bytesPerSecond = 0.0                       # Smoothed throughput, updated before each progress event
+        self.__sampleTime = self.startTime              # Monotonic time of the previous throughput sample
+        self.__sampleBytes = 0                          # Bytes transferred at the previous throughput sample
+        self.__sampled = False                          # Indicates if the throughput was sampled before
+        return
+
+    def __call__(self, transferredBytes, totalBytes = None):
+        self.transferredBytes = transferredBytes
+        if totalBytes is not None:
+            self.totalBytes = totalBytes
+
+    # Estimated seconds left, None when the size or throughput isn't known
+    @property
+    def etaSeconds(self):
+        if (self.totalBytes is None) or (self.bytesPerSecond <= 0):
+            return None
+        return max(0, self.totalBytes - self.transferredBytes) / self.bytesPerSecond
+
+    # Updates bytesPerSecond from the bytes transferred since the previous
+    # sample, the first sample averages from the start of the transfer
+    def sampleThroughput(self, now):
+        elapsedSeconds = now - self.__sampleTime
+        if elapsedSeconds <= 0:
+            return
+        transferredBytes = self.transferredBytes
+        bytesPerSecond = (transferredBytes - self.__sampleBytes) / elapsedSeconds
+        if self.__sampled:
+            self.bytesPerSecond += THROUGHPUT_SMOOTHING * (bytesPerSecond - self.bytesPerSecond)
+        else:
+            self.bytesPerSecond = bytesPerSecond
+            self.__sampled = True
+        self.__sampleTime = now
+        self.__sampleBytes = transferredBytes
+
+
+class ProgressEvent():
+
+    def __init__(self, transfers, direction, completedCount, failedCount, completedBytes, pendingCount, remainingBytes, remainingBytesEstimated, bytesPerSecond, elapsedSeconds, final):
+        self.transfers = transfers                      # Copies of the TransferProgress of the transfers in flight, in start order
+        self.direction = direction                      # Direction of every transfer of the job, None when the job has both
+        self.completedCount = completedCount            # Number of transfers that succeeded
+        self.failedCount = failedCount                  # Number of transfers that failed
+        self.pendingCount = pendingCount                # Number of planned transfers that haven't started yet
+        self.elapsedSeconds = elapsedSeconds            # Seconds since the first transfer of the job started
+        self.final = final                              # True for the last event of the job, sent once every transfer ended
+        self.transferredBytes = completedBytes + sum(transfer.transferredBytes for transfer in transfers)   # Bytes transferred by the job so far
+        self.bytesPerSecond = bytesPerSecond            # Smoothed throughput of the job
+        self.totalBytes = None                          # Bytes the job will have transferred once every transfer ended, None if a size isn't known
+        self.etaSeconds = None                          # Estimated seconds until every transfer of the job ended, None if it can't be estimated
+        if remainingBytes is not None:
+            if not remainingBytesEstimated:
+                self.totalBytes = self.transferredBytes + remainingBytes
+            if remainingBytes == 0:
+                self.etaSeconds = 0.0
+            elif self.bytesPerSecond > 0:
+                self.etaSeconds = remainingBytes / self.bytesPerSecond
+        return
+
+
+class ProgressReporter():
+
+    #--------------------------------------------------------------------------
+    #   Reports the progress of the transfers of a job to callback, called
+    #   with a ProgressEvent at most every intervalSeconds from a background
+    #   thread while transfers are in flight, then once more with a final
+    #   event when the reporter is closed. A reporter without a callback is
+    #   off, its transfers aren't tracked
+    #
+    #   The ETA is the remaining bytes of the job, in flight and planned, over
+    #   the smoothed throughput of the job. Transfers of unknown size are
+    #   counted at the average size of the transfers of known size
+    #
+    #   An exception raised by the callback is reported as a warning and
+    #   doesn't fail the transfers
+    #--------------------------------------------------------------------------
+    def __init__(self, callback = None, intervalSeconds = DEFAULT_PROGRESS_INTERVAL_SECONDS):
+        if intervalSeconds <= 0:
+            raise ValueError("intervalSeconds must be greater than zero")
+        self.callback = callback                        # Called with each ProgressEvent
+        self.intervalSeconds = intervalSeconds          # Minimum time between two progress events
+        self.__transfers = []                           # TransferProgress of the transfers in flight, in start order
+        self.__completedCount = 0
+        self.__failedCount = 0
+        self.__completedBytes = 0                       # Bytes transferred by the transfers that ended
+        self.__pendingCount = 0                         # Number of planned transfers that haven't started yet
+        self.__pendingBytes = 0                         # Total size of the planned transfers of known size that haven't started yet
+        self.__pendingUnknownCount = 0                  # Number of planned transfers of unknown size that haven't started yet
+        self.__endedSizedCount = 0                      # Number of transfers of known size that ended
+        self.__endedSizedBytes = 0                      # Total size of the transfers of known size that ended
+        self.__bytesPerSecond = 0.0                     # Smoothed throughput of the job
+        self.__sampleTime = None                        # Monotonic time of the previous throughput sample of the job
+        self.__sampleBytes = 0                          # Bytes transferred by the job at the previous throughput sample
+        self.__startTime = None                         # Monotonic time the first transfer started
+        self.__directions = set()                       # Directions of the transfers started
+        self.__changed = False                          # Indicates if a transfer started or ended since the last event
+        self.__stopped = threading.Event()
+        self.__thread = None
+        self.__lock = threading.Lock()
+        return
+
+    # Indicates if progress is reported
+    @property
+    def enabled(self):
+        return self.callback is not None
+
+    # Adds a transfer the job will run to the remaining bytes of the job,
+    # before it starts. The transfer must then be started with planned=True
+    # and the same totalBytes
+    def planTransfer(self, totalBytes = None):
+        if self.callback is None:
+            return
+        with self.__lock:
+            self.__addPending(totalBytes, 1)
+            self.__changed = True
+
+    #--------------------------------------------------------------------------
+    #   Context manager tracking a transfer of the job, yields the
+    #   TransferProgress to give as progress callback to the transfer engine,
+    #   None when the reporter is off. An exception leaving the block counts
+    #   the transfer as failed
+    #--------------------------------------------------------------------------
+    @contextlib.contextmanager
+    def transfer(self, name, direction, totalBytes = None, planned = False):
+        if self.callback is None:
+            yield None
+            return
+        transfer = TransferProgress(name, direction, totalBytes)
+        with self.__lock:
+            if self.__startTime is None:
+                self.__startTime = transfer.startTime
+            if planned:
+                self.__addPending(totalBytes, -1)
+            self.__transfers.append(transfer)
+            self.__directions.add(direction)
+            self.__changed = True
+            if self.__thread is None:
+                self.__thread = threading.Thread(target=self.__run, name="ironboxdx-progress", daemon=True)
+                self.__thread.start()
+        failed = False
+        try:
+            yield transfer
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            with self.__lock:
+                self.__transfers.remove(transfer)
+                self.__completedBytes += transfer.transferredBytes
+                if transfer.totalBytes is not None:
+                    self.__endedSizedCount += 1
+                    self.__endedSizedBytes += transfer.totalBytes
+                if failed:
+                    self.__failedCount += 1
+                else:
+                    self.__completedCount += 1
+                self.__changed = True
+
+    # Stops the reporting thread and sends the final event, if any transfer
+    # was tracked
+    def close(self):
+        with self.__lock:
+            thread = self.__thread
+        if thread is None:
+            return
+        self.__stopped.set()
+        thread.join()
+        self.__report(True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __run(self):
+        while not self.__stopped.wait(self.intervalSeconds):
+            self.__report(False)
+
+    def __addPending(self, totalBytes, count):
+        self.__pendingCount += count
+        if totalBytes is None:
+            self.__pendingUnknownCount += count
+        else:
+            self.__pendingBytes += totalBytes * count
+
+    def __report(self, final):
+        now = time.monotonic()
+        with self.__lock:
+            if not (self.__transfers or self.__changed or final):
+                return
+            self.__changed = False
+            transfers = list(self.__transfers)
+            completedCount, failedCount, completedBytes = self.__completedCount, self.__failedCount, self.__completedBytes
+            pendingCount, pendingBytes, pendingUnknownCount = self.__pendingCount, self.__pendingBytes, self.__pendingUnknownCount
+            sizedCount = self.__endedSizedCount + (pendingCount - pendingUnknownCount)
+            sizedBytes = self.__endedSizedBytes + pendingBytes
+            direction = next(iter(self.__directions)) if len(self.__directions) == 1 else None
+        for transfer in transfers:
+            transfer.sampleThroughput(now)
+        transferredBytes = completedBytes + sum(transfer.transferredBytes for transfer in transfers)
+        self.__sampleJobThroughput(now, transferredBytes)
+
+        # Bytes left in the transfers in flight and the planned ones, transfers of unknown size count for the
+        # average size of the others, None while no size is known
+        sizedTransfers = [transfer for transfer in transfers if transfer.totalBytes is not None]
+        unknownCount = pendingUnknownCount + len(transfers) - len(sizedTransfers)
+        sizedCount += len(sizedTransfers)
+        sizedBytes += sum(transfer.totalBytes for transfer in sizedTransfers)
+        remainingBytes = pendingBytes + sum(max(0, transfer.totalBytes - transfer.transferredBytes) for transfer in sizedTransfers)
+        if (unknownCount > 0) and (sizedCount == 0):
+            remainingBytes = None
+        elif unknownCount > 0:
+            unknownBytes = unknownCount * sizedBytes // sizedCount - sum(transfer.transferredBytes for transfer in transfers if transfer.totalBytes is None)
+            remainingBytes += max(0, unknownBytes)
+        event = ProgressEvent([copy.copy(transfer) for transfer in transfers], direction, completedCount, failedCount, completedBytes, pendingCount, remainingBytes, unknownCount > 0, self.__bytesPerSecond, now - self.__startTime, final)
+        try:
+            self.callback(event)
+        except Exception as e:
+            warnings.warn("Progress callback failed: {!r}".format(e), RuntimeWarning)
+
+    # Updates the smoothed throughput of the job from the bytes transferred
+    # since the previous report, the first sample averages from the start of
+    # the job. Reports only run on one thread at a time, the reporting thread
+    # then close()
+    def __sampleJobThroughput(self, now, transferredBytes):
+        previousTime = self.__sampleTime if self.__sampleTime is not None else self.__startTime
+        elapsedSeconds = now - previousTime
+        if elapsedSeconds <= 0:
+            return
+        bytesPerSecond = (transferredBytes - self.__sampleBytes) / elapsedSeconds
+        if self.__sampleTime is not None:
+            self.__bytesPerSecond += THROUGHPUT_SMOOTHING * (bytesPerSecond - self.__bytesPerSecond)
+        else:
+            self.__bytesPerSecond = bytesPerSecond
+        self.__sampleTime = now
+        self.__sampleBytes = transferredBytes
+
+
+class ConsoleProgressBar():
+
+    #--------------------------------------------------------------------------
+    #   Progress callback drawing a single line progress bar with the bytes
+    #   transferred, throughput and ETA of a job, redrawn in place on a
+    #   terminal stream
+    #--------------------------------------------------------------------------
+    def __init__(self, stream = None, width = 40):
+        self.stream = stream if stream is not None else sys.stdout     # Text stream the bar is drawn on
+        self.width = width                              # Number of characters of the bar
+        self.__lineLength = 0                           # Length of the line drawn last, cleared by the next one
+        return
+
+    def __call__(self, event):
+        label = { UPLOAD_DIRECTION : "Uploading", DOWNLOAD_DIRECTION : "Downloading" }.get(event.direction, "Transferring")
+        if event.totalBytes:
+            filled = int(self.width * min(1.0, event.transferredBytes / event.totalBytes))
+            line = "{} [{}{}] {}/{}".format(label, "#" * filled, "." * (self.width - filled), self.__formatBytes(event.transferredBytes), self.__formatBytes(event.totalBytes))
+        else:
+            line = "{} {}".format(label, self.__formatBytes(event.transferredBytes))
+        if len(event.transfers) > 1:
+            line += ", {} transfers".format(len(event.transfers))
+        if event.pendingCount:
+            line += ", {} queued".format(event.pendingCount)
+        if event.completedCount or event.failedCount:
+            line += ", {} done".format(event.completedCount)
+            if event.failedCount:
+                line += ", {} failed".format(event.failedCount)
+        if not event.final:
+            line += ", {}/s".format(self.__formatBytes(event.bytesPerSecond))
+            if event.etaSeconds is not None:
+                line += ", ETA {:.0f}s".format(event.etaSeconds)
+        self.stream.write("\r" + line.ljust(self.__lineLength) + ("\n" if event.final else ""))
+        self.stream.flush()
+        self.__lineLength = 0 if event.final else len(line)
+
+    def __formatBytes(self, value):
+        for unit in ("B", "KB", "MB", "GB"):
+            if value < 1024:
+                return "{:.1f} {}".format(value, unit) if unit != "B" else "{:.0f} {}".format(value, unit)
+            value /= 1024
+        return "{:.1f} TB".format(value)
+
+
+DISABLED_PROGRESS_REPORTER = ProgressReporter()     # Reporter without a callback, shared by the jobs of clients that don't report progress
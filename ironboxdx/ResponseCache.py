@@ -0,0 +1,103 @@
+#   IronBox DX control-plane response cache
+#
+#   An in-process cache of the parsed responses of read-only routes, keyed by
+#   route and request body. Each route has its own time to live, the number
+#   of entries is bounded with least recently used eviction, and the write
+#   routes drop the responses they make stale (see WRITE_INVALIDATIONS in
+#   IronBoxDXRoutes.py)
+#
+#   Revision History:
+#   -----------------
+#       10/16/2026  - v2.0: Initial release
+#
+import collections
+import copy
+import json
+import threading
+import time
+
+from .IronBoxDXRoutes import (
+    DEFAULT_CACHE_TTL_SECONDS,
+    WRITE_INVALIDATIONS,
+)
+
+
+class ResponseCache():
+
+    #--------------------------------------------------------------------------
+    #   routeTtlSeconds maps cacheable routes to the number of seconds their
+    #   responses are kept, it defaults to DEFAULT_CACHE_TTL_SECONDS. Routes
+    #   that aren't listed aren't cached
+    #--------------------------------------------------------------------------
+    def __init__(self, maxEntries = 1024, routeTtlSeconds = None):
+        if maxEntries <= 0:
+            raise ValueError("maxEntries must be greater than zero")
+        self.maxEntries = maxEntries                    # Maximum number of cached responses
+        self.routeTtlSeconds = dict(routeTtlSeconds if routeTtlSeconds is not None else DEFAULT_CACHE_TTL_SECONDS)
+        self.__entries = collections.OrderedDict()      # (route, body) key to (expiry time, response, body), least recently used first
+        self.__generation = 0                           # Incremented by every invalidation
+        self.__lock = threading.Lock()
+        return
+
+    # Indicates if the responses of a route are cached
+    def isCacheable(self, route):
+        return route in self.routeTtlSeconds
+
+    # Returns the generation to give to put() for a request about to be sent,
+    # so a response read before an invalidation isn't cached after it
+    def getGeneration(self):
+        with self.__lock:
+            return self.__generation
+
+    #--------------------------------------------------------------------------
+    #   Returns (True, response) for a cached response that hasn't expired,
+    #   (False, None) otherwise. The response is a copy the caller may modify
+    #--------------------------------------------------------------------------
+    def get(self, route, data):
+        key = self.__key(route, data)
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is None:
+                return False, None
+            if entry[0] <= time.monotonic():
+                del self.__entries[key]
+                return False, None
+            self.__entries.move_to_end(key)
+            response = entry[1]
+        return True, copy.deepcopy(response)
+
+    # Caches the response of a request sent at the given generation
+    def put(self, route, data, response, generation):
+        entry = (time.monotonic() + self.routeTtlSeconds[route], copy.deepcopy(response), dict(data))
+        key = self.__key(route, data)
+        with self.__lock:
+            if generation != self.__generation:
+                return      # Invalidated while the request was in flight
+            self.__entries[key] = entry
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.maxEntries:
+                self.__entries.popitem(last=False)
+
+    # Drops the cached responses made stale by a write route, called whether
+    # or not the write succeeded since a failed write may still have applied
+    def invalidate(self, route, data):
+        rules = WRITE_INVALIDATIONS.get(route)
+        if not rules:
+            return
+        with self.__lock:
+            self.__generation += 1
+            for key in list(self.__entries):
+                readRoute, readData = key[0], self.__entries[key][2]
+                for ruleRoute, readField, writeField in rules:
+                    if (readRoute == ruleRoute) and ((readField is None) or (readData.get(readField) == data.get(writeField))):
+                        del self.__entries[key]
+                        break
+
+    # Drops every cached response
+    def clear(self):
+        with self.__lock:
+            self.__generation += 1
+            self.__entries.clear()
+
+    def __key(self, route, data):
+        return (route, json.dumps(data, sort_keys=True))
@@ -0,0 +1,136 @@
+#   IronBox DX retry policy
+#
+#   Retries are spaced with full jitter exponential backoff, or the delay asked
+#   for by a Retry-After header, and are paid for from a retry budget shared by
+#   every call of a client so a failing service isn't flooded with retries
+#
+#   Revision History:
+#   -----------------
+#       10/16/2026  - v2.0: Initial release
+#
+#   Additional Information:
+#   -----------------------
+#       https://aws.amazon.com/blogs/architecture/exponential-backoff-and-jitter/
+#
+import random
+import threading
+import time
+
+from email.utils import (
+    parsedate_to_datetime
+)
+
+from .IronBoxDXRoutes import (
+    IDEMPOTENT_ROUTES
+)
+
+# Status codes worth retrying on idempotent routes
+RETRYABLE_STATUS_CODES = frozenset([408, 429, 500, 502, 503, 504])
+
+# Status codes telling the request wasn't processed, retried on every route
+NOT_PROCESSED_STATUS_CODES = frozenset([429])
+
+
+class IronBoxDXRequestError(Exception):
+
+    def __init__(self, message, route = None, statusCode = None, retryCount = 0):
+        super().__init__(message)
+        self.message = message                          # Description of the failed operation
+        self.route = route                              # IronBox DX route of the failed request
+        self.statusCode = statusCode                    # HTTP status code of the last response, None if no response was received
+        self.retryCount = retryCount                    # Number of retries sent before giving up
+        return
+
+    def __str__(self):
+        if self.route is None:
+            return self.message
+        return "{} (route: {}, status code: {}, retries: {})".format(self.message, self.route, self.statusCode, self.retryCount)
+
+
+class RetryBudget():
+
+    # Each retry withdraws one token, each request that needed no further retry
+    # deposits depositPerRequest tokens, up to maxTokens. With the defaults,
+    # retries are capped to a burst of 50 then to 10% of the request rate
+    def __init__(self, maxTokens = 50, depositPerRequest = 0.1):
+        self.__maxTokens = maxTokens
+        self.__depositPerRequest = depositPerRequest
+        self.__tokens = maxTokens
+        self.__lock = threading.Lock()
+        return
+
+    # Withdraws a token for a retry, returns False when the budget is exhausted
+    def tryWithdraw(self):
+        with self.__lock:
+            if self.__tokens < 1:
+                return False
+            self.__tokens -= 1
+            return True
+
+    # Deposits the share of a completed request
+    def deposit(self):
+        with self.__lock:
+            self.__tokens = min(self.__maxTokens, self.__tokens + self.__depositPerRequest)
+
+
+class RetryPolicy():
+
+    def __init__(self, maxRetries = 4, backoffBaseSeconds = 0.5, backoffMaxSeconds = 30, maxRetryAfterSeconds = 120, retryBudget = None):
+        self.maxRetries = maxRetries                        # Maximum number of retries of a single request
+        self.backoffBaseSeconds = backoffBaseSeconds        # Backoff ceiling of the first retry, doubled on each retry
+        self.backoffMaxSeconds = backoffMaxSeconds          # Largest backoff ceiling
+        self.maxRetryAfterSeconds = maxRetryAfterSeconds    # Retry-After delays longer than this aren't honored, the request fails instead
+        self.retryBudget = retryBudget if retryBudget is not None else RetryBudget()
+        return
+
+    # Indicates if a route can safely be sent more than once
+    def isIdempotent(self, route):
+        return route in IDEMPOTENT_ROUTES
+
+    # Records a request that completed without needing a further retry
+    def recordCompletion(self):
+        self.retryBudget.deposit()
+
+    #--------------------------------------------------------------------------
+    #   Returns the number of seconds to wait before retrying a request, or
+    #   None if it shouldn't be retried
+    #
+    #   retryCount is the number of retries already sent, statusCode is None
+    #   when no response was received. Requests that aren't idempotent are
+    #   only retried when the response tells they weren't processed
+    #--------------------------------------------------------------------------
+    def getRetryDelay(self, retryCount, statusCode = None, retryAfter = None, idempotent = True):
+        if retryCount >= self.maxRetries:
+            return None
+        if statusCode is not None:
+            if statusCode not in RETRYABLE_STATUS_CODES:
+                return None
+            if (statusCode not in NOT_PROCESSED_STATUS_CODES) and not idempotent:
+                return None
+        elif not idempotent:
+            return None
+
+        retryAfterSeconds = parseRetryAfter(retryAfter)
+        if (retryAfterSeconds is not None) and (retryAfterSeconds > self.maxRetryAfterSeconds):
+            return None
+        if not self.retryBudget.tryWithdraw():
+            return None
+        if retryAfterSeconds is not None:
+            return retryAfterSeconds
+        return random.uniform(0, min(self.backoffMaxSeconds, self.backoffBaseSeconds * (2 ** retryCount)))
+
+
+#------------------------------------------------------------------------------
+#   Returns the number of seconds asked for by a Retry-After header value,
+#   given either as seconds or as an HTTP date, None if it's missing or invalid
+#------------------------------------------------------------------------------
+def parseRetryAfter(retryAfter):
+    if retryAfter is None:
+        return None
+    retryAfter = retryAfter.strip()
+    if retryAfter.isdigit():
+        return int(retryAfter)
+    try:
+        return max(0, parsedate_to_datetime(retryAfter).timestamp() - time.time())
+    except (TypeError, ValueError, IndexError):
+        return None
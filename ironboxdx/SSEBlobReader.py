@@ -0,0 +1,170 @@
+#   IronBox DX seekable SSE blob reader
+#
+#   A read-only, seekable file object over an SSE blob, backed by ranged reads
+#   on the download shared access signature of the blob. The blob is read in
+#   fixed-size blocks kept in an LRU cache, and sequential reads, including
+#   the first read from the start of the blob, fetch the next blocks ahead in
+#   the background, so both random access (Parquet or ZIP footers, SQLite
+#   pages) and streaming reads only move the bytes needed
+#
+#   Revision History:
+#   -----------------
+#       10/16/2026  - v2.0: Initial release
+#
+import collections
+import contextvars
+import io
+import threading
+
+from concurrent.futures import (
+    ThreadPoolExecutor
+)
+
+DEFAULT_READER_BLOCK_SIZE_BYTES = 1024 * 1024   # Size of each block fetched and cached by a reader
+DEFAULT_READER_CACHE_BLOCKS = 64                # Number of blocks kept in the cache of a reader
+DEFAULT_READER_READ_AHEAD_BLOCKS = 4            # Number of blocks fetched ahead of sequential reads
+
+
+class SSEBlobReader(io.RawIOBase):
+
+    def __init__(self, backend, blockSizeBytes = DEFAULT_READER_BLOCK_SIZE_BYTES, cacheBlocks = DEFAULT_READER_CACHE_BLOCKS, readAheadBlocks = DEFAULT_READER_READ_AHEAD_BLOCKS):
+        super().__init__()
+        if blockSizeBytes <= 0:
+            raise ValueError("blockSizeBytes must be greater than zero")
+        if cacheBlocks <= readAheadBlocks:
+            raise ValueError("cacheBlocks must be greater than readAheadBlocks")
+        if readAheadBlocks < 0:
+            raise ValueError("readAheadBlocks can't be negative")
+        self.size = backend.getBlobSize()               # Size of the blob in bytes
+        self.__backend = backend
+        self.__blockSizeBytes = blockSizeBytes
+        self.__cacheBlocks = cacheBlocks
+        self.__readAheadBlocks = readAheadBlocks
+        self.__position = 0
+        self.__lastReadEnd = None                       # End offset of the last read, used to detect sequential reads
+        self.__cache = collections.OrderedDict()        # Block index to block contents, least recently used first
+        self.__pendingBlocks = {}                       # Block index to future of the blocks being read ahead
+        self.__lock = threading.RLock()                 # Reentrant, the done callback of a read ahead may run as it's submitted
+        self.__executor = ThreadPoolExecutor(max_workers=readAheadBlocks) if readAheadBlocks > 0 else None
+        return
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self.__position
+
+    def seek(self, offset, whence = io.SEEK_SET):
+        if self.closed:
+            raise ValueError("I/O operation on closed file")
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self.__position + offset
+        elif whence == io.SEEK_END:
+            position = self.size + offset
+        else:
+            raise ValueError("invalid whence ({}, should be 0, 1 or 2)".format(whence))
+        if position < 0:
+            raise ValueError("negative seek position {}".format(position))
+        self.__position = position
+        return position
+
+    #--------------------------------------------------------------------------
+    #   Reads into a writable buffer from the current position, returns the
+    #   number of bytes read, 0 at the end of the blob
+    #--------------------------------------------------------------------------
+    def readinto(self, buffer):
+        if self.closed:
+            raise ValueError("I/O operation on closed file")
+        view = memoryview(buffer).cast("B")
+        length = min(view.nbytes, self.size - self.__position)
+        if length <= 0:
+            return 0
+        # A read from the start of the blob or following the previous read is sequential, the blocks after it
+        # are requested before its own blocks are fetched so the two overlap
+        if (self.__position == 0) or (self.__position == self.__lastReadEnd):
+            self.__readAhead((self.__position + length - 1) // self.__blockSizeBytes + 1)
+        copied = 0
+        while copied < length:
+            index, blockOffset = divmod(self.__position + copied, self.__blockSizeBytes)
+            block = self.__getBlock(index)
+            count = min(len(block) - blockOffset, length - copied)
+            view[copied:copied + count] = block[blockOffset:blockOffset + count]
+            copied += count
+        self.__position += copied
+        self.__lastReadEnd = self.__position
+        return copied
+
+    # Reads the rest of the blob in a single pass instead of small reads
+    def readall(self):
+        buffer = bytearray(max(0, self.size - self.__position))
+        return bytes(buffer[:self.readinto(buffer)])
+
+    def close(self):
+        if not self.closed:
+            if self.__executor is not None:
+                with self.__lock:
+                    for future in self.__pendingBlocks.values():
+                        future.cancel()
+                self.__executor.shutdown(wait=False)
+            self.__cache.clear()
+        super().close()
+
+    # Fetches the block at the given index from the backend
+    def __fetchBlock(self, index):
+        offset = index * self.__blockSizeBytes
+        return self.__backend.getRange(offset, min(self.__blockSizeBytes, self.size - offset))
+
+    # Adds a block to the cache, evicting the least recently used blocks
+    def __cacheBlock(self, index, block):
+        with self.__lock:
+            self.__cache[index] = block
+            self.__cache.move_to_end(index)
+            while len(self.__cache) > self.__cacheBlocks:
+                self.__cache.popitem(last=False)
+
+    # Moves a completed read ahead to the cache, so blocks read ahead but
+    # never read are evicted like any other block
+    def __completeReadAhead(self, index, future):
+        with self.__lock:
+            if self.__pendingBlocks.get(index) is not future:
+                return      # Already taken by a read
+            del self.__pendingBlocks[index]
+            if (not future.cancelled()) and (future.exception() is None):
+                self.__cacheBlock(index, future.result())
+
+    # Returns the block at the given index from the cache, from a pending read
+    # ahead or from the backend
+    def __getBlock(self, index):
+        with self.__lock:
+            block = self.__cache.get(index)
+            if block is not None:
+                self.__cache.move_to_end(index)
+                return block
+            future = self.__pendingBlocks.pop(index, None)
+        block = None
+        if future is not None:
+            try:
+                block = future.result()
+            except Exception:
+                block = None        # A failed read ahead is fetched again below
+        if block is None:
+            block = self.__fetchBlock(index)
+        self.__cacheBlock(index, block)
+        return block
+
+    # Starts fetching the blocks following a sequential read, from firstIndex
+    def __readAhead(self, firstIndex):
+        if self.__executor is None:
+            return
+        lastIndex = min(firstIndex + self.__readAheadBlocks, -(-self.size // self.__blockSizeBytes))
+        with self.__lock:
+            for index in range(firstIndex, lastIndex):
+                if (index not in self.__cache) and (index not in self.__pendingBlocks):
+                    future = self.__executor.submit(contextvars.copy_context().run, self.__fetchBlock, index)
+                    self.__pendingBlocks[index] = future
+                    future.add_done_callback(lambda future, index=index: self.__completeReadAhead(index, future))
@@ -0,0 +1,53 @@
+#   IronBox DX request coalescing
+#
+#   Collapses identical calls made at the same time into a single call: the
+#   first caller for a key runs it, callers arriving while it's in flight wait
+#   and receive a copy of its result, or its exception
+#
+#   Revision History:
+#   -----------------
+#       10/16/2026  - v2.0: Initial release, see AsyncSingleFlight.py for the asyncio variant
+#
+import copy
+import threading
+
+
+class SingleFlight():
+
+    def __init__(self):
+        self.__calls = {}                               # Key to the in-flight call, a dictionary with event, result and error
+        self.__lock = threading.Lock()
+        return
+
+    # Runs func for the given key, or waits for the call already in flight for
+    # that key and returns a copy of its result. When other callers shared
+    # the call, the first caller also gets a copy so nobody holds the
+    # original
+    def do(self, key, func):
+        with self.__lock:
+            call = self.__calls.get(key)
+            leader = call is None
+            if leader:
+                call = { "event" : threading.Event(), "result" : None, "error" : None, "waiters" : 0 }
+                self.__calls[key] = call
+            else:
+                call["waiters"] += 1
+
+        if not leader:
+            call["event"].wait()
+            if call["error"] is not None:
+                raise call["error"]
+            return copy.deepcopy(call["result"])
+
+        try:
+            call["result"] = func()
+        except BaseException as e:
+            call["error"] = e
+            raise
+        finally:
+            with self.__lock:
+                del self.__calls[key]
+                waiters = call["waiters"]
+            call["event"].set()
+        return copy.deepcopy(call["result"]) if waiters else call["result"]
+
@@ -0,0 +1,290 @@
+#   IronBox DX tracing
+#
+#   Dependency-free tracing of client operations. A transfer is traced as a
+#   tree of spans: the operation, its phases (initialize, upload or download,
+#   finalize), the IronBox DX requests they send and the data-plane operation
+#   of each staged block or downloaded range. Spans carry attributes such as
+#   the blob size, the block count and the storage account
+#
+#   Finished spans are handed to exporters, InMemorySpanExporter and
+#   JSONLinesSpanExporter are built in, OpenTelemetrySpanExporter forwards
+#   the spans to OpenTelemetry when it's installed
+#
+#   The current span follows contextvars, so it's inherited by nested calls,
+#   asyncio tasks and the transfer workers, which run in a copy of the context
+#   that started them. Other threads give the parent span explicitly
+#
+#   Revision History:
+#   -----------------
+#       10/16/2026  - v2.0: Initial release
+#
+#   Additional Information:
+#   -----------------------
+#       https://opentelemetry.io/docs/specs/otel/trace/api/
+#
+import contextlib
+import contextvars
+import json
+import random
+import sys
+import threading
+import time
+import warnings
+
+from .Instrumentation import (
+    InstrumentationHook
+)
+
+SPAN_STATUS_UNSET = "unset"                     # Span ended without error
+SPAN_STATUS_ERROR = "error"                     # Span ended by an exception
+
+CURRENT_SPAN = contextvars.ContextVar("ironboxdxCurrentSpan", default=None)     # Span of the running code, None outside spans
+
+
+#------------------------------------------------------------------------------
+#   Calls a method of each exporter with a span, an exporter that raises is
+#   reported as a warning and doesn't fail the traced code
+#------------------------------------------------------------------------------
+def callExporters(exporters, methodName, span):
+    for exporter in exporters:
+        try:
+            getattr(exporter, methodName)(span)
+        except Exception as e:
+            warnings.warn("Span exporter {} failed in {}: {!r}".format(type(exporter).__name__, methodName, e), RuntimeWarning)
+
+
+class Span():
+
+    def __init__(self, name, parent = None, attributes = None, exporters = ()):
+        self.name = name                                # Name of the operation, phase or route
+        self.traceId = parent.traceId if parent is not None else "{:032x}".format(random.getrandbits(128))    # Shared by every span of a trace
+        self.spanId = "{:016x}".format(random.getrandbits(64))                                                # Identifies this span within its trace
+        self.parentSpanId = parent.spanId if parent is not None else None                                     # None for the root span of a trace
+        self.attributes = dict(attributes) if attributes is not None else {}   # Attribute name to str, bool, int or float value
+        self.startTime = time.time()                    # Wall clock start time, in seconds since the epoch
+        self.endTime = None                             # Wall clock end time, None until the span ends
+        self.status = SPAN_STATUS_UNSET                 # SPAN_STATUS_UNSET or SPAN_STATUS_ERROR
+        self.error = None                               # Exception that ended the span, if any
+        self.__exporters = exporters
+        self.__startCounter = time.perf_counter()
+        return
+
+    # Duration of the span in seconds, None until it ends
+    @property
+    def durationSeconds(self):
+        return None if self.endTime is None else self.endTime - self.startTime
+
+    def setAttribute(self, name, value):
+        self.attributes[name] = value
+
+    def setAttributes(self, attributes):
+        self.attributes.update(attributes)
+
+    # Ends the span, recording the exception that ended it if any. Ending a
+    # span twice has no effect
+    def end(self, error = None):
+        if self.endTime is not None:
+            return
+        if error is not None:
+            self.status = SPAN_STATUS_ERROR
+            self.error = error
+        self.endTime = self.startTime + (time.perf_counter() - self.__startCounter)
+        callExporters(self.__exporters, "onEnd", self)
+
+    # Returns the span as a dictionary of JSON friendly values
+    def toDict(self):
+        return {
+            "name" : self.name,
+            "traceId" : self.traceId,
+            "spanId" : self.spanId,
+            "parentSpanId" : self.parentSpanId,
+            "startTime" : self.startTime,
+            "endTime" : self.endTime,
+            "durationSeconds" : self.durationSeconds,
+            "status" : self.status,
+            "error" : repr(self.error) if self.error is not None else None,
+            "attributes" : self.attributes
+        }
+
+
+class NoOpSpan():
+
+    # Stands for spans when the tracer has no exporter, so tracing costs
+    # nothing when it's off
+    name = None
+    traceId = None
+    spanId = None
+    parentSpanId = None
+
+    def setAttribute(self, name, value):
+        pass
+
+    def setAttributes(self, attributes):
+        pass
+
+    def end(self, error = None):
+        pass
+
+NO_OP_SPAN = NoOpSpan()
+
+
+class SpanExporter():
+
+    # Called when a span starts, before its children
+    def onStart(self, span):
+        pass
+
+    # Called when a span ends, after its children
+    def onEnd(self, span):
+        pass
+
+
+class InMemorySpanExporter(SpanExporter):
+
+    # Keeps the ended spans in memory, up to maxSpans of the most recent ones
+    def __init__(self, maxSpans = 10000):
+        self.maxSpans = maxSpans                        # Maximum number of spans kept
+        self.__spans = []
+        self.__lock = threading.Lock()
+        return
+
+    def onEnd(self, span):
+        with self.__lock:
+            self.__spans.append(span)
+            if len(self.__spans) > self.maxSpans:
+                del self.__spans[:len(self.__spans) - self.maxSpans]
+
+    # Returns the ended spans, in the order they ended
+    def getSpans(self):
+        with self.__lock:
+            return list(self.__spans)
+
+    def clear(self):
+        with self.__lock:
+            self.__spans.clear()
+
+
+class JSONLinesSpanExporter(SpanExporter):
+
+    # Writes each ended span as a line of JSON to a text stream, standard
+    # error by default
+    def __init__(self, stream = None):
+        self.stream = stream if stream is not None else sys.stderr     # Text stream the spans are written to
+        self.__lock = threading.Lock()
+        return
+
+    def onEnd(self, span):
+        line = json.dumps(span.toDict(), default=str)
+        with self.__lock:
+            self.stream.write(line + "\n")
+            self.stream.flush()
+
+
+class OpenTelemetrySpanExporter(SpanExporter):
+
+    #--------------------------------------------------------------------------
+    #   Mirrors the spans to OpenTelemetry spans, with the same tree, names,
+    #   times, attributes and status, through the given OpenTelemetry tracer
+    #   or the tracer of the global tracer provider. Raises an ImportError when
+    #   the opentelemetry-api package isn't installed
+    #--------------------------------------------------------------------------
+    def __init__(self, openTelemetryTracer = None):
+        try:
+            from opentelemetry import trace
+        except ImportError as e:
+            raise ImportError("The opentelemetry-api package is required by OpenTelemetrySpanExporter, install it with: pip install opentelemetry-api") from e
+        self.__trace = trace
+        self.__tracer = openTelemetryTracer if openTelemetryTracer is not None else trace.get_tracer("ironboxdx")
+        self.__spans = {}                               # Span id to the OpenTelemetry span of the spans in progress
+        self.__lock = threading.Lock()
+        return
+
+    def onStart(self, span):
+        with self.__lock:
+            parent = self.__spans.get(span.parentSpanId)
+        context = self.__trace.set_span_in_context(parent) if parent is not None else None
+        openTelemetrySpan = self.__tracer.start_span(span.name, context=context, start_time=int(span.startTime * 1e9))
+        with self.__lock:
+            self.__spans[span.spanId] = openTelemetrySpan
+
+    def onEnd(self, span):
+        with self.__lock:
+            openTelemetrySpan = self.__spans.pop(span.spanId, None)
+        if openTelemetrySpan is None:
+            return
+        openTelemetrySpan.set_attributes({ name : value for name, value in span.attributes.items() if value is not None })
+        if span.error is not None:
+            openTelemetrySpan.record_exception(span.error)
+            openTelemetrySpan.set_status(self.__trace.Status(self.__trace.StatusCode.ERROR, str(span.error)))
+        openTelemetrySpan.end(end_time=int(span.endTime * 1e9))
+
+
+class Tracer(InstrumentationHook):
+
+    #--------------------------------------------------------------------------
+    #   Give the tracer to a client with its tracer argument. A tracer without
+    #   exporters is off, its spans are NO_OP_SPAN
+    #
+    #   As an instrumentation hook, the tracer adds a span for every request
+    #   of the client, a child of the span current where the request was made
+    #--------------------------------------------------------------------------
+    def __init__(self, exporters = None):
+        self.exporters = list(exporters) if exporters is not None else []     # SpanExporter instances, called in order
+        return
+
+    # Indicates if spans are recorded
+    @property
+    def enabled(self):
+        return bool(self.exporters)
+
+    # Returns the span of the running code, None outside spans
+    def getCurrentSpan(self):
+        return CURRENT_SPAN.get()
+
+    #--------------------------------------------------------------------------
+    #   Starts a span without making it current, the caller ends it. parent
+    #   defaults to the current span
+    #--------------------------------------------------------------------------
+    def startSpan(self, name, parent = None, attributes = None):
+        if not self.exporters:
+            return NO_OP_SPAN
+        span = Span(name, parent if parent is not None else CURRENT_SPAN.get(), attributes, self.exporters)
+        callExporters(self.exporters, "onStart", span)
+        return span
+
+    #--------------------------------------------------------------------------
+    #   Context manager running its block in a new span, current for the
+    #   duration of the block. parent defaults to the current span, give it
+    #   explicitly from worker threads. An exception leaving the block is
+    #   recorded on the span
+    #--------------------------------------------------------------------------
+    @contextlib.contextmanager
+    def span(self, name, parent = None, attributes = None):
+        if not self.exporters:
+            yield NO_OP_SPAN
+            return
+        span = self.startSpan(name, parent, attributes)
+        token = CURRENT_SPAN.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.end(e)
+            raise
+        finally:
+            CURRENT_SPAN.reset(token)
+            span.end()
+
+    def onRequestStart(self, event):
+        event.hookData[self] = self.startSpan(event.route, attributes={ "ironboxdx.plane" : event.plane })
+
+    def onRequestEnd(self, event):
+        span = event.hookData.get(self)
+        if span is None:
+            return
+        span.setAttributes({
+            "http.status_code" : event.statusCode,
+            "ironboxdx.request_bytes" : event.requestBytes,
+            "ironboxdx.response_bytes" : event.responseBytes,
+            "ironboxdx.retry_count" : event.retryCount
+        })
+        span.end(event.error)
@@ -0,0 +1,218 @@
+#   IronBox DX transfer planning
+#
+#   The parts of directory uploads, container downloads and resumable uploads
+#   that don't depend on how the calls are sent, shared by IronBoxDXRESTClient
+#   and AsyncIronBoxDXRESTClient: listing the files of a directory, naming
+#   and recording the blobs of a container download, the result reports and
+#   the span attributes of transfers. Every method here blocks on the file
+#   system, the asyncio client runs them in its executor
+#
+#   Revision History:
+#   -----------------
+#       10/16/2026  - v2.0: Initial release
+#
+import json
+import os
+import threading
+import time
+
+from .BlockBlobBackends import (
+    getSASExpiryTime
+)
+
+DOWNLOAD_MANIFEST_FILE_NAME = ".ironboxdx_download_manifest.jsonl"     # Default manifest file name of container downloads
+PARTIAL_DOWNLOAD_SUFFIX = ".partial"                                   # Suffix of files being downloaded by container downloads
+RESUME_MIN_SAS_VALIDITY_SECONDS = 300                                  # Uploads aren't resumed with a shared access signature expiring sooner
+
+
+#------------------------------------------------------------------------------
+#   Plans the download of the blobs of a container into a directory
+#
+#   Blobs are saved under their blob name, names already taken in the
+#   directory are prefixed with (1), (2)... Each completed blob is appended
+#   to a manifest, blobs listed in an existing manifest are skipped so an
+#   interrupted download restarts where it stopped. Blobs are written to a
+#   '.partial' file renamed once the download completes
+#------------------------------------------------------------------------------
+class ContainerDownloadPlan():
+
+    def __init__(self, destinationFolderPath, manifestFilePath = None):
+        self.destinationFolderPath = destinationFolderPath      # Directory the blobs are saved to
+        self.manifestFilePath = manifestFilePath if manifestFilePath is not None else os.path.join(destinationFolderPath, DOWNLOAD_MANIFEST_FILE_NAME)
+        self.__completedBlobs = {}                      # Manifest entries of the blobs already downloaded, keyed by blob public ID
+        self.__usedNames = set()                        # Normalized relative paths taken in the directory
+        self.__manifestFile = None
+        self.__lock = threading.Lock()
+        return
+
+    # Reads the manifest and the names taken in the directory, and opens the
+    # manifest to record the blobs downloaded
+    def open(self):
+        os.makedirs(self.destinationFolderPath, exist_ok=True)
+        self.__completedBlobs = self.__readManifest()
+        self.__usedNames = self.__indexDirectoryNames()
+        self.__manifestFile = open(self.manifestFilePath, "a", encoding="utf-8")
+
+    def close(self):
+        if self.__manifestFile is not None:
+            self.__manifestFile.close()
+            self.__manifestFile = None
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    #--------------------------------------------------------------------------
+    #   Returns the report entry of a listed blob with these keys:
+    #
+    #       blobPublicID, blobName, destinationFilePath, sizeBytes, succeeded, skipped, error
+    #
+    #   Blobs in the manifest are reported as succeeded and skipped, the
+    #   others get a destination file path no other blob of the plan uses
+    #--------------------------------------------------------------------------
+    def planBlob(self, blob):
+        result = {
+            "blobPublicID" : blob["blobPublicID"],
+            "blobName" : blob["blobName"],
+            "destinationFilePath" : None,
+            "sizeBytes" : 0,
+            "succeeded" : False,
+            "skipped" : False,
+            "error" : None
+        }
+        completedBlob = self.__completedBlobs.get(blob["blobPublicID"])
+        if completedBlob is not None:
+            result["destinationFilePath"] = os.path.join(self.destinationFolderPath, completedBlob["fileName"])
+            result["sizeBytes"] = completedBlob["sizeBytes"]
+            result["succeeded"] = result["skipped"] = True
+        else:
+            result["destinationFilePath"] = os.path.join(self.destinationFolderPath, self.__allocateFileName(blob["blobName"]))
+        return result
+
+    # Returns the path a planned blob is written to until it's complete, its
+    # directory is created
+    def preparePartialFile(self, result):
+        partialFilePath = result["destinationFilePath"] + PARTIAL_DOWNLOAD_SUFFIX
+        os.makedirs(os.path.dirname(partialFilePath), exist_ok=True)
+        return partialFilePath
+
+    # Moves the downloaded partial file of a blob to its destination and
+    # records the blob in the manifest, can be called from any thread
+    def completeBlob(self, result):
+        os.replace(result["destinationFilePath"] + PARTIAL_DOWNLOAD_SUFFIX, result["destinationFilePath"])
+        with self.__lock:
+            self.__manifestFile.write(json.dumps({
+                "blobPublicID" : result["blobPublicID"],
+                "blobName" : result["blobName"],
+                "fileName" : os.path.relpath(result["destinationFilePath"], self.destinationFolderPath),
+                "sizeBytes" : result["sizeBytes"]
+            }) + "\n")
+            self.__manifestFile.flush()
+
+    # Removes the partial file of a blob that failed, if any
+    def discardBlob(self, result):
+        try:
+            os.remove(result["destinationFilePath"] + PARTIAL_DOWNLOAD_SUFFIX)
+        except OSError:
+            pass        # Never created, or already renamed
+
+    # Reads the blobs recorded by the manifest, keyed by blob public ID, a
+    # line torn by an interrupted write is ignored and terminated so the
+    # entries appended after it start on their own line
+    def __readManifest(self):
+        completedBlobs = {}
+        if not os.path.exists(self.manifestFilePath):
+            return completedBlobs
+        line = "\n"
+        with open(self.manifestFilePath, "r", encoding="utf-8") as manifestFile:
+            for line in manifestFile:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                completedBlobs[entry["blobPublicID"]] = entry
+        if not line.endswith("\n"):
+            with open(self.manifestFilePath, "a", encoding="utf-8") as manifestFile:
+                manifestFile.write("\n")
+        return completedBlobs
+
+    # Returns the normalized relative paths of the files already present in
+    # the directory, except the manifest and partial downloads
+    def __indexDirectoryNames(self):
+        usedNames = set()
+        for directoryPath, directoryNames, fileNames in os.walk(self.destinationFolderPath):
+            for fileName in fileNames:
+                filePath = os.path.join(directoryPath, fileName)
+                if fileName.endswith(PARTIAL_DOWNLOAD_SUFFIX) or os.path.abspath(filePath) == os.path.abspath(self.manifestFilePath):
+                    continue
+                usedNames.add(os.path.normcase(os.path.relpath(filePath, self.destinationFolderPath)))
+        return usedNames
+
+    # Returns a relative file path for a blob name that isn't used yet and
+    # marks it used. Path components of the blob name become sub directories,
+    # empty, '.' and '..' components are dropped
+    def __allocateFileName(self, blobName):
+        components = [component for component in blobName.replace("\\", "/").split("/") if component not in ("", ".", "..")]
+        if not components:
+            components = ["blob"]
+        directoryName = os.path.join(*components[:-1]) if len(components) > 1 else ""
+        fileName = os.path.join(directoryName, components[-1])
+        count = 1
+        while os.path.normcase(fileName) in self.__usedNames:
+            # Create a new file name and recheck if it's taken until we find one that isn't
+            fileName = os.path.join(directoryName, "(%i)%s" % (count, components[-1]))
+            count += 1
+        self.__usedNames.add(os.path.normcase(fileName))
+        return fileName
+
+
+#------------------------------------------------------------------------------
+#   Returns (file path, blob name, size in bytes) for the files under a
+#   directory, in a stable order. Blob names are the paths relative to the
+#   directory using '/' separators. The size is None when the file can't be
+#   read, its upload then fails and is reported
+#------------------------------------------------------------------------------
+def scanDirectory(sourceDirectoryPath, recursive = True):
+    sourceFiles = []
+    for directoryPath, directoryNames, fileNames in os.walk(sourceDirectoryPath):
+        directoryNames.sort()
+        if not recursive:
+            directoryNames.clear()
+        for fileName in sorted(fileNames):
+            sourceFilePath = os.path.join(directoryPath, fileName)
+            try:
+                sizeBytes = os.path.getsize(sourceFilePath)
+            except OSError:
+                sizeBytes = None
+            sourceFiles.append((sourceFilePath, os.path.relpath(sourceFilePath, sourceDirectoryPath).replace(os.sep, "/"), sizeBytes))
+    return sourceFiles
+
+# Returns the report entry of a file of a directory upload
+def createUploadResult(sourceFilePath, blobName):
+    return {
+        "sourceFilePath" : sourceFilePath,
+        "blobName" : blobName,
+        "blobPublicID" : None,
+        "sizeBytes" : 0,
+        "succeeded" : False,
+        "error" : None
+    }
+
+# Indicates if an upload can be resumed with the shared access signature of
+# the given initialize response
+def canResumeUpload(initResponse):
+    expiryTime = getSASExpiryTime(initResponse)
+    return (expiryTime is None) or (expiryTime - time.time() > RESUME_MIN_SAS_VALIDITY_SECONDS)
+
+# Returns the span attributes of a data-plane transfer of sizeBytes split in
+# parts of partSizeBytes, blocks or ranges
+def transferAttributes(backend, sizeBytes, partSizeBytes, partName):
+    return {
+        "ironboxdx.storage_account" : backend.accountName,
+        "ironboxdx.blob_size_bytes" : sizeBytes,
+        "ironboxdx.{}_size_bytes".format(partName) : partSizeBytes,
+        "ironboxdx.{}_count".format(partName) : -(-sizeBytes // partSizeBytes)
+    }
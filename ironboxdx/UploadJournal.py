@@ -0,0 +1,112 @@
+#   IronBox DX resumable upload journal
+#
+#   A JSON-lines file kept next to an upload so it can be resumed after a
+#   failure or a process restart. The first line describes the source file and
+#   holds the initialize response of the blob, each following line records a
+#   staged block id, and a final line records the commit of the block list.
+#
+#   The initialize response holds the finalize token and the shared access
+#   signature of the blob, so the journal is created readable by its owner only
+#
+#   Revision History:
+#   -----------------
+#       10/16/2026  - v2.0: Initial release
+#
+import json
+import os
+import threading
+
+UPLOAD_JOURNAL_SUFFIX = ".ironboxdx_upload_journal"     # Suffix appended to the source file path for the default journal path
+
+
+class UploadJournal():
+
+    def __init__(self, journalFilePath, containerPublicID, blobName, sourceFilePath, blockSizeBytes):
+        sourceStat = os.stat(sourceFilePath)
+        self.journalFilePath = journalFilePath          # Path of the journal file
+        self.source = {                                 # Identifies the upload, a journal written for another source isn't resumed
+            "containerPublicID" : containerPublicID,
+            "blobName" : blobName,
+            "sourceFilePath" : os.path.abspath(sourceFilePath),
+            "sourceSizeBytes" : sourceStat.st_size,
+            "sourceModifiedTime" : sourceStat.st_mtime_ns,
+            "blockSizeBytes" : blockSizeBytes
+        }
+        self.initResponse = None                        # Initialize response of the blob being uploaded
+        self.stagedBlockIds = set()                     # Ids of the blocks recorded as staged
+        self.committedBytes = None                      # Number of bytes committed, None until the block list is committed
+        self.__journalFile = None
+        self.__lock = threading.Lock()
+        return
+
+    #--------------------------------------------------------------------------
+    #   Loads the journal file if it exists and was written for the same
+    #   source, returns True if there is an upload to resume
+    #
+    #   When the journal was written for another source, or the source file
+    #   changed since, False is returned but initResponse is still set to the
+    #   initialize response of the journal, so the caller can delete the blob
+    #   it left waiting for an upload. A line torn by an interrupted write is
+    #   ignored
+    #--------------------------------------------------------------------------
+    def load(self):
+        if not os.path.exists(self.journalFilePath):
+            return False
+        with open(self.journalFilePath, "r", encoding="utf-8") as journalFile:
+            for line in journalFile:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                if "source" in entry:
+                    self.initResponse = entry["initResponse"]
+                    if entry["source"] != self.source:
+                        return False
+                elif "blockId" in entry:
+                    self.stagedBlockIds.add(entry["blockId"])
+                elif "committedBytes" in entry:
+                    self.committedBytes = entry["committedBytes"]
+        return self.initResponse is not None
+
+    # Starts a new journal for the blob of the given initialize response,
+    # replacing the existing journal file
+    def start(self, initResponse):
+        self.close()
+        self.initResponse = initResponse
+        self.stagedBlockIds = set()
+        self.committedBytes = None
+        journalFileDescriptor = os.open(self.journalFilePath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        self.__journalFile = os.fdopen(journalFileDescriptor, "w", encoding="utf-8")
+        self.__append({ "source" : self.source, "initResponse" : initResponse })
+
+    # Reopens a loaded journal file to record further progress
+    def reopen(self):
+        self.close()
+        self.__journalFile = open(self.journalFilePath, "a", encoding="utf-8")
+
+    # Records a staged block, safe to call from the transfer workers
+    def recordBlockStaged(self, blockId):
+        self.__append({ "blockId" : blockId })
+
+    # Records the commit of the block list
+    def recordCommitted(self, committedBytes):
+        self.committedBytes = committedBytes
+        self.__append({ "committedBytes" : committedBytes })
+
+    # Closes and removes the journal file once the upload is finalized
+    def delete(self):
+        self.close()
+        if os.path.exists(self.journalFilePath):
+            os.remove(self.journalFilePath)
+
+    def close(self):
+        with self.__lock:
+            if self.__journalFile is not None:
+                self.__journalFile.close()
+                self.__journalFile = None
+
+    # Appends an entry and flushes it so it survives the process
+    def __append(self, entry):
+        with self.__lock:
+            self.__journalFile.write(json.dumps(entry) + "\n")
+            self.__journalFile.flush()
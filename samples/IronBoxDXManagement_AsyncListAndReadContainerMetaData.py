@@ -0,0 +1,45 @@
+#!/usr/bin/python
+#
+#   Sample Python script to list the IronBox DX server side encrypted containers
+#   and read the meta data for all of them concurrently using the asyncio client
+#
+#   Note: 
+#   You must have administrator access on the organization of the container being
+#   read for meta data
+#   
+#   Revision History:
+#       10/16/2026      Initial release
+#
+import asyncio
+import json
+
+# Import the IronBoxDX package
+import sys
+sys.path.append("..")
+from ironboxdx.AsyncIronBoxDXRESTClient import AsyncIronBoxDXRESTClient
+
+# Your IronBox API credentials from your web dashboard (you must be an admin on the parent organization of each container read in order to retrieve its meta data)
+apiKeyPublicID = "your_api_key_public_id"
+apiKeySecret = "your_api_key_secret"
+
+async def main():
+    async with AsyncIronBoxDXRESTClient(
+        apiKeyPublicID = apiKeyPublicID, 
+        apiKeySecret = apiKeySecret, 
+        showDebugInfo= False, 
+        verbose= True,
+        logToConsole= True) as ironboxDXRestObj:
+
+        # Get a listing of containers and read the container meta data for all of them at once
+        containerListingJson = await ironboxDXRestObj.listSSEContainers(includeContainersQueuedForDelete=False)
+        containers = containerListingJson["containers"]
+        containerMetaDataList = await asyncio.gather(*[
+            ironboxDXRestObj.management_readContainerMetaData(containerPublicID = container["containerPublicID"]) for container in containers
+        ])
+        for container, containerMetaData in zip(containers, containerMetaDataList):
+            print("Meta data for container with public ID = %s, with name = %s" % (container["containerPublicID"],container["containerName"]))
+            print(json.dumps(containerMetaData, indent=4, sort_keys=True))
+    pass
+
+if __name__ == "__main__":
+    asyncio.run(main())
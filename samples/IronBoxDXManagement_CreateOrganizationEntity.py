@@ -41,7 +41,8 @@ def main():
         apiKeyPublicID = apiKeyPublicID, 
         apiKeySecret = apiKeySecret, 
         showDebugInfo= False, 
-        verbose= True)
+        verbose= True,
+        logToConsole= True)
 
     # Create the organization entity
     ironboxDXRestObj.management_createOrganizationEntity(memberEmail=memberEmail, memberPassword=memberPassword, enabled=enabled)
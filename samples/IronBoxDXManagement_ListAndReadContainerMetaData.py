@@ -27,7 +27,8 @@ def main():
         apiKeyPublicID = apiKeyPublicID, 
         apiKeySecret = apiKeySecret, 
         showDebugInfo= False, 
-        verbose= True)
+        verbose= True,
+        logToConsole= True)
 
     # Get a listing of containers and read the container meta data for each
     containerListingJson = ironboxDXRestObj.listSSEContainers(includeContainersQueuedForDelete=False)
@@ -36,7 +36,8 @@ def main():
         apiKeyPublicID = apiKeyPublicID, 
         apiKeySecret = apiKeySecret, 
         showDebugInfo = False, 
-        verbose = True)
+        verbose = True,
+        logToConsole = True)
 
     # List the members of the security group
     groupInfo = ironboxDXRestObj.management_readBuiltInSecurityGroup(groupName=groupName)
@@ -32,7 +32,8 @@ def main():
         apiKeyPublicID = apiKeyPublicID, 
         apiKeySecret = apiKeySecret, 
         showDebugInfo= False, 
-        verbose= True)
+        verbose= True,
+        logToConsole= True)
 
     # Get current settings
     print("Container link-based access settings are currently:")
@@ -28,7 +28,8 @@ def main():
         apiKeyPublicID = apiKeyPublicID, 
         apiKeySecret = apiKeySecret, 
         showDebugInfo= False, 
-        verbose= True)
+        verbose= True,
+        logToConsole= True)
 
     # Enable or disable the user's organization membership
     ironboxDXRestObj.management_setEntityOrganizationMembershipStatus(memberEmail=memberEmail, enabled=enabled)
@@ -0,0 +1,52 @@
+#!/usr/bin/python
+#
+#   Sample Python script to upload a file to an IronBox DX server side encrypted container
+#   while collecting client-side metrics, then print the latency percentiles of each route
+#   and the OpenMetrics text that a Prometheus scraper would collect
+#
+#   Revision History:
+#       10/16/2026      Initial release
+#
+
+# Import the IronBoxDX package
+import sys
+sys.path.append("..")
+from ironboxdx.IronBoxDXRESTClient import IronBoxDXRESTClient
+from ironboxdx.MetricsRegistry import MetricsRegistry
+
+# Your IronBox API credentials from your web dashboard
+apiKeyPublicID = "your_api_key_public_id"
+apiKeySecret = "your_api_key_secret"
+
+# Upload parameters
+containerPublicID = "public_id_of_container"
+sourceFilePath = "c:\\folder\\file.txt"
+blobName = "file.txt"
+
+def main():
+    metricsRegistry = MetricsRegistry()
+    ironboxDXRestObj = IronBoxDXRESTClient(
+        apiKeyPublicID = apiKeyPublicID, 
+        apiKeySecret = apiKeySecret,
+        showDebugInfo= False, 
+        verbose= True,
+        logToConsole= True,
+        metricsRegistry = metricsRegistry)
+
+    ironboxDXRestObj.uploadBlobToSSEContainerFromPath(
+        containerPublicID = containerPublicID, 
+        blobName = blobName,
+        sourceFilePath = sourceFilePath)
+
+    # Latency percentiles of each route, in milliseconds
+    for route, metrics in sorted(metricsRegistry.snapshot().items()):
+        latency = metrics["latency"]
+        print("%-45s %5i requests %3i errors  p50 %8.1f ms  p95 %8.1f ms  p99 %8.1f ms" % (
+            route, metrics["requestCount"], metrics["errorCount"], latency["p50"] * 1000, latency["p95"] * 1000, latency["p99"] * 1000))
+
+    # Text served to a Prometheus scraper, for example from a /metrics endpoint
+    print(metricsRegistry.toOpenMetrics())
+    pass
+
+if __name__ == "__main__":
+    main()
@@ -21,7 +21,8 @@ def main():
         apiKeyPublicID = apiKeyPublicID, 
         apiKeySecret = apiKeySecret, 
         showDebugInfo= False, 
-        verbose= True)
+        verbose= True,
+        logToConsole= True)
 
     #--------------------------------------------------------------------------
     # Get a list of the storage endpoints that the user has access to
@@ -0,0 +1,41 @@
+#!/usr/bin/python
+#
+#   Sample Python script to download every ready blob in an IronBox DX server side 
+#   encrypted container to a local directory. Re-running the script after an 
+#   interruption only downloads the blobs that haven't completed yet
+#
+#   Revision History:
+#       10/16/2026      Initial release
+#
+
+# Import the IronBoxDX package
+import sys
+sys.path.append("..")
+from ironboxdx.IronBoxDXRESTClient import IronBoxDXRESTClient
+
+# Your IronBox API credentials from your web dashboard
+apiKeyPublicID = "your_api_key_public_id"
+apiKeySecret = "your_api_key_secret"
+
+# Download parameters
+destinationFolderPath = "c:\\folder\\sub_folder"
+containerPublicID = "public_id_of_container"
+
+def main():
+    ironboxDXRestObj = IronBoxDXRESTClient(
+        apiKeyPublicID = apiKeyPublicID, 
+        apiKeySecret = apiKeySecret,
+        showDebugInfo= False, 
+        verbose= True,
+        logToConsole= True)
+
+    # Download the container with 8 blobs in flight at once, progress is recorded in a 
+    # manifest inside the destination folder
+    downloadReport = ironboxDXRestObj.downloadSSEContainerToDirectory(containerPublicID = containerPublicID, destinationFolderPath = destinationFolderPath, maxWorkers = 8)
+    for result in downloadReport:
+        if not result["succeeded"]:
+            print("Failed to download blob with publicID = %s and blobName = %s: %s" % (result["blobPublicID"], result["blobName"], result["error"]))
+    pass
+
+if __name__ == "__main__":
+    main()
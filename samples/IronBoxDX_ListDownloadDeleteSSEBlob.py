@@ -5,6 +5,7 @@
 #
 #   Revision History:
 #       9/10/2019       Initial release
+#       10/16/2026      Iterate over every blob in the container instead of the first page only
 #
 import os
 from os import path
@@ -29,24 +30,21 @@ def main():
         apiKeyPublicID = apiKeyPublicID, 
         apiKeySecret = apiKeySecret,
         showDebugInfo= False, 
-        verbose= True)
+        verbose= True,
+        logToConsole= True)
 
     #--------------------------------------------------------------------------
-    # Get a listing of the blobs in the server-side encrypted container
+    # Iterate over the blobs in the server-side encrypted container, pages of
+    # blobs are fetched as needed
     # State values:
     #
     #   0 = waiting for upload
     #   1 = ready 
-    #--------------------------------------------------------------------------
-    blobsInContainerJson = ironboxDXRestObj.listSSEContainerBlobs(containerPublicID = containerPublicID, skipPastNumItems=0, takeNumItems=500, state=1)
-    print("There are %i 'ready' blobs in the container with public ID = %s:\n" % (len(blobsInContainerJson["blobs"]),blobsInContainerJson["containerPublicID"]))
-    for blob in blobsInContainerJson["blobs"]:
-       print(json.dumps(blob, indent=4, sort_keys=True)) 
-
-    #--------------------------------------------------------------------------
+    #
     # Download each blob into the destionation folder path
     #--------------------------------------------------------------------------
-    for blob in blobsInContainerJson["blobs"]:
+    for blob in ironboxDXRestObj.iterateSSEContainerBlobs(containerPublicID = containerPublicID, pageSize=500, state=1):
+        print(json.dumps(blob, indent=4, sort_keys=True)) 
         destinationFilePath = os.path.join(destinationFolderPath,blob["blobName"])
         count = 1
         while path.exists(destinationFilePath):
@@ -57,7 +55,9 @@ def main():
         print("Downloading blob with publicID = %s and blobName = %s to %s" % (blob["blobPublicID"], blob["blobName"], destinationFilePath))
         ironboxDXRestObj.downloadSSEContainerBlobToPath(blobPublicID = blob["blobPublicID"], destinationFilePath = destinationFilePath)
 
-        # Delete the blob from IronBox DX (optional)
+        # Delete the blob from IronBox DX (optional), pages are read by offset so
+        # deleting while iterating skips blobs, collect the IDs and delete them
+        # once the iteration completes instead
         #ironboxDXRestObj.deleteSSEContainerBlob(blobPublicID = blob["blobPublicID"])
     pass
 
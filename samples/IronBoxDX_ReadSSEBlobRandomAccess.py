@@ -0,0 +1,45 @@
+#!/usr/bin/python
+#
+#   Sample Python script to list the contents of a ZIP archive stored in an IronBox DX
+#   server side encrypted container and extract a single entry, only the blocks of the 
+#   archive that are read are downloaded
+#
+#   Revision History:
+#       10/16/2026      Initial release
+#
+import zipfile
+
+# Import the IronBoxDX package
+import sys
+sys.path.append("..")
+from ironboxdx.IronBoxDXRESTClient import IronBoxDXRESTClient
+
+# Your IronBox API credentials from your web dashboard
+apiKeyPublicID = "your_api_key_public_id"
+apiKeySecret = "your_api_key_secret"
+
+# Read parameters
+blobPublicID = "public_id_of_zip_blob"
+entryName = "folder/entry.txt"
+destinationFilePath = "c:\\folder\\entry.txt"
+
+def main():
+    ironboxDXRestObj = IronBoxDXRESTClient(
+        apiKeyPublicID = apiKeyPublicID, 
+        apiKeySecret = apiKeySecret,
+        showDebugInfo= False, 
+        verbose= True,
+        logToConsole= True)
+
+    # The reader is a seekable file object, zipfile only reads the central directory 
+    # at the end of the archive and the entries that are extracted
+    with ironboxDXRestObj.openSSEContainerBlob(blobPublicID = blobPublicID) as blobReader:
+        with zipfile.ZipFile(blobReader) as archive:
+            for entry in archive.infolist():
+                print("%s (%i bytes)" % (entry.filename, entry.file_size))
+            with archive.open(entryName) as source, open(destinationFilePath, "wb") as destination:
+                destination.write(source.read())
+    pass
+
+if __name__ == "__main__":
+    main()
@@ -29,7 +29,8 @@ def main():
         apiKeyPublicID = apiKeyPublicID, 
         apiKeySecret = apiKeySecret, 
         showDebugInfo = False, 
-        verbose= True)
+        verbose= True,
+        logToConsole= True)
 
     #--------------------------------------------------------------------------
     #   Get a list of the current container notification lists and add to each
@@ -0,0 +1,60 @@
+#!/usr/bin/python
+#
+#   Sample Python script to trace the upload of a file to an IronBox DX server side encrypted
+#   container, showing how long the initialize, upload and finalize phases and each staged 
+#   block took. Spans are written as JSON lines to the console, and forwarded to OpenTelemetry
+#   when it's installed
+#
+#   Revision History:
+#       10/16/2026      Initial release
+#
+
+# Import the IronBoxDX package
+import sys
+sys.path.append("..")
+from ironboxdx.IronBoxDXRESTClient import IronBoxDXRESTClient
+from ironboxdx.Tracing import (
+    Tracer,
+    InMemorySpanExporter,
+    JSONLinesSpanExporter,
+    OpenTelemetrySpanExporter,
+)
+
+# Your IronBox API credentials from your web dashboard
+apiKeyPublicID = "your_api_key_public_id"
+apiKeySecret = "your_api_key_secret"
+
+# Upload parameters
+containerPublicID = "public_id_of_container"
+sourceFilePath = "c:\\folder\\file.txt"
+blobName = "file.txt"
+
+def main():
+    inMemoryExporter = InMemorySpanExporter()
+    exporters = [inMemoryExporter, JSONLinesSpanExporter(sys.stdout)]
+    try:
+        # Uses the tracer provider configured for the application
+        exporters.append(OpenTelemetrySpanExporter())
+    except ImportError:
+        pass
+
+    ironboxDXRestObj = IronBoxDXRESTClient(
+        apiKeyPublicID = apiKeyPublicID, 
+        apiKeySecret = apiKeySecret,
+        showDebugInfo= False, 
+        verbose= False,
+        tracer = Tracer(exporters))
+
+    ironboxDXRestObj.uploadBlobToSSEContainerFromPath(
+        containerPublicID = containerPublicID, 
+        blobName = blobName,
+        sourceFilePath = sourceFilePath)
+
+    # Duration of each phase of the upload
+    for span in inMemoryExporter.getSpans():
+        if span.name in ("initialize", "upload", "finalize"):
+            print("%-10s %8.1f ms" % (span.name, span.durationSeconds * 1000))
+    pass
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+#!/usr/bin/python
+#
+#   Sample Python script to upload every file under a directory to an IronBox DX 
+#   server-side encrypted container
+#
+#   Revision History:
+#       10/16/2026      Initial release
+#
+
+# Import the IronBoxDX package
+import sys
+sys.path.append("..")
+from ironboxdx.IronBoxDXRESTClient import IronBoxDXRESTClient
+
+# Your IronBox API credentials from your web dashboard 
+apiKeyPublicID = "your_api_key_public_id"
+apiKeySecret = "your_api_key_secret"
+containerPublicID = "public_id_of_container_to_upload_to"
+
+# Upload parameters
+sourceDirectoryPath = "x:\\folder\\directoryToUpload"
+
+# Called every 2 seconds from a background thread with the progress of the directory upload
+def showProgress(event):
+    eta = "%.0fs" % event.etaSeconds if event.etaSeconds is not None else "?"
+    print("%i files done, %i in flight, %i queued, %i of %s bytes sent, %.1f MB/s, done in %s" % (
+        event.completedCount, len(event.transfers), event.pendingCount, event.transferredBytes, event.totalBytes, event.bytesPerSecond / (1024 * 1024), eta))
+    for transfer in event.transfers:
+        print("    %s: %i of %s bytes, %.1f MB/s" % (transfer.name, transfer.transferredBytes, transfer.totalBytes, transfer.bytesPerSecond / (1024 * 1024)))
+
+def main():
+    ironboxDXRestObj = IronBoxDXRESTClient(
+        apiKeyPublicID = apiKeyPublicID, 
+        apiKeySecret = apiKeySecret, 
+        showDebugInfo= False, 
+        verbose= True,
+        logToConsole= True,
+        progressCallback = showProgress,
+        progressIntervalSeconds = 2)
+
+    # Upload the directory with 8 files in flight at once, a failed file doesn't stop the others
+    uploadReport = ironboxDXRestObj.uploadDirectoryToSSEContainer(containerPublicID=containerPublicID, sourceDirectoryPath=sourceDirectoryPath, recursive=True, maxWorkers=8)
+    for result in uploadReport:
+        if result["succeeded"]:
+            print("Uploaded %s as blob %s (%i bytes)" % (result["sourceFilePath"], result["blobPublicID"], result["sizeBytes"]))
+        else:
+            print("Failed to upload %s: %s" % (result["sourceFilePath"], result["error"]))
+    pass
+
+if __name__ == "__main__":
+    main()
@@ -5,13 +5,16 @@
 #   Revision History:
 #       8/6/2019        Initial release
 #       8/14/2019       Added text based uploading sample
+#       10/16/2026      Added stream based uploading sample, progress shown with a console progress bar
 #
 import os
+import subprocess
 
 # Import the IronBoxDX package
 import sys
 sys.path.append("..")
 from ironboxdx.IronBoxDXRESTClient import IronBoxDXRESTClient
+from ironboxdx.ProgressReporter import ConsoleProgressBar
 
 # Your IronBox API credentials from your web dashboard 
 apiKeyPublicID = "your_api_key_public_id"
@@ -26,18 +29,30 @@ filePathUploadBlobName = os.path.basename(sourceFilePath)
 textUploadBody = "Sample content from text upload"
 textUploadBlobName = "TextUploadBlob.txt"
 
+# Upload parameters based on stream upload, the output of a command is uploaded as it's produced
+streamUploadCommand = ["pg_dump", "--format=custom", "database_name"]
+streamUploadBlobName = "database_name.dump"
+
 def main():
     ironboxDXRestObj = IronBoxDXRESTClient(
         apiKeyPublicID = apiKeyPublicID, 
         apiKeySecret = apiKeySecret, 
         showDebugInfo= False, 
-        verbose= True)
+        verbose= True,
+        logToConsole= True,
+        progressCallback = ConsoleProgressBar())
 
     # Upload a server-side encrypted blob using a source path
     ironboxDXRestObj.uploadBlobToSSEContainerFromPath(containerPublicID=containerPublicID, blobName=filePathUploadBlobName, sourceFilePath=sourceFilePath)
 
     # Upload a server-side encrypted blob using text string as the source
     ironboxDXRestObj.uploadBlobToSSEContainerFromText(containerPublicID=containerPublicID, blobName=textUploadBlobName, sourceText=textUploadBody)
+
+    # Upload a server-side encrypted blob using the output pipe of a process as the source
+    process = subprocess.Popen(streamUploadCommand, stdout=subprocess.PIPE)
+    ironboxDXRestObj.uploadBlobToSSEContainerFromStream(containerPublicID=containerPublicID, blobName=streamUploadBlobName, sourceStream=process.stdout)
+    process.stdout.close()
+    process.wait()
     pass
 
 if __name__ == "__main__":
@@ -0,0 +1,115 @@
+#   Tests of the blob content disk cache
+#
+#   Run from the repository root with: python -m pytest tests
+#
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+
+from unittest import (
+    mock
+)
+
+from ironboxdx.BlobContentCache import (
+    BlobContentCache
+)
+
+
+class BlobContentCacheTests(unittest.TestCase):
+
+    def setUp(self):
+        self.directoryPath = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directoryPath)
+        self.cacheDirectoryPath = os.path.join(self.directoryPath, "cache")
+        self.downloads = []
+
+    # Returns a populate function writing the contents of a blob, recording
+    # each download
+    def populateWith(self, contents, release = None):
+        def populate(tempFilePath):
+            self.downloads.append(contents)
+            if release is not None:
+                release.wait(timeout=5)
+            with open(tempFilePath, "wb") as tempFile:
+                tempFile.write(contents)
+        return populate
+
+    def destination(self, name):
+        return os.path.join(self.directoryPath, name)
+
+    def readFile(self, filePath):
+        with open(filePath, "rb") as destinationFile:
+            return destinationFile.read()
+
+    def test_servesRepeatedFetchesFromCache(self):
+        cache = BlobContentCache(self.cacheDirectoryPath, maxBytes=100)
+        self.assertFalse(cache.fetch("blob", self.destination("first"), self.populateWith(b"contents")))
+        self.assertTrue(cache.fetch("blob", self.destination("second"), self.populateWith(b"other")))
+        self.assertEqual(self.downloads, [b"contents"])
+        self.assertEqual(self.readFile(self.destination("second")), b"contents")
+        self.assertEqual(cache.totalBytes, len(b"contents"))
+
+    def test_evictsLeastRecentlyUsedPastMaxBytes(self):
+        cache = BlobContentCache(self.cacheDirectoryPath, maxBytes=25)
+        for blobPublicID in ("a", "b", "a", "c"):
+            cache.fetch(blobPublicID, self.destination(blobPublicID), self.populateWith(blobPublicID.encode("utf-8") * 10))
+        self.assertEqual(cache.totalBytes, 20)
+        self.assertTrue(cache.fetch("a", self.destination("a"), self.populateWith(b"a" * 10)))
+        self.assertFalse(cache.fetch("b", self.destination("b"), self.populateWith(b"b" * 10)))
+        self.assertEqual(self.downloads, [b"a" * 10, b"b" * 10, b"c" * 10, b"b" * 10])
+        self.assertLessEqual(cache.totalBytes, 25)
+
+    def test_doesNotCacheBlobLargerThanCache(self):
+        cache = BlobContentCache(self.cacheDirectoryPath, maxBytes=5)
+        self.assertFalse(cache.fetch("blob", self.destination("blob"), self.populateWith(b"0123456789")))
+        self.assertEqual(self.readFile(self.destination("blob")), b"0123456789")
+        self.assertEqual(cache.totalBytes, 0)
+        self.assertEqual(os.listdir(self.cacheDirectoryPath), [])
+
+    def test_concurrentFetchesShareOneDownload(self):
+        cache = BlobContentCache(self.cacheDirectoryPath, maxBytes=100)
+        release = threading.Event()
+        hits = []
+        threads = [
+            threading.Thread(target=lambda index=index: hits.append(cache.fetch("blob", self.destination(str(index)), self.populateWith(b"contents", release))))
+            for index in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.05)    # Lets every thread reach the cache while the first download is blocked
+        release.set()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(self.downloads, [b"contents"])
+        self.assertEqual(sorted(hits), [False] + [True] * 7)
+        for index in range(8):
+            self.assertEqual(self.readFile(self.destination(str(index))), b"contents")
+
+    def test_servesHitsAsHardLinks(self):
+        cache = BlobContentCache(self.cacheDirectoryPath, maxBytes=100)
+        cache.fetch("blob", self.destination("first"), self.populateWith(b"contents"))
+        cache.fetch("blob", self.destination("second"), self.populateWith(b"contents"))
+        self.assertTrue(os.path.samefile(self.destination("first"), self.destination("second")))
+
+    def test_copiesWhenHardLinksFail(self):
+        cache = BlobContentCache(self.cacheDirectoryPath, maxBytes=100)
+        with mock.patch("ironboxdx.BlobContentCache.os.link", side_effect=OSError("hard links not supported")):
+            cache.fetch("blob", self.destination("first"), self.populateWith(b"contents"))
+            cache.fetch("blob", self.destination("second"), self.populateWith(b"contents"))
+        self.assertFalse(os.path.samefile(self.destination("first"), self.destination("second")))
+        self.assertEqual(self.readFile(self.destination("second")), b"contents")
+        self.assertEqual(sorted(os.listdir(self.directoryPath)), ["cache", "first", "second"])
+
+    def test_loadsEntriesOfEarlierRuns(self):
+        BlobContentCache(self.cacheDirectoryPath, maxBytes=100).fetch("blob", self.destination("first"), self.populateWith(b"contents"))
+        cache = BlobContentCache(self.cacheDirectoryPath, maxBytes=100)
+        self.assertEqual(cache.totalBytes, len(b"contents"))
+        self.assertTrue(cache.fetch("blob", self.destination("second"), self.populateWith(b"other")))
+        self.assertEqual(self.downloads, [b"contents"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+#   Tests of the block blob data-plane backends
+#
+#   Run from the repository root with: python -m pytest tests
+#
+import importlib.util
+import sys
+import threading
+import unittest
+
+from ironboxdx.BlockBlobBackends import (
+    createSDKRetry,
+    SDKBlockBlobBackend,
+    StorageSessionPool,
+)
+from ironboxdx.RetryPolicy import (
+    RetryPolicy
+)
+
+AZURE_STORAGE_INSTALLED = importlib.util.find_spec("azure.storage.common") is not None
+
+
+@unittest.skipUnless(AZURE_STORAGE_INSTALLED, "azure-storage-common isn't installed")
+class SDKRetryTests(unittest.TestCase):
+
+    # Returns a real SDK retry context holding a response with the given status
+    def createContext(self, statusCode):
+        from azure.storage.common.models import RetryContext
+        from azure.storage.common._http import HTTPResponse
+        context = RetryContext()
+        context.response = HTTPResponse(statusCode, "", {}, b"")
+        return context
+
+    def test_retriesTransientErrorsUpToMaxRetries(self):
+        for statusCode in (503, 429):
+            retry = createSDKRetry(RetryPolicy(maxRetries=2, backoffBaseSeconds=0))
+            context = self.createContext(statusCode)
+            self.assertIsNotNone(retry(context))
+            self.assertIsNotNone(retry(context))
+            self.assertIsNone(retry(context))
+            self.assertEqual(context.count, 2)
+
+    def test_doesNotRetryClientErrors(self):
+        retry = createSDKRetry(RetryPolicy(maxRetries=2, backoffBaseSeconds=0))
+        context = self.createContext(404)
+        self.assertIsNone(retry(context))
+        self.assertFalse(hasattr(context, "count"))
+
+
+class StorageSessionPoolTests(unittest.TestCase):
+
+    def test_sessionsHaveNoDefaultAcceptHeaders(self):
+        pool = StorageSessionPool()
+        session = pool.getSession("account")
+        self.assertNotIn("Accept", session.headers)
+        self.assertNotIn("Accept-Encoding", session.headers)
+        self.assertIs(pool.getSession("account"), session)
+        pool.close()
+
+    @unittest.skipUnless(AZURE_STORAGE_INSTALLED, "azure-storage-common isn't installed")
+    def test_concurrentSDKBackendsShareSession(self):
+        # Threads switch as often as possible so the backends interleave
+        switchInterval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        self.addCleanup(sys.setswitchinterval, switchInterval)
+        threadCount = 16
+        for trial in range(200):
+            pool = StorageSessionPool()
+            barrier = threading.Barrier(threadCount)
+            errors = []
+
+            # Every thread creates the backend of a blob of the same account at once
+            def createBackend(index):
+                try:
+                    barrier.wait()
+                    SDKBlockBlobBackend("account", "?sig=signature", "container", "blob{}".format(index), requestSession=pool.getSession("account"))
+                except Exception as e:
+                    errors.append(e)
+
+            threads = [threading.Thread(target=createBackend, args=(index,)) for index in range(threadCount)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            pool.close()
+            self.assertEqual(errors, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,176 @@
+#   Tests of the block transfer engine
+#
+#   Run from the repository root with: python -m pytest tests
+#
+import io
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+
+from unittest import (
+    mock
+)
+
+from ironboxdx import (
+    BlockTransferEngine as BlockTransferEngineModule
+)
+from ironboxdx.BlockTransferEngine import (
+    BlockTransferEngine,
+    blockIdForIndex,
+    readStreamBlocks,
+    MAX_BLOCKS_PER_BLOB,
+)
+
+
+class MemoryBackend():
+
+    # Keeps staged blocks in memory and serves ranges of data, every call waits
+    # on a barrier of workers so the tests fail unless calls run concurrently
+    def __init__(self, data = b"", concurrentCalls = 1):
+        self.data = data
+        self.stagedBlocks = {}
+        self.committedBlockIds = None
+        self.rangeOffsets = []
+        self.onGetRange = None
+        self.lock = threading.Lock()
+        self.barrier = threading.Barrier(concurrentCalls) if concurrentCalls > 1 else None
+
+    def waitForOtherWorkers(self):
+        if self.barrier is not None:
+            try:
+                self.barrier.wait(timeout=5)
+            except threading.BrokenBarrierError:
+                pass        # The last calls of a transfer may be fewer than the barrier parties
+
+    def putBlock(self, blockId, data):
+        self.waitForOtherWorkers()
+        with self.lock:
+            self.stagedBlocks[blockId] = bytes(data)
+
+    def putBlockList(self, blockIds):
+        self.committedBlockIds = list(blockIds)
+
+    def getBlobSize(self):
+        return len(self.data)
+
+    def getRange(self, offset, length):
+        if self.onGetRange is not None:
+            self.onGetRange(offset)
+        self.waitForOtherWorkers()
+        with self.lock:
+            self.rangeOffsets.append(offset)
+        return self.data[offset:offset + length]
+
+    def committedData(self):
+        return b"".join(self.stagedBlocks[blockId] for blockId in self.committedBlockIds)
+
+
+class BlockTransferEngineTests(unittest.TestCase):
+
+    def setUp(self):
+        self.directoryPath = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directoryPath)
+        self.data = os.urandom(1000)
+
+    def writeFile(self, data):
+        filePath = os.path.join(self.directoryPath, "source.bin")
+        with open(filePath, "wb") as sourceFile:
+            sourceFile.write(data)
+        return filePath
+
+    def test_uploadsFileBlocksConcurrently(self):
+        backend = MemoryBackend(concurrentCalls=4)
+        engine = BlockTransferEngine(blockSizeBytes=64, maxWorkers=4)
+        progress = []
+        uploadedBytes = engine.uploadFile(backend, self.writeFile(self.data), len(self.data), progressCallback=lambda transferred, total: progress.append((transferred, total)))
+        self.assertEqual(uploadedBytes, len(self.data))
+        self.assertFalse(backend.barrier.broken)
+        self.assertEqual(backend.committedData(), self.data)
+        self.assertEqual(progress[-1], (len(self.data), len(self.data)))
+
+    def test_commitsBlockIdsInOrder(self):
+        backend = MemoryBackend()
+        engine = BlockTransferEngine(blockSizeBytes=100, maxWorkers=4)
+        engine.uploadBlocks(backend, (self.data[offset:offset + 100] for offset in range(0, len(self.data), 100)))
+        self.assertEqual(backend.committedBlockIds, [blockIdForIndex(index) for index in range(10)])
+        self.assertEqual(len(set(len(blockId) for blockId in backend.committedBlockIds)), 1)
+        self.assertEqual(backend.committedData(), self.data)
+
+    def test_skipsStagedBlocks(self):
+        backend = MemoryBackend()
+        backend.stagedBlocks[blockIdForIndex(1)] = self.data[100:200]
+        engine = BlockTransferEngine(blockSizeBytes=100, maxWorkers=2)
+        staged = []
+        uploadedBytes = engine.uploadFile(backend, self.writeFile(self.data), len(self.data), stagedBlockIds={ blockIdForIndex(1) }, onBlockStaged=staged.append)
+        self.assertEqual(uploadedBytes, len(self.data))
+        self.assertNotIn(blockIdForIndex(1), staged)
+        self.assertEqual(len(staged), 9)
+        self.assertEqual(backend.committedData(), self.data)
+
+    def test_growsBlocksToFitMaxBlocks(self):
+        engine = BlockTransferEngine(blockSizeBytes=4)
+        self.assertEqual(engine.blockSizeForBlob(4 * MAX_BLOCKS_PER_BLOB), 4)
+        self.assertEqual(engine.blockSizeForBlob(4 * MAX_BLOCKS_PER_BLOB + 1), 5)
+        with mock.patch.object(BlockTransferEngineModule, "MAX_BLOCKS_PER_BLOB", 4):
+            backend = MemoryBackend()
+            engine.uploadFile(backend, self.writeFile(self.data), len(self.data))
+            self.assertEqual(len(backend.committedBlockIds), 4)
+            self.assertEqual(backend.committedData(), self.data)
+
+    def test_streamsRejectMoreThanMaxBlocks(self):
+        engine = BlockTransferEngine(blockSizeBytes=100, maxWorkers=2)
+        with mock.patch.object(BlockTransferEngineModule, "MAX_BLOCKS_PER_BLOB", 4):
+            backend = MemoryBackend()
+            with self.assertRaises(ValueError):
+                engine.uploadStream(backend, io.BytesIO(self.data))
+            self.assertIsNone(backend.committedBlockIds)
+
+    def test_downloadsRangesIntoPreallocatedFile(self):
+        backend = MemoryBackend(self.data, concurrentCalls=4)
+        filePath = os.path.join(self.directoryPath, "destination.bin")
+        fileSizes = []
+        backend.onGetRange = lambda offset: fileSizes.append(os.path.getsize(filePath))
+        engine = BlockTransferEngine(maxWorkers=4, rangeSizeBytes=64)
+        self.assertEqual(engine.downloadToFile(backend, filePath), len(self.data))
+        self.assertFalse(backend.barrier.broken)
+        self.assertEqual(sorted(backend.rangeOffsets), list(range(0, len(self.data), 64)))
+        self.assertEqual(set(fileSizes), { len(self.data) })
+        with open(filePath, "rb") as destinationFile:
+            self.assertEqual(destinationFile.read(), self.data)
+
+
+class ShortReadStream():
+
+    # Returns at most chunkSize bytes per read, then the scripted reads once the data is exhausted
+    def __init__(self, data, chunkSize, finalReads):
+        self.stream = io.BytesIO(data)
+        self.chunkSize = chunkSize
+        self.finalReads = list(finalReads)
+
+    def read(self, size):
+        chunk = self.stream.read(min(size, self.chunkSize))
+        if chunk or not self.finalReads:
+            return chunk
+        return self.finalReads.pop(0)
+
+
+class ReadStreamBlocksTests(unittest.TestCase):
+
+    def test_fillsBlocksFromShortReads(self):
+        blocks = list(readStreamBlocks(ShortReadStream(b"0123456789", 3, []), 4))
+        self.assertEqual(blocks, [b"0123", b"4567", b"89"])
+
+    def test_rejectsNonBlockingStream(self):
+        blocks = readStreamBlocks(ShortReadStream(b"0123456789", 3, [None, b""]), 4)
+        with self.assertRaises(ValueError):
+            list(blocks)
+
+    def test_readsIteratorOfChunks(self):
+        blocks = list(readStreamBlocks(iter([b"012", b"3456", b"789"]), 4))
+        self.assertEqual(blocks, [b"0123", b"4567", b"89"])
+
+
+if __name__ == "__main__":
+    unittest.main()
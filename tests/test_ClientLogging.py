@@ -0,0 +1,70 @@
+#   Tests of the client logging helpers
+#
+#   Run from the repository root with: python -m pytest tests
+#
+import logging
+import unittest
+
+from ironboxdx.ClientLogging import (
+    logger,
+    configureConsoleLogging,
+    DebugPayload,
+    CONSOLE_HANDLER_NAME,
+)
+from ironboxdx.IronBoxDXRESTClient import (
+    IronBoxDXRESTClient
+)
+
+
+class NotSerialized():
+
+    # Fails the test if the payload is serialized past the truncation point
+    def __str__(self):
+        raise AssertionError("payload serialized past maxBytes")
+
+
+class ClientLoggingTests(unittest.TestCase):
+
+    def setUp(self):
+        self.savedLevel = logger.level
+        self.savedHandlers = list(logger.handlers)
+
+    def tearDown(self):
+        logger.setLevel(self.savedLevel)
+        logger.handlers[:] = self.savedHandlers
+
+    def test_clientKeepsLoggingConfiguration(self):
+        logger.setLevel(logging.WARNING)
+        IronBoxDXRESTClient("key_public_id", "key_secret", showDebugInfo=True, verbose=True).close()
+        self.assertEqual(logger.level, logging.WARNING)
+        self.assertEqual(logger.handlers, self.savedHandlers)
+
+    def test_consoleLoggingKeepsApplicationLevel(self):
+        logger.setLevel(logging.WARNING)
+        IronBoxDXRESTClient("key_public_id", "key_secret", showDebugInfo=True, logToConsole=True).close()
+        self.assertEqual(logger.level, logging.WARNING)
+        self.assertEqual([handler.get_name() for handler in logger.handlers].count(CONSOLE_HANDLER_NAME), 1)
+
+    def test_consoleLoggingLowersItsOwnLevel(self):
+        logger.setLevel(logging.NOTSET)
+        configureConsoleLogging()
+        self.assertEqual(logger.level, logging.INFO)
+        configureConsoleLogging(showDebugInfo=True)
+        configureConsoleLogging()
+        self.assertEqual(logger.level, logging.DEBUG)
+        self.assertEqual([handler.get_name() for handler in logger.handlers].count(CONSOLE_HANDLER_NAME), 1)
+
+    def test_truncatesBytesPayload(self):
+        text = str(DebugPayload(b"x" * 100, maxBytes=10))
+        self.assertEqual(text, "xxxxxxxxxx... (90 more bytes)")
+
+    def test_stopsSerializingPastMaxBytes(self):
+        payload = { "blobs" : [{ "name" : "blob{}".format(index) } for index in range(100000)] + [NotSerialized()] }
+        text = str(DebugPayload(payload, maxBytes=100))
+        self.assertTrue(text.endswith("... (truncated)"))
+        self.assertEqual(len(text), 100 + len("... (truncated)"))
+        self.assertEqual(str(DebugPayload({ "name" : "blob" })), '{\n    "name": "blob"\n}')
+
+
+if __name__ == "__main__":
+    unittest.main()
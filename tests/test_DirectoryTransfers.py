@@ -0,0 +1,415 @@
+#   Tests of the directory upload and container download of the clients
+#
+#   Run from the repository root with: python -m pytest tests
+#
+import asyncio
+import itertools
+import json
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+
+import requests
+
+from unittest import (
+    mock
+)
+
+from ironboxdx.IronBoxDXRESTClient import (
+    IronBoxDXRESTClient,
+    DOWNLOAD_MANIFEST_FILE_NAME,
+    PARTIAL_DOWNLOAD_SUFFIX,
+)
+from ironboxdx.AsyncIronBoxDXRESTClient import (
+    AsyncIronBoxDXRESTClient
+)
+from ironboxdx.UploadJournal import (
+    UploadJournal,
+    UPLOAD_JOURNAL_SUFFIX,
+)
+
+
+# In-memory IronBox DX service, answers the control-plane routes used by the
+# directory transfers and backs each blob with a MemoryBlobBackend
+class FakeDXService():
+
+    def __init__(self):
+        self.blobs = {}                 # blobPublicID -> { "blobName", "data", "finalized" }
+        self.failingBlobNames = set()   # Data-plane calls for these blob names raise
+        self.downloadRequests = []
+        self.lock = threading.Lock()
+        self.publicIDs = itertools.count(1)
+        self.handlers = {
+            "dx/cloud/sse/blob/initialize/api" : self.initialize,
+            "dx/cloud/sse/blob/finalize/api" : self.finalize,
+            "dx/cloud/sse/blob/get/api" : self.listBlobs,
+            "dx/cloud/sse/blob/download/api" : self.download,
+            "dx/cloud/sse/blob/delete/api" : self.delete,
+        }
+
+    def addBlob(self, blobName, data):
+        blobPublicID = "blob-%i" % next(self.publicIDs)
+        self.blobs[blobPublicID] = { "blobName" : blobName, "data" : data, "finalized" : True }
+        return blobPublicID
+
+    def post(self, url, data = None, headers = None):
+        route = url.split("/api/v2/", 1)[1]
+        with self.lock:
+            body = self.handlers[route](json.loads(data))
+        response = requests.Response()
+        response.status_code = 200
+        response._content = json.dumps(body).encode("utf-8")
+        return response
+
+    def sasResponse(self, blobPublicID):
+        return {
+            "accessSignatureUri" : "https://account.blob.core.windows.net/container/" + blobPublicID,
+            "accessToken" : "token",
+            "cloudContainerStorageName" : "container",
+            "cloudBlobStorageName" : blobPublicID
+        }
+
+    def initialize(self, body):
+        blobPublicID = "blob-%i" % next(self.publicIDs)
+        self.blobs[blobPublicID] = { "blobName" : body["blobName"], "data" : None, "finalized" : False }
+        response = self.sasResponse(blobPublicID)
+        response.update({ "blobPublicID" : blobPublicID, "finalizeToken" : "finalize-" + blobPublicID })
+        return response
+
+    def finalize(self, body):
+        self.blobs[body["blobPublicID"]]["finalized"] = True
+        return None
+
+    def listBlobs(self, body):
+        blobs = [{ "blobPublicID" : blobPublicID, "blobName" : blob["blobName"] } for blobPublicID, blob in self.blobs.items() if blob["finalized"]]
+        return { "blobs" : blobs[body["skipPastNumItems"]:body["skipPastNumItems"] + body["takeNumItems"]] }
+
+    def download(self, body):
+        self.downloadRequests.append(body["blobPublicID"])
+        return self.sasResponse(body["blobPublicID"])
+
+    def delete(self, body):
+        del self.blobs[body["blobPublicID"]]
+        return None
+
+    def createBackend(self, sasResponse, retryPolicy, sessionPool, backendName):
+        return MemoryBlobBackend(self, sasResponse["cloudBlobStorageName"])
+
+
+# aiohttp style session answering from a FakeDXService
+class AsyncSession():
+
+    def __init__(self, service):
+        self.service = service
+        return
+
+    def post(self, url, data = None, headers = None):
+        return AsyncResponse(self.service.post(url, data, headers).content)
+
+
+class AsyncResponse():
+
+    def __init__(self, content):
+        self.status = 200
+        self.headers = {}
+        self.content = content
+        return
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        return False
+
+    async def read(self):
+        return self.content
+
+
+class MemoryBlobBackend():
+
+    # Backend of one blob of a FakeDXService, downloads of failing blobs raise
+    # after their first range is written
+    def __init__(self, service, blobPublicID):
+        self.service = service
+        self.blob = service.blobs[blobPublicID]
+        self.accountName = "account"
+        self.containerName = "container"
+        self.blobName = blobPublicID
+        self.stagedBlocks = {}
+        self.lock = threading.Lock()
+
+    def failing(self):
+        return self.blob["blobName"] in self.service.failingBlobNames
+
+    def putBlock(self, blockId, data):
+        if self.failing():
+            raise IOError("Unable to stage block")
+        with self.lock:
+            self.stagedBlocks[blockId] = bytes(data)
+
+    def putBlockList(self, blockIds):
+        self.blob["data"] = b"".join(self.stagedBlocks[blockId] for blockId in blockIds)
+
+    def getUncommittedBlocks(self):
+        return list(self.stagedBlocks)
+
+    def getBlobSize(self):
+        return len(self.blob["data"])
+
+    def getRange(self, offset, length):
+        if (offset > 0) and self.failing():
+            raise IOError("Unable to read range")
+        return self.blob["data"][offset:offset + length]
+
+
+class DirectoryTransferTests(unittest.TestCase):
+
+    def setUp(self):
+        self.directoryPath = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directoryPath)
+        self.service = FakeDXService()
+        patcher = mock.patch("ironboxdx.IronBoxDXRESTClient.createBlockBlobBackend", side_effect=self.service.createBackend)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.client = IronBoxDXRESTClient("key_public_id", "key_secret", verbose=False)
+        self.client._IronBoxDXRESTClient__session.post = self.service.post
+        self.addCleanup(self.client.close)
+
+    def writeFile(self, relativePath, data):
+        filePath = os.path.join(self.directoryPath, "source", relativePath)
+        os.makedirs(os.path.dirname(filePath), exist_ok=True)
+        with open(filePath, "wb") as sourceFile:
+            sourceFile.write(data)
+        return filePath
+
+    def readFile(self, filePath):
+        with open(filePath, "rb") as destinationFile:
+            return destinationFile.read()
+
+    def destinationFiles(self, destinationFolderPath):
+        return sorted(
+            os.path.relpath(os.path.join(directoryPath, fileName), destinationFolderPath).replace(os.sep, "/")
+            for directoryPath, directoryNames, fileNames in os.walk(destinationFolderPath)
+            for fileName in fileNames)
+
+    def download(self, destinationFolderPath, **kwargs):
+        return self.client.downloadSSEContainerToDirectory("container", destinationFolderPath, maxWorkers=2, rangeSizeBytes=4, **kwargs)
+
+    def test_uploadReportsEveryFileInScanOrder(self):
+        firstFilePath = self.writeFile("a.txt", b"first file")
+        failingFilePath = self.writeFile("bad.txt", b"failing file")
+        nestedFilePath = self.writeFile(os.path.join("sub", "b.txt"), b"nested file")
+        self.service.failingBlobNames.add("bad.txt")
+
+        report = self.client.uploadDirectoryToSSEContainer("container", os.path.join(self.directoryPath, "source"), maxWorkers=3)
+
+        self.assertEqual([result["sourceFilePath"] for result in report], [firstFilePath, failingFilePath, nestedFilePath])
+        self.assertEqual([result["blobName"] for result in report], ["a.txt", "bad.txt", "sub/b.txt"])
+        self.assertEqual([result["succeeded"] for result in report], [True, False, True])
+        self.assertEqual([result["sizeBytes"] for result in report], [10, 0, 11])
+        self.assertIsNone(report[0]["error"])
+        self.assertIsInstance(report[1]["error"], IOError)
+        for result in (report[0], report[2]):
+            blob = self.service.blobs[result["blobPublicID"]]
+            self.assertTrue(blob["finalized"])
+            self.assertEqual(blob["data"], self.readFile(result["sourceFilePath"]))
+        self.assertEqual([blob["blobName"] for blob in self.service.blobs.values() if blob["finalized"]], ["a.txt", "sub/b.txt"])
+
+    def test_uploadSkipsSubDirectoriesUnlessRecursive(self):
+        self.writeFile("a.txt", b"first file")
+        self.writeFile(os.path.join("sub", "b.txt"), b"nested file")
+
+        report = self.client.uploadDirectoryToSSEContainer("container", os.path.join(self.directoryPath, "source"), recursive=False)
+
+        self.assertEqual([result["blobName"] for result in report], ["a.txt"])
+
+    def test_downloadRemovesPartialFileOfFailedBlob(self):
+        self.service.addBlob("a.txt", b"first blob")
+        failingBlobPublicID = self.service.addBlob("bad.txt", b"failing blob")
+        self.service.failingBlobNames.add("bad.txt")
+        destinationFolderPath = os.path.join(self.directoryPath, "destination")
+
+        report = self.download(destinationFolderPath)
+
+        self.assertEqual([(result["blobName"], result["succeeded"], result["skipped"]) for result in report], [("a.txt", True, False), ("bad.txt", False, False)])
+        self.assertEqual(report[0]["sizeBytes"], 10)
+        self.assertEqual(self.readFile(report[0]["destinationFilePath"]), b"first blob")
+        self.assertEqual(report[1]["blobPublicID"], failingBlobPublicID)
+        self.assertIsInstance(report[1]["error"], IOError)
+        self.assertEqual(self.destinationFiles(destinationFolderPath), [DOWNLOAD_MANIFEST_FILE_NAME, "a.txt"])
+
+    def test_downloadReplacesPartialFileLeftByInterruptedRun(self):
+        self.service.addBlob("a.txt", b"first blob")
+        destinationFolderPath = os.path.join(self.directoryPath, "destination")
+        os.makedirs(destinationFolderPath)
+        with open(os.path.join(destinationFolderPath, "a.txt" + PARTIAL_DOWNLOAD_SUFFIX), "wb") as partialFile:
+            partialFile.write(b"stale contents from an earlier run")
+
+        report = self.download(destinationFolderPath)
+
+        self.assertEqual(report[0]["destinationFilePath"], os.path.join(destinationFolderPath, "a.txt"))
+        self.assertEqual(self.readFile(report[0]["destinationFilePath"]), b"first blob")
+        self.assertEqual(self.destinationFiles(destinationFolderPath), [DOWNLOAD_MANIFEST_FILE_NAME, "a.txt"])
+
+    def test_downloadNumbersCollidingNames(self):
+        self.service.addBlob("a.txt", b"first blob")
+        self.service.addBlob("a.txt", b"second blob")
+        self.service.addBlob("sub/b.txt", b"nested blob")
+        self.service.addBlob("sub\\b.txt", b"nested blob with a backslash")
+        destinationFolderPath = os.path.join(self.directoryPath, "destination")
+        os.makedirs(destinationFolderPath)
+        with open(os.path.join(destinationFolderPath, "a.txt"), "wb") as existingFile:
+            existingFile.write(b"existing file")
+
+        report = self.download(destinationFolderPath)
+
+        self.assertTrue(all(result["succeeded"] for result in report))
+        self.assertEqual(
+            [os.path.relpath(result["destinationFilePath"], destinationFolderPath).replace(os.sep, "/") for result in report],
+            ["(1)a.txt", "(2)a.txt", "sub/b.txt", "sub/(1)b.txt"])
+        self.assertEqual([self.readFile(result["destinationFilePath"]) for result in report], [b"first blob", b"second blob", b"nested blob", b"nested blob with a backslash"])
+        self.assertEqual(self.readFile(os.path.join(destinationFolderPath, "a.txt")), b"existing file")
+
+    def test_downloadResumesFromManifest(self):
+        firstBlobPublicID = self.service.addBlob("a.txt", b"first blob")
+        failingBlobPublicID = self.service.addBlob("b.txt", b"second blob")
+        self.service.failingBlobNames.add("b.txt")
+        destinationFolderPath = os.path.join(self.directoryPath, "destination")
+        firstReport = self.download(destinationFolderPath)
+        self.assertEqual([result["succeeded"] for result in firstReport], [True, False])
+
+        self.service.failingBlobNames.clear()
+        self.service.downloadRequests.clear()
+        report = self.download(destinationFolderPath)
+
+        self.assertEqual(self.service.downloadRequests, [failingBlobPublicID])
+        self.assertEqual([(result["blobPublicID"], result["succeeded"], result["skipped"]) for result in report], [(firstBlobPublicID, True, True), (failingBlobPublicID, True, False)])
+        self.assertEqual(report[0]["destinationFilePath"], firstReport[0]["destinationFilePath"])
+        self.assertEqual(report[0]["sizeBytes"], 10)
+        self.assertEqual(self.readFile(report[1]["destinationFilePath"]), b"second blob")
+        self.assertEqual(self.destinationFiles(destinationFolderPath), [DOWNLOAD_MANIFEST_FILE_NAME, "a.txt", "b.txt"])
+        with open(os.path.join(destinationFolderPath, DOWNLOAD_MANIFEST_FILE_NAME), "r", encoding="utf-8") as manifestFile:
+            self.assertEqual([json.loads(line)["blobPublicID"] for line in manifestFile], [firstBlobPublicID, failingBlobPublicID])
+
+    def test_downloadUsesGivenManifestAndIgnoresTornLines(self):
+        firstBlobPublicID = self.service.addBlob("a.txt", b"first blob")
+        self.service.addBlob("b.txt", b"second blob")
+        destinationFolderPath = os.path.join(self.directoryPath, "destination")
+        os.makedirs(destinationFolderPath)
+        with open(os.path.join(destinationFolderPath, "a.txt"), "wb") as existingFile:
+            existingFile.write(b"first blob")
+        manifestFilePath = os.path.join(self.directoryPath, "manifest.jsonl")
+        with open(manifestFilePath, "w", encoding="utf-8") as manifestFile:
+            manifestFile.write(json.dumps({ "blobPublicID" : firstBlobPublicID, "blobName" : "a.txt", "fileName" : "a.txt", "sizeBytes" : 10 }) + "\n")
+            manifestFile.write('{ "blobPublicID" : "blob-')
+
+        report = self.download(destinationFolderPath, manifestFilePath=manifestFilePath)
+
+        self.assertEqual([(result["succeeded"], result["skipped"]) for result in report], [(True, True), (True, False)])
+        self.assertEqual(self.destinationFiles(destinationFolderPath), ["a.txt", "b.txt"])
+
+        # The torn line is terminated before new entries are appended, so they are read back
+        report = self.download(destinationFolderPath, manifestFilePath=manifestFilePath)
+        self.assertEqual([result["skipped"] for result in report], [True, True])
+
+
+class AsyncDirectoryTransferTests(unittest.TestCase):
+
+    def setUp(self):
+        self.directoryPath = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directoryPath)
+        self.service = FakeDXService()
+        patcher = mock.patch("ironboxdx.AsyncIronBoxDXRESTClient.createBlockBlobBackend", side_effect=self.service.createBackend)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    # Runs a coroutine function with a client answered by the fake service
+    def runWithClient(self, func):
+        async def run():
+            async with AsyncIronBoxDXRESTClient("key_public_id", "key_secret", verbose=False) as client:
+                client._AsyncIronBoxDXRESTClient__getSession = lambda: AsyncSession(self.service)
+                return await func(client)
+
+        return asyncio.run(run())
+
+    def writeFile(self, relativePath, data):
+        filePath = os.path.join(self.directoryPath, "source", relativePath)
+        os.makedirs(os.path.dirname(filePath), exist_ok=True)
+        with open(filePath, "wb") as sourceFile:
+            sourceFile.write(data)
+        return filePath
+
+    def test_uploadReportsEveryFileInScanOrder(self):
+        self.writeFile("a.txt", b"first file")
+        self.writeFile("bad.txt", b"failing file")
+        self.writeFile(os.path.join("sub", "b.txt"), b"nested file")
+        self.service.failingBlobNames.add("bad.txt")
+
+        report = self.runWithClient(lambda client: client.uploadDirectoryToSSEContainer("container", os.path.join(self.directoryPath, "source"), maxWorkers=3))
+
+        self.assertEqual([(result["blobName"], result["succeeded"], result["sizeBytes"]) for result in report], [("a.txt", True, 10), ("bad.txt", False, 0), ("sub/b.txt", True, 11)])
+        self.assertIsInstance(report[1]["error"], IOError)
+        self.assertEqual(self.service.blobs[report[2]["blobPublicID"]]["data"], b"nested file")
+
+    def test_downloadRemovesPartialFileAndResumesFromManifest(self):
+        self.service.addBlob("a.txt", b"first blob")
+        failingBlobPublicID = self.service.addBlob("b.txt", b"second blob")
+        self.service.failingBlobNames.add("b.txt")
+        destinationFolderPath = os.path.join(self.directoryPath, "destination")
+
+        def download(client):
+            return client.downloadSSEContainerToDirectory("container", destinationFolderPath, maxWorkers=2, rangeSizeBytes=4)
+
+        firstReport = self.runWithClient(download)
+        self.assertEqual([(result["succeeded"], result["skipped"]) for result in firstReport], [(True, False), (False, False)])
+        self.assertEqual(sorted(os.listdir(destinationFolderPath)), [DOWNLOAD_MANIFEST_FILE_NAME, "a.txt"])
+
+        self.service.failingBlobNames.clear()
+        self.service.downloadRequests.clear()
+        report = self.runWithClient(download)
+
+        self.assertEqual(self.service.downloadRequests, [failingBlobPublicID])
+        self.assertEqual([(result["succeeded"], result["skipped"]) for result in report], [(True, True), (True, False)])
+        with open(report[1]["destinationFilePath"], "rb") as destinationFile:
+            self.assertEqual(destinationFile.read(), b"second blob")
+
+    def test_resumableUploadJournalRunsOffEventLoop(self):
+        sourceFilePath = self.writeFile("a.txt", b"resumable file")
+        journalThreads = []
+
+        def recordThread(name):
+            method = getattr(UploadJournal, name)
+
+            def recorded(journal, *args):
+                journalThreads.append((name, threading.current_thread()))
+                return method(journal, *args)
+
+            patcher = mock.patch.object(UploadJournal, name, recorded)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        for name in ("load", "start", "reopen", "delete", "close"):
+            recordThread(name)
+
+        async def upload(client):
+            loopThread = threading.current_thread()
+            with self.assertRaises(IOError):
+                await client.uploadBlobToSSEContainerFromPath("container", "a.txt", sourceFilePath, resumable=True)
+            self.assertTrue(os.path.exists(sourceFilePath + UPLOAD_JOURNAL_SUFFIX))
+            self.service.failingBlobNames.clear()
+            await client.uploadBlobToSSEContainerFromPath("container", "a.txt", sourceFilePath, resumable=True)
+            return loopThread
+
+        self.service.failingBlobNames.add("a.txt")
+        loopThread = self.runWithClient(upload)
+
+        self.assertEqual(set(name for name, thread in journalThreads), set(["load", "start", "reopen", "delete", "close"]))
+        self.assertNotIn(loopThread, [thread for name, thread in journalThreads])
+        self.assertFalse(os.path.exists(sourceFilePath + UPLOAD_JOURNAL_SUFFIX))
+        self.assertEqual([blob["data"] for blob in self.service.blobs.values() if blob["finalized"]], [b"resumable file"])
+
+
+if __name__ == "__main__":
+    unittest.main()
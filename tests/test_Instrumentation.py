@@ -0,0 +1,80 @@
+#   Tests of the instrumentation of data-plane operations
+#
+#   Run from the repository root with: python -m pytest tests
+#
+import unittest
+
+import requests
+
+from ironboxdx.BlockBlobBackends import (
+    HTTPBlockBlobBackend
+)
+from ironboxdx.Instrumentation import (
+    Instrumentation,
+    InstrumentationHook,
+    InstrumentedBlockBlobBackend,
+    PUT_BLOCK_ROUTE,
+)
+from ironboxdx.RetryPolicy import (
+    IronBoxDXRequestError,
+    RetryPolicy,
+)
+
+
+# Session answering every request with the next of the given status codes
+class ScriptedSession():
+
+    def __init__(self, statusCodes):
+        self.statusCodes = list(statusCodes)
+        return
+
+    def request(self, method, url, **kwargs):
+        response = requests.Response()
+        response.status_code = self.statusCodes.pop(0)
+        response._content = b""
+        return response
+
+
+class RecordingHook(InstrumentationHook):
+
+    def __init__(self):
+        self.events = []
+        return
+
+    def onRequestEnd(self, event):
+        self.events.append(event)
+
+
+class InstrumentedBlockBlobBackendTests(unittest.TestCase):
+
+    def createBackend(self, statusCodes, hook):
+        backend = HTTPBlockBlobBackend(
+            accountUrl="https://account.blob.core.windows.net",
+            sasToken="?sv=2018-11-09&sig=signature",
+            containerName="container",
+            blobName="blob",
+            retryPolicy=RetryPolicy(maxRetries=2, backoffBaseSeconds=0),
+            requestSession=ScriptedSession(statusCodes))
+        return InstrumentedBlockBlobBackend(backend, Instrumentation([hook]))
+
+    def test_reportsFinalStatusAndRetryCount(self):
+        hook = RecordingHook()
+        self.createBackend([503, 201], hook).putBlock("block", b"data")
+        event, = hook.events
+        self.assertEqual(event.route, PUT_BLOCK_ROUTE)
+        self.assertEqual(event.statusCode, 201)
+        self.assertEqual(event.retryCount, 1)
+        self.assertIsNone(event.error)
+
+    def test_reportsStatusAndRetryCountOfFailedRequests(self):
+        hook = RecordingHook()
+        with self.assertRaises(IronBoxDXRequestError):
+            self.createBackend([503, 503, 503], hook).putBlock("block", b"data")
+        event, = hook.events
+        self.assertEqual(event.statusCode, 503)
+        self.assertEqual(event.retryCount, 2)
+        self.assertIsNotNone(event.error)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+#   Tests of the control-plane requests shared by the clients
+#
+#   Run from the repository root with: python -m pytest tests
+#
+import unittest
+
+from ironboxdx.IronBoxDXRequests import (
+    ControlPlaneRouter,
+    parseResponseContent,
+    createSSEContainerRequest,
+    listSSEContainerBlobsRequest,
+    readContainerMetaDataRequest,
+    setContainerMetadataRequest,
+)
+from ironboxdx.ResponseCache import (
+    ResponseCache
+)
+from ironboxdx.RetryPolicy import (
+    RetryPolicy
+)
+
+
+class ControlPlaneRouterTests(unittest.TestCase):
+
+    def setUp(self):
+        self.router = ControlPlaneRouter(RetryPolicy(backoffBaseSeconds=0), ResponseCache())
+
+    def test_buildsRouteBodyAndErrorMessage(self):
+        request = listSSEContainerBlobsRequest("container", 500, 100)
+        self.assertEqual(request.route, "dx/cloud/sse/blob/get/api")
+        self.assertEqual(request.body, { "containerPublicID" : "container", "skipPastNumItems" : 500, "takeNumItems" : 100, "state" : 1 })
+        self.assertEqual(request.errorMessage, "Unable to list server-side encrypted blobs")
+
+    def test_classifiesReadOnlyRoutes(self):
+        self.assertTrue(self.router.isReadOnly(readContainerMetaDataRequest("a").route))
+        self.assertFalse(self.router.isReadOnly(setContainerMetadataRequest("a", 0, "value").route))
+
+    def test_coalescingKeyChangesAfterWrite(self):
+        request = readContainerMetaDataRequest("a")
+        key = self.router.getCoalescingKey(request)
+        self.assertEqual(self.router.getCoalescingKey(readContainerMetaDataRequest("a")), key)
+        self.router.recordWrite(setContainerMetadataRequest("b", 0, "value"))
+        self.assertNotEqual(self.router.getCoalescingKey(request), key)
+
+    def test_writeInvalidatesCachedResponses(self):
+        request = readContainerMetaDataRequest("a")
+        hit, response, generation = self.router.getCachedResponse(request)
+        self.assertFalse(hit)
+        self.router.putCachedResponse(request, { "name" : "original" }, generation)
+        self.assertEqual(self.router.getCachedResponse(request)[:2], (True, { "name" : "original" }))
+
+        self.router.recordWrite(setContainerMetadataRequest("a", 0, "renamed"))
+        self.assertFalse(self.router.getCachedResponse(request)[0])
+
+    def test_responseReadBeforeInvalidationIsNotCached(self):
+        request = readContainerMetaDataRequest("a")
+        hit, response, generation = self.router.getCachedResponse(request)
+        self.router.recordWrite(setContainerMetadataRequest("a", 0, "renamed"))
+        self.router.putCachedResponse(request, { "name" : "original" }, generation)
+        self.assertFalse(self.router.getCachedResponse(request)[0])
+
+    def test_routesWithoutCacheHaveNoGeneration(self):
+        self.assertEqual(self.router.getCachedResponse(listSSEContainerBlobsRequest("container")), (False, None, None))
+        self.assertEqual(ControlPlaneRouter(RetryPolicy()).getCachedResponse(readContainerMetaDataRequest("a")), (False, None, None))
+
+    def test_retriesFollowRouteIdempotency(self):
+        write = createSSEContainerRequest("name", "endpoint")
+        read = listSSEContainerBlobsRequest("container")
+        self.assertIsNone(self.router.getRetryDelay(write, 0))
+        self.assertIsNone(self.router.getRetryDelay(write, 0, 503))
+        self.assertIsNotNone(self.router.getRetryDelay(write, 0, 429))
+        self.assertIsNotNone(self.router.getRetryDelay(write, 0, notSent=True))
+        self.assertIsNotNone(self.router.getRetryDelay(read, 0))
+        self.assertIsNotNone(self.router.getRetryDelay(read, 0, 503))
+
+    def test_parsesResponseContent(self):
+        self.assertIsNone(parseResponseContent(b""))
+        self.assertIsNone(parseResponseContent(b" \r\n"))
+        self.assertEqual(parseResponseContent(b'{ "blobs" : [] }'), { "blobs" : [] })
+
+
+if __name__ == "__main__":
+    unittest.main()
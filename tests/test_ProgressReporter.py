@@ -0,0 +1,96 @@
+#   Tests of the transfer progress reporter
+#
+#   Run from the repository root with: python -m pytest tests
+#
+import threading
+import time
+import unittest
+
+from ironboxdx.IronBoxDXRESTClient import (
+    IronBoxDXRESTClient
+)
+from ironboxdx.ProgressReporter import (
+    ProgressReporter,
+    DISABLED_PROGRESS_REPORTER,
+    UPLOAD_DIRECTION,
+    DOWNLOAD_DIRECTION,
+)
+
+
+class ProgressReporterTests(unittest.TestCase):
+
+    def setUp(self):
+        self.events = []
+        # The reporting thread never fires during a test, events are sent by report()
+        self.reporter = ProgressReporter(self.events.append, intervalSeconds=3600)
+
+    def tearDown(self):
+        self.reporter.close()
+
+    def report(self):
+        time.sleep(0.01)
+        self.reporter._ProgressReporter__report(False)
+        return self.events[-1]
+
+    def test_etaCoversPlannedTransfers(self):
+        for totalBytes in (100, 200, 300):
+            self.reporter.planTransfer(totalBytes)
+        with self.reporter.transfer("first", UPLOAD_DIRECTION, 100, planned=True) as transfer:
+            transfer(50, 100)
+            event = self.report()
+        self.assertEqual(event.totalBytes, 600)
+        self.assertEqual(event.transferredBytes, 50)
+        self.assertEqual(event.pendingCount, 2)
+        self.assertGreater(event.bytesPerSecond, 0)
+        self.assertAlmostEqual(event.etaSeconds, 550 / event.bytesPerSecond)
+
+    def test_etaEstimatesUnknownSizes(self):
+        for index in range(3):
+            self.reporter.planTransfer()
+        with self.reporter.transfer("first", DOWNLOAD_DIRECTION, planned=True) as transfer:
+            event = self.report()
+            self.assertIsNone(event.etaSeconds)
+            transfer(10, 100)
+            event = self.report()
+        self.assertIsNone(event.totalBytes)
+        self.assertEqual(event.pendingCount, 2)
+        self.assertAlmostEqual(event.etaSeconds, (90 + 2 * 100) / event.bytesPerSecond)
+
+    def test_finalEventCountsEndedTransfers(self):
+        self.reporter.planTransfer(10)
+        self.reporter.planTransfer(10)
+        with self.reporter.transfer("first", UPLOAD_DIRECTION, 10, planned=True) as transfer:
+            transfer(10, 10)
+        with self.assertRaises(RuntimeError):
+            with self.reporter.transfer("second", UPLOAD_DIRECTION, 10, planned=True) as transfer:
+                transfer(4, 10)
+                raise RuntimeError("failed")
+        self.reporter.close()
+        event = self.events[-1]
+        self.assertTrue(event.final)
+        self.assertEqual((event.completedCount, event.failedCount, event.pendingCount), (1, 1, 0))
+        self.assertEqual((event.transferredBytes, event.totalBytes, event.etaSeconds), (14, 14, 0.0))
+
+
+class ClientProgressTests(unittest.TestCase):
+
+    def test_noReporterWithoutCallback(self):
+        threadCount = threading.active_count()
+        client = IronBoxDXRESTClient("key_public_id", "key_secret", verbose=True)
+        progress = client._IronBoxDXRESTClient__createProgressReporter()
+        self.assertIs(progress, DISABLED_PROGRESS_REPORTER)
+        with progress, progress.transfer("blob", UPLOAD_DIRECTION, 10) as transfer:
+            self.assertIsNone(transfer)
+        self.assertEqual(threading.active_count(), threadCount)
+        client.close()
+
+    def test_reporterPerJobWithCallback(self):
+        client = IronBoxDXRESTClient("key_public_id", "key_secret", progressCallback=lambda event: None)
+        progress = client._IronBoxDXRESTClient__createProgressReporter()
+        self.assertIsNot(progress, client._IronBoxDXRESTClient__createProgressReporter())
+        self.assertTrue(progress.enabled)
+        client.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,130 @@
+#   Tests of the control-plane response cache
+#
+#   Run from the repository root with: python -m pytest tests
+#
+import json
+import unittest
+
+from unittest import (
+    mock
+)
+
+import requests
+
+from ironboxdx.IronBoxDXRESTClient import (
+    IronBoxDXRESTClient
+)
+from ironboxdx.ResponseCache import (
+    ResponseCache
+)
+
+BASE_API_URL = "https://dx-api.ironbox.app/api/v2/"
+LIST_CONTAINERS_ROUTE = "dx/cloud/sse/containers/get/api"
+READ_METADATA_ROUTE = "dx/management/container/metadata/api"
+SET_METADATA_ROUTE = "dx/management/container/metadata/set/api"
+
+
+# Session answering every POST with the JSON returned by the handler of its
+# route, recording the routes called
+class ScriptedSession():
+
+    def __init__(self, handlers):
+        self.handlers = handlers
+        self.routes = []
+        return
+
+    def post(self, url, data = None, headers = None):
+        route = url[len(BASE_API_URL):]
+        self.routes.append(route)
+        response = requests.Response()
+        response.status_code = 200
+        response._content = json.dumps(self.handlers[route](json.loads(data))).encode("utf-8")
+        return response
+
+
+class ResponseCacheTests(unittest.TestCase):
+
+    def test_expiresAfterRouteTtl(self):
+        cache = ResponseCache(routeTtlSeconds={ READ_METADATA_ROUTE : 30 })
+        with mock.patch("ironboxdx.ResponseCache.time.monotonic", return_value=1000.0) as monotonic:
+            cache.put(READ_METADATA_ROUTE, { "containerPublicID" : "a" }, { "name" : "a" }, cache.getGeneration())
+            monotonic.return_value = 1029.0
+            self.assertEqual(cache.get(READ_METADATA_ROUTE, { "containerPublicID" : "a" }), (True, { "name" : "a" }))
+            monotonic.return_value = 1030.0
+            self.assertEqual(cache.get(READ_METADATA_ROUTE, { "containerPublicID" : "a" }), (False, None))
+
+    def test_evictsLeastRecentlyUsed(self):
+        cache = ResponseCache(maxEntries=2)
+        for containerPublicID in ("a", "b"):
+            cache.put(READ_METADATA_ROUTE, { "containerPublicID" : containerPublicID }, containerPublicID, cache.getGeneration())
+        cache.get(READ_METADATA_ROUTE, { "containerPublicID" : "a" })
+        cache.put(READ_METADATA_ROUTE, { "containerPublicID" : "c" }, "c", cache.getGeneration())
+        self.assertTrue(cache.get(READ_METADATA_ROUTE, { "containerPublicID" : "a" })[0])
+        self.assertFalse(cache.get(READ_METADATA_ROUTE, { "containerPublicID" : "b" })[0])
+        self.assertTrue(cache.get(READ_METADATA_ROUTE, { "containerPublicID" : "c" })[0])
+
+    def test_returnsCopies(self):
+        cache = ResponseCache()
+        cache.put(READ_METADATA_ROUTE, { "containerPublicID" : "a" }, { "tags" : ["x"] }, cache.getGeneration())
+        cache.get(READ_METADATA_ROUTE, { "containerPublicID" : "a" })[1]["tags"].append("y")
+        self.assertEqual(cache.get(READ_METADATA_ROUTE, { "containerPublicID" : "a" })[1], { "tags" : ["x"] })
+
+    def test_writeDropsDependentReads(self):
+        cache = ResponseCache()
+        for containerPublicID in ("a", "b"):
+            cache.put(READ_METADATA_ROUTE, { "containerPublicID" : containerPublicID }, containerPublicID, cache.getGeneration())
+        cache.put(LIST_CONTAINERS_ROUTE, { "includeContainersQueuedForDelete" : False }, [], cache.getGeneration())
+        cache.put("dx/storage/list/api", {}, [], cache.getGeneration())
+        cache.invalidate(SET_METADATA_ROUTE, { "containerPublicID" : "a", "metaDataTarget" : "name", "metaDataValue" : "renamed" })
+        self.assertFalse(cache.get(READ_METADATA_ROUTE, { "containerPublicID" : "a" })[0])
+        self.assertTrue(cache.get(READ_METADATA_ROUTE, { "containerPublicID" : "b" })[0])
+        self.assertFalse(cache.get(LIST_CONTAINERS_ROUTE, { "includeContainersQueuedForDelete" : False })[0])
+        self.assertTrue(cache.get("dx/storage/list/api", {})[0])
+
+    def test_generationGuardsAgainstStaleFill(self):
+        cache = ResponseCache()
+        generation = cache.getGeneration()
+        cache.invalidate(SET_METADATA_ROUTE, { "containerPublicID" : "a" })
+        cache.put(READ_METADATA_ROUTE, { "containerPublicID" : "a" }, "stale", generation)
+        self.assertFalse(cache.get(READ_METADATA_ROUTE, { "containerPublicID" : "a" })[0])
+
+
+class ClientResponseCacheTests(unittest.TestCase):
+
+    def setUp(self):
+        self.metadata = { "a" : "original" }
+        self.client = IronBoxDXRESTClient("key_public_id", "key_secret", verbose=False, responseCache=ResponseCache(), coalesceReads=False)
+        self.addCleanup(self.client.close)
+
+    def setSession(self, readMetadata):
+        def setMetadata(data):
+            self.metadata[data["containerPublicID"]] = data["metaDataValue"]
+            return None
+        self.session = ScriptedSession({ READ_METADATA_ROUTE : readMetadata, SET_METADATA_ROUTE : setMetadata })
+        self.client._IronBoxDXRESTClient__session.post = self.session.post
+
+    def test_writeInvalidatesCachedRead(self):
+        self.setSession(lambda data: { "name" : self.metadata[data["containerPublicID"]] })
+        self.assertEqual(self.client.management_readContainerMetaData("a"), { "name" : "original" })
+        self.assertEqual(self.client.management_readContainerMetaData("a"), { "name" : "original" })
+        self.assertEqual(self.session.routes.count(READ_METADATA_ROUTE), 1)
+        self.client.management_setContainerMetadata("a", "name", "renamed")
+        self.assertEqual(self.client.management_readContainerMetaData("a"), { "name" : "renamed" })
+        self.assertEqual(self.session.routes.count(READ_METADATA_ROUTE), 2)
+
+    def test_readInFlightDuringWriteIsNotCached(self):
+        # The write lands while the read is in flight, after the server answered it
+        def readMetadata(data):
+            response = { "name" : self.metadata[data["containerPublicID"]] }
+            if len(self.session.routes) == 1:
+                self.client.management_setContainerMetadata("a", "name", "renamed")
+            return response
+
+        self.setSession(readMetadata)
+        self.assertEqual(self.client.management_readContainerMetaData("a"), { "name" : "original" })
+        self.assertEqual(self.client.management_readContainerMetaData("a"), { "name" : "renamed" })
+        self.assertEqual(self.session.routes, [READ_METADATA_ROUTE, SET_METADATA_ROUTE, READ_METADATA_ROUTE])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+#   Tests of the seekable SSE blob reader
+#
+#   Run from the repository root with: python -m pytest tests
+#
+import io
+import threading
+import unittest
+
+from ironboxdx.SSEBlobReader import (
+    SSEBlobReader
+)
+
+BLOCK_SIZE = 10
+
+
+class MemoryBackend():
+
+    # Serves ranges of in-memory data, recording the offset of each range read
+    def __init__(self, data):
+        self.data = data
+        self.offsets = []
+        self.lock = threading.Lock()
+        self.fetched = threading.Condition(self.lock)
+
+    def getBlobSize(self):
+        return len(self.data)
+
+    def getRange(self, offset, length):
+        with self.lock:
+            self.offsets.append(offset)
+            self.fetched.notify_all()
+        return self.data[offset:offset + length]
+
+    # Waits until the range at each of the given offsets was read
+    def waitForOffsets(self, offsets):
+        with self.lock:
+            return self.fetched.wait_for(lambda: set(offsets) <= set(self.offsets), timeout=5)
+
+
+class SSEBlobReaderTests(unittest.TestCase):
+
+    def setUp(self):
+        self.data = bytes(range(256)) * 4
+        self.backend = MemoryBackend(self.data)
+
+    def createReader(self, cacheBlocks = 8, readAheadBlocks = 0):
+        reader = SSEBlobReader(self.backend, blockSizeBytes=BLOCK_SIZE, cacheBlocks=cacheBlocks, readAheadBlocks=readAheadBlocks)
+        self.addCleanup(reader.close)
+        return reader
+
+    def test_seekAndTell(self):
+        reader = self.createReader()
+        self.assertEqual(reader.seek(25), 25)
+        self.assertEqual(reader.seek(5, io.SEEK_CUR), 30)
+        self.assertEqual(reader.seek(-4, io.SEEK_END), len(self.data) - 4)
+        self.assertEqual(reader.tell(), len(self.data) - 4)
+        self.assertEqual(reader.read(), self.data[-4:])
+        self.assertEqual(reader.read(), b"")
+        with self.assertRaises(ValueError):
+            reader.seek(-1)
+        with self.assertRaises(ValueError):
+            reader.seek(0, 3)
+
+    def test_readsAcrossBlocks(self):
+        reader = self.createReader()
+        reader.seek(7)
+        self.assertEqual(reader.read(25), self.data[7:32])
+        self.assertEqual(reader.tell(), 32)
+        self.assertEqual(sorted(self.backend.offsets), [0, 10, 20, 30])
+
+    def test_readinto(self):
+        reader = self.createReader()
+        buffer = bytearray(15)
+        reader.seek(len(self.data) - 5)
+        self.assertEqual(reader.readinto(buffer), 5)
+        self.assertEqual(bytes(buffer[:5]), self.data[-5:])
+        self.assertEqual(reader.readinto(buffer), 0)
+
+    def test_readallFromPosition(self):
+        reader = self.createReader()
+        reader.seek(100)
+        self.assertEqual(reader.readall(), self.data[100:])
+
+    def test_bufferedReader(self):
+        reader = io.BufferedReader(self.createReader(), buffer_size=BLOCK_SIZE * 3)
+        self.assertEqual(reader.read(5), self.data[:5])
+        reader.seek(500)
+        self.assertEqual(reader.read(40), self.data[500:540])
+
+    def test_evictsLeastRecentlyUsedBlocks(self):
+        reader = self.createReader(cacheBlocks=2)
+        for offset in (0, 10, 0, 20, 0, 10):
+            reader.seek(offset)
+            reader.read(BLOCK_SIZE)
+        self.assertEqual(self.backend.offsets, [0, 10, 20, 10])
+
+    def test_readsAheadFromFirstRead(self):
+        reader = self.createReader(readAheadBlocks=2)
+        self.assertEqual(reader.read(5), self.data[:5])
+        self.assertTrue(self.backend.waitForOffsets([10, 20]))
+        self.assertEqual(reader.read(20), self.data[5:25])
+        self.assertTrue(self.backend.waitForOffsets([30, 40]))
+        self.assertEqual(sorted(self.backend.offsets), [0, 10, 20, 30, 40])
+
+    def test_noReadAheadForRandomReads(self):
+        reader = self.createReader(readAheadBlocks=2)
+        for offset in (500, 100, 300):
+            reader.seek(offset)
+            reader.read(BLOCK_SIZE)
+        self.assertEqual(self.backend.offsets, [500, 100, 300])
+
+    def test_closedReaderRaises(self):
+        reader = self.createReader()
+        reader.close()
+        with self.assertRaises(ValueError):
+            reader.read(1)
+        with self.assertRaises(ValueError):
+            reader.seek(0)
+
+
+if __name__ == "__main__":
+    unittest.main()
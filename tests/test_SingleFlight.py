@@ -0,0 +1,275 @@
+#   Tests of the coalescing of identical concurrent requests
+#
+#   Run from the repository root with: python -m pytest tests
+#
+import asyncio
+import json
+import threading
+import time
+import unittest
+
+import requests
+
+from ironboxdx.AsyncIronBoxDXRESTClient import (
+    AsyncIronBoxDXRESTClient
+)
+from ironboxdx.AsyncSingleFlight import (
+    AsyncSingleFlight
+)
+from ironboxdx.IronBoxDXRESTClient import (
+    IronBoxDXRESTClient
+)
+from ironboxdx.SingleFlight import (
+    SingleFlight
+)
+
+BASE_API_URL = "https://dx-api.ironbox.app/api/v2/"
+READ_METADATA_ROUTE = "dx/management/container/metadata/api"
+SET_METADATA_ROUTE = "dx/management/container/metadata/set/api"
+READER_COUNT = 8
+
+
+# Waits until the call in flight for key has the given number of waiters
+def waitForWaiters(singleFlight, key, waiters):
+    deadline = time.monotonic() + 5
+    while time.monotonic() < deadline:
+        call = singleFlight._SingleFlight__calls.get(key)
+        if (call is not None) and (call["waiters"] >= waiters):
+            return True
+        time.sleep(0.001)
+    return False
+
+
+# Metadata server shared by the threaded and asyncio client tests, the first
+# read blocks until released so the other requests arrive while it's in flight
+class MetadataServer():
+
+    def __init__(self):
+        self.metadata = { "a" : "original" }
+        self.routes = []
+        self.readStarted = threading.Event()
+        self.releaseRead = threading.Event()
+        self.lock = threading.Lock()
+        return
+
+    def handle(self, route, data):
+        with self.lock:
+            self.routes.append(route)
+            firstRead = (route == READ_METADATA_ROUTE) and (self.routes.count(READ_METADATA_ROUTE) == 1)
+            if route == SET_METADATA_ROUTE:
+                self.metadata[data["containerPublicID"]] = data["metaDataValue"]
+                return None
+            response = { "name" : self.metadata[data["containerPublicID"]] }
+        if firstRead:
+            self.readStarted.set()
+            self.releaseRead.wait(timeout=5)
+        return response
+
+    def post(self, url, data = None, headers = None):
+        response = requests.Response()
+        response.status_code = 200
+        response._content = json.dumps(self.handle(url[len(BASE_API_URL):], json.loads(data))).encode("utf-8")
+        return response
+
+
+class SingleFlightTests(unittest.TestCase):
+
+    def runReaders(self, singleFlight, key, func):
+        results = [None] * READER_COUNT
+        errors = [None] * READER_COUNT
+
+        def read(index):
+            try:
+                results[index] = singleFlight.do(key, func)
+            except Exception as e:
+                errors[index] = e
+
+        threads = [threading.Thread(target=read, args=(index,)) for index in range(READER_COUNT)]
+        for thread in threads:
+            thread.start()
+        return threads, results, errors
+
+    def test_coalescesConcurrentCalls(self):
+        singleFlight = SingleFlight()
+        release = threading.Event()
+        calls = []
+
+        def func():
+            calls.append(1)
+            release.wait(timeout=5)
+            return { "blobs" : [1, 2] }
+
+        threads, results, errors = self.runReaders(singleFlight, "key", func)
+        self.assertTrue(waitForWaiters(singleFlight, "key", READER_COUNT - 1))
+        release.set()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, [{ "blobs" : [1, 2] }] * READER_COUNT)
+        self.assertEqual(len(set(id(result) for result in results)), READER_COUNT)
+        self.assertEqual(singleFlight._SingleFlight__calls, {})
+
+    def test_sharesException(self):
+        singleFlight = SingleFlight()
+        release = threading.Event()
+
+        def func():
+            release.wait(timeout=5)
+            raise RuntimeError("failed")
+
+        threads, results, errors = self.runReaders(singleFlight, "key", func)
+        self.assertTrue(waitForWaiters(singleFlight, "key", READER_COUNT - 1))
+        release.set()
+        for thread in threads:
+            thread.join()
+        self.assertTrue(all(isinstance(error, RuntimeError) for error in errors))
+
+    def test_sequentialCallsAreNotShared(self):
+        singleFlight = SingleFlight()
+        calls = []
+        for index in range(3):
+            singleFlight.do("key", lambda: calls.append(index))
+        self.assertEqual(calls, [0, 1, 2])
+
+
+class ClientSingleFlightTests(unittest.TestCase):
+
+    def setUp(self):
+        self.server = MetadataServer()
+        self.client = IronBoxDXRESTClient("key_public_id", "key_secret", verbose=False)
+        self.client._IronBoxDXRESTClient__session.post = self.server.post
+        self.addCleanup(self.client.close)
+
+    def startRead(self, results):
+        thread = threading.Thread(target=lambda: results.append(self.client.management_readContainerMetaData("a")))
+        thread.start()
+        return thread
+
+    def test_coalescesConcurrentReads(self):
+        results = []
+        threads = [self.startRead(results)]
+        self.assertTrue(self.server.readStarted.wait(timeout=5))
+        threads += [self.startRead(results) for index in range(READER_COUNT - 1)]
+        singleFlight = self.client._IronBoxDXRESTClient__readSingleFlight
+        requestKey = next(iter(singleFlight._SingleFlight__calls))
+        self.assertTrue(waitForWaiters(singleFlight, requestKey, READER_COUNT - 1))
+        self.server.releaseRead.set()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(self.server.routes, [READ_METADATA_ROUTE])
+        self.assertEqual(results, [{ "name" : "original" }] * READER_COUNT)
+
+    def test_readAfterWriteIsNotShared(self):
+        results = []
+        firstRead = self.startRead(results)
+        self.assertTrue(self.server.readStarted.wait(timeout=5))
+        self.client.management_setContainerMetadata("a", "name", "renamed")
+        self.assertEqual(self.client.management_readContainerMetaData("a"), { "name" : "renamed" })
+        self.server.releaseRead.set()
+        firstRead.join()
+        self.assertEqual(self.server.routes, [READ_METADATA_ROUTE, SET_METADATA_ROUTE, READ_METADATA_ROUTE])
+
+
+# aiohttp style response of the scripted asyncio session
+class AsyncResponse():
+
+    def __init__(self, content):
+        self.status = 200
+        self.headers = {}
+        self.content = content
+        return
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        return False
+
+    async def read(self):
+        return self.content
+
+
+# aiohttp style session running the metadata server off the event loop
+class AsyncSession():
+
+    def __init__(self, server):
+        self.server = server
+        return
+
+    def post(self, url, data = None, headers = None):
+        session = self
+
+        class PendingResponse():
+            async def __aenter__(self):
+                response = await asyncio.get_running_loop().run_in_executor(None, session.server.post, url, data)
+                return AsyncResponse(response.content)
+
+            async def __aexit__(self, exc_type, exc_value, traceback):
+                return False
+
+        return PendingResponse()
+
+
+class AsyncSingleFlightTests(unittest.TestCase):
+
+    def test_coalescesConcurrentCalls(self):
+        async def run():
+            singleFlight = AsyncSingleFlight()
+            release = asyncio.Event()
+            calls = []
+
+            async def func():
+                calls.append(1)
+                await release.wait()
+                return { "blobs" : [1, 2] }
+
+            tasks = [asyncio.ensure_future(singleFlight.do("key", func)) for index in range(READER_COUNT)]
+            await asyncio.sleep(0)
+            release.set()
+            results = await asyncio.gather(*tasks)
+            self.assertEqual(len(calls), 1)
+            self.assertEqual(results, [{ "blobs" : [1, 2] }] * READER_COUNT)
+            self.assertEqual(len(set(id(result) for result in results)), READER_COUNT)
+
+        asyncio.run(run())
+
+    def test_waitersSurviveCancelledLeader(self):
+        async def run():
+            singleFlight = AsyncSingleFlight()
+            release = asyncio.Event()
+
+            async def func():
+                await release.wait()
+                return "result"
+
+            leader = asyncio.ensure_future(singleFlight.do("key", func))
+            await asyncio.sleep(0)
+            waiter = asyncio.ensure_future(singleFlight.do("key", func))
+            await asyncio.sleep(0)
+            leader.cancel()
+            release.set()
+            self.assertEqual(await waiter, "result")
+
+        asyncio.run(run())
+
+    def test_clientCoalescesReadsUntilWrite(self):
+        server = MetadataServer()
+
+        async def run():
+            async with AsyncIronBoxDXRESTClient("key_public_id", "key_secret", verbose=False) as client:
+                client._AsyncIronBoxDXRESTClient__getSession = lambda: AsyncSession(server)
+                reads = [asyncio.ensure_future(client.management_readContainerMetaData("a")) for index in range(READER_COUNT)]
+                await asyncio.get_running_loop().run_in_executor(None, server.readStarted.wait, 5)
+                await client.management_setContainerMetadata("a", "name", "renamed")
+                renamed = asyncio.ensure_future(client.management_readContainerMetaData("a"))
+                await asyncio.sleep(0.05)
+                server.releaseRead.set()
+                self.assertEqual(await asyncio.gather(*reads), [{ "name" : "original" }] * READER_COUNT)
+                self.assertEqual(await renamed, { "name" : "renamed" })
+
+        asyncio.run(run())
+        self.assertEqual(server.routes, [READ_METADATA_ROUTE, SET_METADATA_ROUTE, READ_METADATA_ROUTE])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+#   Tests of the resumable upload journal
+#
+#   Run from the repository root with: python -m pytest tests
+#
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+import requests
+
+from ironboxdx.IronBoxDXRESTClient import (
+    IronBoxDXRESTClient
+)
+from ironboxdx.RetryPolicy import (
+    IronBoxDXRequestError
+)
+from ironboxdx.UploadJournal import (
+    UploadJournal,
+    UPLOAD_JOURNAL_SUFFIX,
+)
+
+INIT_RESPONSE = {
+    "blobPublicID" : "stale_blob_public_id",
+    "finalizeToken" : "finalize_token",
+    "accessSignatureUri" : "https://account.blob.core.windows.net/container?sig=signature",
+    "accessToken" : "?sig=signature",
+    "cloudContainerStorageName" : "container",
+    "cloudBlobStorageName" : "blob"
+}
+
+
+class UploadJournalTests(unittest.TestCase):
+
+    def setUp(self):
+        self.directoryPath = tempfile.mkdtemp()
+        self.sourceFilePath = os.path.join(self.directoryPath, "source.bin")
+        self.journalFilePath = self.sourceFilePath + UPLOAD_JOURNAL_SUFFIX
+        with open(self.sourceFilePath, "wb") as sourceFile:
+            sourceFile.write(b"original")
+
+        journal = UploadJournal(self.journalFilePath, "container_public_id", "blob.bin", self.sourceFilePath, 4)
+        journal.start(INIT_RESPONSE)
+        journal.recordBlockStaged("block-0")
+        journal.close()
+
+    def tearDown(self):
+        shutil.rmtree(self.directoryPath)
+
+    def changeSource(self):
+        with open(self.sourceFilePath, "wb") as sourceFile:
+            sourceFile.write(b"changed contents")
+
+    def test_loadsJournalOfSameSource(self):
+        journal = UploadJournal(self.journalFilePath, "container_public_id", "blob.bin", self.sourceFilePath, 4)
+        self.assertTrue(journal.load())
+        self.assertEqual(journal.initResponse, INIT_RESPONSE)
+        self.assertEqual(journal.stagedBlockIds, { "block-0" })
+
+    def test_keepsInitResponseOfChangedSource(self):
+        self.changeSource()
+        journal = UploadJournal(self.journalFilePath, "container_public_id", "blob.bin", self.sourceFilePath, 4)
+        self.assertFalse(journal.load())
+        self.assertEqual(journal.initResponse, INIT_RESPONSE)
+        self.assertEqual(journal.stagedBlockIds, set())
+
+    def test_clientDeletesBlobOfChangedSource(self):
+        self.changeSource()
+        routes = []
+
+        # Records the control-plane calls, the new blob fails to initialize so the upload stops there
+        def post(url, data = None, headers = None):
+            route = url[len("https://dx-api.ironbox.app/api/v2/"):]
+            routes.append((route, json.loads(data)))
+            response = requests.Response()
+            response.status_code = 400 if route == "dx/cloud/sse/blob/initialize/api" else 200
+            response._content = b""
+            return response
+
+        client = IronBoxDXRESTClient("key_public_id", "key_secret", verbose=False)
+        client._IronBoxDXRESTClient__session.post = post
+        with self.assertRaises(IronBoxDXRequestError):
+            client.uploadBlobToSSEContainerFromPath("container_public_id", "blob.bin", self.sourceFilePath, blockSizeBytes=4, resumable=True)
+        client.close()
+        self.assertEqual(routes[0], ("dx/cloud/sse/blob/delete/api", { "blobPublicID" : "stale_blob_public_id" }))
+        self.assertEqual(routes[1][0], "dx/cloud/sse/blob/initialize/api")
+
+
+if __name__ == "__main__":
+    unittest.main()